@@ -0,0 +1,134 @@
+"""
+Arranque de la aplicación: tiempo hasta la primera ventana e importación
+por módulo.
+
+Cada medición corre en un proceso nuevo (arranque en frío del intérprete,
+sin módulos ya importados):
+
+    primera ventana   desde el inicio del proceso hasta el primer ciclo del
+                      event loop con VentanaPrincipal visible
+    importaciones     python -X importtime sobre el módulo; se listan los
+                      módulos con mayor tiempo acumulado y el total
+
+En la versión congelada (MiApp.iss) el arranque además incluye descomprimir
+el ejecutable ONEFILE; la distribución ONEDIR evita ese paso.
+
+Uso:
+    python benchmarks/bench_arranque.py [--repeticiones 5] [--top 25]
+    python benchmarks/bench_arranque.py --modulo momento_curvatura_parche_sap --sin-ventana
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_arranque.py   (sin pantalla)
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Se ejecuta en el proceso hijo: reporta el tiempo desde el inicio del
+# intérprete hasta que el event loop procesa el primer evento.
+_PRIMERA_VENTANA = """
+import sys, time
+t_import = time.perf_counter()
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+import main_app
+t_modulo = time.perf_counter()
+app = QApplication(sys.argv)
+ventana = main_app.VentanaPrincipal()
+ventana.show()
+def listo():
+    print(f"ARRANQUE {t_modulo - t_import:.6f} {time.perf_counter() - t_import:.6f}")
+    app.quit()
+QTimer.singleShot(0, listo)
+app.exec()
+"""
+
+
+def _entorno():
+    entorno = dict(os.environ)
+    entorno["PYTHONPATH"] = RAIZ + os.pathsep + entorno.get("PYTHONPATH", "")
+    entorno["PYTHONDONTWRITEBYTECODE"] = "1"
+    return entorno
+
+
+def medir_primera_ventana(repeticiones):
+    """
+    Retorna una lista de (importar main_app, primera ventana, proceso total)
+    en segundos, o lanza RuntimeError con la salida del hijo si falla.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-c", _PRIMERA_VENTANA], cwd=RAIZ, env=_entorno(),
+                              capture_output=True, text=True)
+        total = time.perf_counter() - t0
+        lineas = [l for l in proc.stdout.splitlines() if l.startswith("ARRANQUE ")]
+        if proc.returncode != 0 or not lineas:
+            raise RuntimeError(proc.stderr.strip() or proc.stdout.strip())
+        t_modulo, t_ventana = (float(v) for v in lineas[-1].split()[1:])
+        tiempos.append((t_modulo, t_ventana, total))
+    return tiempos
+
+
+def medir_importaciones(modulo):
+    """
+    Retorna {modulo: (propio_s, acumulado_s)} de python -X importtime.
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"], cwd=RAIZ,
+                          env=_entorno(), capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    tiempos = {}
+    for linea in proc.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        propio, acumulado, nombre = linea[len("import time:"):].split("|")
+        tiempos[nombre.strip()] = (int(propio) / 1e6, int(acumulado) / 1e6)
+    return tiempos
+
+
+def _es_del_repositorio(nombre):
+    return os.path.exists(os.path.join(RAIZ, nombre.split(".")[0] + ".py"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modulo", default="main_app", help="módulo cuyas importaciones se miden")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25, help="módulos más lentos a listar")
+    parser.add_argument("--sin-ventana", action="store_true", help="solo medir importaciones")
+    args = parser.parse_args()
+
+    if not args.sin_ventana:
+        try:
+            tiempos = medir_primera_ventana(args.repeticiones)
+        except RuntimeError as e:
+            print(f"No se pudo abrir la ventana principal:\n{e}\n")
+        else:
+            for nombre, i in (("importar main_app", 0), ("primera ventana", 1), ("proceso total", 2)):
+                valores = sorted(t[i] for t in tiempos)
+                print(f"{nombre:20s} mejor {valores[0] * 1e3:8.1f} ms   mediana {valores[len(valores) // 2] * 1e3:8.1f} ms")
+            print()
+
+    try:
+        importaciones = medir_importaciones(args.modulo)
+    except RuntimeError as e:
+        print(f"No se pudo importar {args.modulo}: {e}")
+        return 1
+
+    total = importaciones.get(args.modulo, (0.0, 0.0))[1]
+    print(f"Importar {args.modulo}: {total * 1e3:.1f} ms ({len(importaciones)} módulos)")
+    print(f"\n{'acumulado [ms]':>15s} {'propio [ms]':>12s}  módulo")
+    lentos = sorted(importaciones.items(), key=lambda kv: kv[1][1], reverse=True)[:args.top]
+    for nombre, (propio, acumulado) in lentos:
+        marca = " *" if _es_del_repositorio(nombre) else ""
+        print(f"{acumulado * 1e3:15.1f} {propio * 1e3:12.1f}  {nombre}{marca}")
+    print("\n* módulo del repositorio")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
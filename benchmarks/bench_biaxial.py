@@ -0,0 +1,74 @@
+"""
+Estudio biaxial de la columna canónica (capacidad_biaxial): tiempo del
+barrido de ángulos resuelto a la vez frente a un diagrama por ángulo
+(diagrama_MC_biaxial llamado ángulo por ángulo), según el número de
+ángulos y la densidad de fibras.
+
+También compara los ángulos 0° y 90° con diagrama_MC_deformacion sobre la
+malla por capas de eje "x" y eje "y" (mismo resultado hasta la tolerancia
+de equilibrio).
+
+Uso:
+    python benchmarks/bench_biaxial.py [--angulos 8 36 72] [--divisiones 10 20 40]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import casos
+import momento_curvatura_parche_sap as mc
+from momento_curvatura_biaxial import capacidad_biaxial, construir_seccion_biaxial, diagrama_MC_biaxial
+
+TOL = 1e-5
+
+
+def _uniaxial(cover, core, n):
+    print(f"{'eje':>4s} {'theta':>6s} {'error phi':>10s} {'error M':>10s}")
+    seccion = construir_seccion_biaxial(casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(n), cover, core)
+    for eje, angulo, componente in (("x", 0.0, "Mx"), ("y", 90.0, "My")):
+        capas = mc.construir_seccion(casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(n), "columna", eje,
+                                     cover, core)
+        M, phi, _, _ = mc.diagrama_MC_deformacion(capas, TOL)
+        curva = diagrama_MC_biaxial(seccion, [angulo], TOL)
+        validos = ~np.isnan(curva["phi"][0])
+        phi_2d, M_2d = curva["phi"][0][validos], curva[componente][0][validos]
+        k = min(len(phi), len(phi_2d))
+        print(f"{eje:>4s} {angulo:6g} {np.abs(phi_2d[:k] - phi[:k]).max() / phi.max():10.1e} "
+              f"{np.abs(M_2d[:k] - M[:k]).max() / M.max():10.1e}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--angulos", type=int, nargs="+", default=(8, 36, 72))
+    parser.add_argument("--divisiones", type=int, nargs="+", default=(10, 20, 40))
+    parser.add_argument("--modelos", nargs=2, default=("mander_u", "mander_c"), metavar=("COVER", "CORE"))
+    parser.add_argument("--sin-secuencial", action="store_true", help="no medir el cálculo ángulo por ángulo")
+    args = parser.parse_args()
+    cover, core = args.modelos
+
+    _uniaxial(cover, core, min(args.divisiones))
+
+    print(f"{'div':>5s} {'fibras':>7s} {'angulos':>8s} {'vectorizado [s]':>16s} {'por angulo [s]':>15s} "
+          f"{'Mmax [t·m]':>11s} {'Mmin [t·m]':>11s}")
+    for n in args.divisiones:
+        seccion = construir_seccion_biaxial(casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(n), cover, core)
+        for n_angulos in args.angulos:
+            t0 = time.perf_counter()
+            estudio = capacidad_biaxial(seccion, n_angulos, TOL)
+            t_vec = time.perf_counter() - t0
+
+            t_sec = np.nan
+            if not args.sin_secuencial:
+                t0 = time.perf_counter()
+                for angulo in estudio["angulos"]:
+                    diagrama_MC_biaxial(seccion, [angulo], TOL)
+                t_sec = time.perf_counter() - t0
+
+            print(f"{n:5d} {len(seccion.A):7d} {n_angulos:8d} {t_vec:16.2f} {t_sec:15.2f} "
+                  f"{np.nanmax(estudio['Mmax']) / 1e5:11.1f} {np.nanmin(estudio['Mmax']) / 1e5:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
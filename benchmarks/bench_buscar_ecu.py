@@ -0,0 +1,72 @@
+"""
+Deformación última del hormigón confinado (modelos.buscar_ecu) de la
+columna canónica: tiempo de la búsqueda con las energías en forma cerrada
+(sin memoria y memorizada) y error de ecu frente a la raíz del mismo
+balance integrado con scipy.integrate.quad.
+
+Uso:
+    python benchmarks/bench_buscar_ecu.py [--repeticiones 200]
+"""
+import argparse
+import time
+
+from scipy.integrate import quad
+from scipy.optimize import brentq
+
+import casos
+import materiales
+import momento_curvatura_parche_sap as mc
+from materiales import ManderConfinado, modelos
+
+
+def _argumentos():
+    H, A = casos.HORMIGON, casos.ACERO
+    hormigon = [mc._f(H, k) for k in ("esfuerzo_fc", "def_max_sin_confinar", "def_ultima_sin_confinar", "modulo_Ec")]
+    acero = [mc._f(A, k) for k in ("esfuerzo_fy", "esfuerzo_ultimo_acero", "modulo_Es", "def_fluencia_acero",
+                                   "def_inicio_endurecimiento", "def_ultima_acero")]
+    mander = mc._mander_confinado(H, A, casos.COLUMNA)
+    return hormigon, acero, ManderConfinado(*hormigon, mander.datos_h[:11] + (None, None))
+
+
+def _ecu_referencia(hormigon, acero, mander):
+    # El mismo balance de energía con cuadratura adaptativa
+    fc0, ec0, esp, Ec = hormigon
+    fy, fsu, Es, ey, esh, esu = acero
+    quiebres = [ey, esh]
+    A_uc = quad(lambda e: -float(modelos.mander_u(-e, fc0, ec0, esp, Ec)), 0, max(esp, 2 * ec0), limit=200)[0]
+    A_sh = quad(lambda e: float(modelos.park(e, *acero)), 0, esu, points=quiebres, limit=200)[0]
+
+    def f(ecu):
+        A_cc = quad(lambda e: float(mander.curva(e)), 0, ecu, limit=200)[0]
+        A_sc = quad(lambda e: float(modelos.park(e, fy, fsu, Es, ey, esh, ecu)), 0, ecu, points=quiebres,
+                    limit=200)[0]
+        return A_cc + mander.pcc * A_sc - A_uc - mander.psh * A_sh
+
+    return brentq(f, 2e-3, 5e-2, xtol=1e-15)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=200)
+    args = parser.parse_args()
+
+    hormigon, acero, mander = _argumentos()
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeticiones):
+        materiales._ecu_por_equilibrio.cache_clear()
+        ecu = modelos.buscar_ecu(*hormigon, *acero, mander)
+    t_frio = (time.perf_counter() - t0) / args.repeticiones
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeticiones):
+        modelos.buscar_ecu(*hormigon, *acero, mander)
+    t_memoria = (time.perf_counter() - t0) / args.repeticiones
+
+    referencia = _ecu_referencia(hormigon, acero, mander)
+    print(f"ecu = {ecu:.10f}  (quad: {referencia:.10f}, error relativo {abs(ecu / referencia - 1):.1e})")
+    print(f"sin memoria: {t_frio * 1e3:.3f} ms   memorizado: {t_memoria * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
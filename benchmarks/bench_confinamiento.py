@@ -0,0 +1,62 @@
+"""
+Resistencia confinada fcc: solver exacto de la superficie de falla
+(modelos.fccfco, un brentq por llamada) frente al gráfico precalculado
+(modelos.fccfco_tabla / TablaConfinamiento), llamada a llamada y
+vectorizado para muchas variantes de sección. Informa el error relativo
+máximo del gráfico en presiones aleatorias y el de su construcción. Con
+muchas variantes, los tiempos llamada a llamada se extrapolan de las
+primeras 2000.
+
+Uso:
+    python benchmarks/bench_confinamiento.py [--variantes 10 1000 100000]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import casos  # noqa: F401  (agrega la raíz del proyecto a sys.path)
+from materiales import TablaConfinamiento, modelos
+
+FC0 = 210.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--variantes", type=int, nargs="+", default=(10, 1000, 100000))
+    parser.add_argument("--muestras", type=int, default=2000)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    tabla = TablaConfinamiento.cargar()
+    print(f"carga del gráfico: {(time.perf_counter() - t0) * 1e3:.1f} ms, "
+          f"error de construcción {tabla.error_max:.1e}, "
+          f"error en {args.muestras} muestras {tabla.verificar(args.muestras):.1e}\n")
+
+    rng = np.random.default_rng(1)
+    print(f"{'variantes':>10s} {'exacto [ms]':>12s} {'tabla escalar [ms]':>19s} {'tabla vector [ms]':>18s} "
+          f"{'x vector':>9s} {'error':>9s}")
+    for n in args.variantes:
+        flx, fly = rng.uniform(0.0, 0.3 * FC0, (2, n))
+        n_exacto = min(n, 2000)
+
+        t0 = time.perf_counter()
+        exactas = np.array([modelos.fccfco(a, b, FC0) for a, b in zip(flx[:n_exacto], fly[:n_exacto])])
+        t_exacto = (time.perf_counter() - t0) * n / n_exacto
+
+        t0 = time.perf_counter()
+        for a, b in zip(flx[:n_exacto], fly[:n_exacto]):
+            modelos.fccfco_tabla(a, b, FC0)
+        t_escalar = (time.perf_counter() - t0) * n / n_exacto
+
+        t0 = time.perf_counter()
+        fcc = modelos.fccfco_tabla(flx, fly, FC0)
+        t_vector = time.perf_counter() - t0
+
+        error = np.abs(fcc[:n_exacto] / exactas - 1).max()
+        print(f"{n:10d} {t_exacto * 1e3:12.2f} {t_escalar * 1e3:19.2f} {t_vector * 1e3:18.3f} "
+              f"{t_exacto / t_vector:9.0f} {error:9.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Curva M-φ en vivo (iterar_MC_seccion): para cada serie de la columna
+canónica, tiempo hasta el primer punto convergido, hasta el punto de
+fluencia y el momento máximo (según los parámetros de la curva completa)
+y hasta el final de la curva; es lo que tarda la ventana M-φ en mostrar
+cada tramo. Verifica además que la curva iterada coincide con
+diagrama_MC_seccion y que detenerla desde el consumidor la corta en el
+punto pedido.
+
+Uso:
+    python benchmarks/bench_curva_en_vivo.py [--divisiones 20] [--metodo brentq]
+"""
+import argparse
+import time
+from contextlib import closing
+
+import numpy as np
+
+import casos
+import momento_curvatura_parche_sap as mc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--divisiones", type=int, default=20)
+    parser.add_argument("--metodo", default="brentq", choices=("brentq", "newton"))
+    args = parser.parse_args()
+
+    print(f"{'serie':16s} {'puntos':>6s} {'1er punto [ms]':>15s} {'fluencia [ms]':>14s} {'Mmax [ms]':>10s} "
+          f"{'final [ms]':>11s} {'igual':>6s} {'detenido':>9s}")
+    for clave, cover, core in mc.SERIES_MC["columna"]:
+        seccion = mc.construir_seccion(casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(args.divisiones),
+                                       "columna", "x", cover, core)
+        tiempos, phi, M = [], [], []
+        t0 = time.perf_counter()
+        for p, m, _ in mc.iterar_MC_seccion(seccion, 1e-5, metodo=args.metodo):
+            tiempos.append(time.perf_counter() - t0)
+            phi.append(p)
+            M.append(m)
+        tiempos, phi, M = np.array(tiempos), np.array(phi), np.array(M)
+
+        parametros = mc.extraer_parametros_caracteristicos_mc(phi * 100.0, M / 1e5)
+        t_fluencia = tiempos[np.searchsorted(phi * 100.0, parametros["punto_fluencia"]["phi"])]
+        t_max = tiempos[int(np.argmax(M))]
+
+        M_ref, phi_ref, _ = mc.diagrama_MC_seccion(seccion, 1e-5, metodo=args.metodo)
+        igual = len(phi_ref) == len(phi) and np.array_equal(M_ref, M)
+
+        # Detener desde el consumidor a mitad de la curva
+        diagnostico = {}
+        corte = len(phi) // 2
+        with closing(mc.iterar_MC_seccion(seccion, 1e-5, metodo=args.metodo, diagnostico=diagnostico)) as puntos:
+            for i, _ in enumerate(puntos):
+                if i == corte:
+                    break
+        detenido = diagnostico["motivo_fin"] == "detenido"
+
+        print(f"{clave:16s} {len(phi):6d} {tiempos[1] * 1e3:15.2f} {t_fluencia * 1e3:14.1f} {t_max * 1e3:10.1f} "
+              f"{tiempos[-1] * 1e3:11.1f} {str(igual):>6s} {str(detenido):>9s}")
+
+
+if __name__ == "__main__":
+    main()
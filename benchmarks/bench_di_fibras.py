@@ -0,0 +1,99 @@
+"""
+Diagrama de interacción por fibras (di_fibras): todos los planos de
+deformación límite evaluados como una sola matriz (planos x fibras) frente
+a evaluar plano por plano con FiberSection.NM (el camino del solver M-φ),
+según el número de divisiones de la malla. Se muestra también el tiempo
+del diagrama de Whitney y el momento máximo de ambos diagramas.
+
+Uso:
+    python benchmarks/bench_di_fibras.py [--eje x] [--divisiones 10 50 200 1000]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import casos
+import diagrama_interaccion as di
+import momento_curvatura_parche_sap as mc
+
+MODELOS = (("hognestad", "hognestad"), ("mander_u", "mander_u"), ("mander_u", "mander_c"))
+
+
+def _mejor_tiempo(func, repeticiones):
+    mejor = np.inf
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        salida = func()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, salida
+
+
+def _plano_a_plano(seccion, As, e_lim, y_control, esu, d):
+    """
+    Mismos planos que di_fibras, evaluados uno a uno con seccion.NM.
+    Retorna P [t] y M [t·m] con la convención del diagrama de interacción
+    (NaN en la tracción uniforme, que no es un estado (c, phi)).
+    """
+    y_t = np.min(As[:, 0])
+    e_t, pendiente = di._planos_fibras(d, e_lim, y_control - y_t, esu, 100)
+    # Al pasar a (c, phi) la barra más traccionada puede quedar por redondeo
+    # apenas más allá de esu (acero roto); se la aleja del límite en 1e-12
+    e_t = e_t * (1 - 1e-12)
+    P, M = [], []
+    for e, s in zip(e_t.tolist(), pendiente.tolist()):
+        if s == 0.0:
+            P.append(np.nan)
+            M.append(np.nan)
+            continue
+        # eps = -phi * (y - c): phi = pendiente, c = coordenada del eje neutro
+        N, Mi = seccion.NM(y_t - e / s, s)
+        P.append(-(N + seccion.P))
+        M.append(-Mi)
+    return np.array(P) / 10**3, np.array(M) / 10**5
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--eje", default="x", choices=("x", "y"))
+    parser.add_argument("--divisiones", type=int, nargs="+", default=(10, 50, 200, 1000))
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    H, A, S = casos.HORMIGON, casos.ACERO, casos.COLUMNA
+    t_w, (m_w, _) = _mejor_tiempo(lambda: di.calcular_series_di(H, A, S, args.eje, usar_cache=False),
+                                  args.repeticiones)
+    print(f"Whitney: {t_w * 1e3:.2f} ms, Mmax = {m_w[:, 3].max():.1f} t·m\n")
+
+    print(f"{'modelo':10s} {'div':>5s} {'fibras':>7s} {'matriz [ms]':>12s} {'plano a plano [ms]':>19s} "
+          f"{'x':>6s} {'error':>9s} {'Mmax [t·m]':>11s}")
+    for cover, core in MODELOS:
+        esfuerzos, e_lim, confinado = di._esfuerzos_fibras(H, A, S, cover, core)
+        b, h = mc._f(S, "disenar_columna_base"), mc._f(S, "disenar_columna_altura")
+        r = mc._f(S, "disenar_columna_recubrimiento")
+        de = mc._f(S, "disenar_columna_diametro_transversal") / 10.0
+        _, d = di.prop_eje(b, h, args.eje)
+        y_control = d / 2 - (r + de / 2) if confinado else d / 2
+        esu = mc._f(A, "def_ultima_acero")
+
+        for n in args.divisiones:
+            seccion = mc.construir_seccion(H, A, S, casos.fibras(n), "columna", args.eje, cover, core)
+            As = np.column_stack((seccion.y_acero, seccion.A[seccion._acero]))
+            cover_f, core_f = mc.malla(b, h, r, de, n, n, args.eje)
+
+            t_mat, (P, M, _, _) = _mejor_tiempo(
+                lambda: di.di_fibras(cover_f, core_f, As, esfuerzos, d, e_lim, y_control, esu),
+                args.repeticiones)
+            t_pap, (P_ref, M_ref) = _mejor_tiempo(
+                lambda: _plano_a_plano(seccion, As, e_lim, y_control, esu, d), args.repeticiones)
+
+            k = len(P)
+            error = max(np.nanmax(np.abs(P - P_ref[:k])) / np.nanmax(np.abs(P_ref)),
+                        np.nanmax(np.abs(M - M_ref[:k])) / np.nanmax(np.abs(M_ref)))
+            print(f"{core:10s} {n:5d} {len(seccion.y):7d} {t_mat * 1e3:12.2f} {t_pap * 1e3:19.2f} "
+                  f"{t_pap / t_mat:6.1f} {error:9.1e} {M.max():11.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Diagrama de interacción de Whitney: reparto adaptativo de puntos (di, con
+resultantes_lote) frente al reparto uniforme de c con un punto por llamada
+a resultantes (el esquema anterior de di). Para cada variante se informa
+el número de puntos, el tiempo y el error de cuerda: la mayor distancia
+de la curva exacta (una malla muy densa de c) a la poligonal del
+diagrama, relativa al tamaño del diagrama, en M-P y en φM-φP.
+
+Uso:
+    python benchmarks/bench_di_whitney.py [--eje x y] [--tolerancias 3e-3 1e-3 5e-4 2e-4]
+"""
+import argparse
+import time
+
+import numpy as np
+from scipy.optimize import root_scalar
+
+import casos
+import diagrama_interaccion as di
+
+PUNTOS_UNIFORMES = (25, 50, 100, 200)
+PUNTOS_REFERENCIA = 20001
+
+
+def _mejor_tiempo(func, repeticiones):
+    mejor = np.inf
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        salida = func()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, salida
+
+
+def datos_whitney(eje):
+    """Argumentos de di para la columna canónica (bw, d, As, fc0, e_cu, fy, Es)."""
+    H, A, S = casos.HORMIGON, casos.ACERO, casos.COLUMNA
+    f = di._f
+    b, h = f(S, "disenar_columna_base"), f(S, "disenar_columna_altura")
+    bw, d = di.prop_eje(b, h, eje)
+    As = di.barras_columna(
+        b, h, f(S, "disenar_columna_recubrimiento"), f(S, "disenar_columna_diametro_transversal") / 10.0,
+        int(f(S, "disenar_columna_varillasX_2")), int(f(S, "disenar_columna_varillasY_2")),
+        f(S, "disenar_columna_diametro_longitudinal_esq") / 10.0,
+        f(S, "disenar_columna_diametro_longitudinal_2") / 10.0, eje,
+    )
+    return bw, d, As, f(H, "esfuerzo_fc"), f(H, "def_ultima_sin_confinar", 0.003), f(A, "esfuerzo_fy"), \
+        f(A, "modulo_Es")
+
+
+def _uniforme(bw, d, As, fc0, e_cu, fy, Es, n):
+    # Esquema anterior de di: c uniforme y una llamada a resultantes por punto
+    c_max = root_scalar(lambda c: di.resultantes(bw, d, As, c, fc0, e_cu, fy, Es)[1],
+                        bracket=[1e-6, 2 * d], method="brentq").root
+    c = np.linspace(1e-6, c_max, n)
+    P_val, M_val, c_val = [di.tension_pura(As, fy)], [0.0], [0.0]
+    for ci in c[1:]:
+        Pi, Mi, _ = di.resultantes(bw, d, As, ci, fc0, e_cu, fy, Es)
+        P_val.append(Pi)
+        M_val.append(Mi)
+        c_val.append(ci)
+        if Mi <= 0:
+            break
+    return np.array(P_val) / 10**3, np.array(M_val) / 10**5, np.array(c_val)
+
+
+def _distancia(x, y, px, py):
+    # Distancia de cada punto (px, py) a la poligonal (x, y)
+    dx, dy = np.diff(x), np.diff(y)
+    L2 = np.where(dx * dx + dy * dy > 0, dx * dx + dy * dy, 1.0)
+    t = np.clip(((px[:, None] - x[:-1]) * dx + (py[:, None] - y[:-1]) * dy) / L2, 0.0, 1.0)
+    return np.hypot(x[:-1] + t * dx - px[:, None], y[:-1] + t * dy - py[:, None]).min(axis=1)
+
+
+def error_cuerda(datos, P, M, c):
+    """
+    Error de cuerda de un diagrama nominal (P, M, c) de di frente a la
+    curva evaluada en PUNTOS_REFERENCIA profundidades: máximo de M-P y
+    φM-φP, relativo al tamaño del diagrama.
+    """
+    bw, d, As, fc0, e_cu, fy, Es = datos
+    c_ref = np.linspace(c[1], c[-1], PUNTOS_REFERENCIA)
+    P_ref, M_ref, _ = di.resultantes_lote(bw, d, As, c_ref, fc0, e_cu, fy, Es)
+    P_ref, M_ref = P_ref / 10**3, M_ref / 10**5
+    phi_ref = di.factor_phi(As, d, e_cu, c_ref, fy, Es)
+    phi = di.factor_phi(As, d, e_cu, c[1:], fy, Es)
+    escala_P, escala_M = np.abs(P_ref).max(), np.abs(M_ref).max()
+
+    error = 0.0
+    for f, f_ref in ((1.0, 1.0), (phi, phi_ref)):
+        error = max(error, _distancia(f * M[1:] / escala_M, f * P[1:] / escala_P,
+                                      f_ref * M_ref / escala_M, f_ref * P_ref / escala_P).max())
+    return float(error)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--eje", nargs="+", default=("x", "y"), choices=("x", "y"))
+    parser.add_argument("--tolerancias", type=float, nargs="+", default=(3e-3, 1e-3, 5e-4, 2e-4))
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'eje':>4s} {'reparto':>10s} {'parametro':>10s} {'puntos':>7s} {'t [ms]':>8s} {'error':>9s}")
+    for eje in args.eje:
+        datos = datos_whitney(eje)
+        for n in PUNTOS_UNIFORMES:
+            t, (P, M, c) = _mejor_tiempo(lambda: _uniforme(*datos, n), args.repeticiones)
+            print(f"{eje:>4s} {'uniforme':>10s} {n:10d} {len(c):7d} {t * 1e3:8.2f} "
+                  f"{error_cuerda(datos, P, M, c):9.1e}")
+        for tol in args.tolerancias:
+            t, (P, M, c) = _mejor_tiempo(lambda: di.di(*datos, tol=tol), args.repeticiones)
+            print(f"{eje:>4s} {'adaptativo':>10s} {tol:10.0e} {len(c):7d} {t * 1e3:8.2f} "
+                  f"{error_cuerda(datos, P, M, c):9.1e}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Control por curvatura (diagrama_MC_seccion) frente a control por
+deformación (diagrama_MC_deformacion) sobre los mismos casos: pasos,
+evaluaciones de resultantes, tiempo y estado límite alcanzado.
+
+Verifica además que la curva por deformación tenga phi creciente y que
+coincida con el control por curvatura: en cada phi de la curva se resuelve
+el equilibrio con momrot desde el punto anterior (lo que haría
+diagrama_MC_seccion en ese phi) y se compara M. No se interpola la curva
+de diagrama_MC_seccion porque sus pasos saltan las caídas verticales
+(desprendimiento del recubrimiento) y la interpolación lineal entre ellos
+no es la curva. La diferencia se expresa relativa a Mmax.
+
+Uso:
+    python benchmarks/bench_drivers.py [--fibras 20 50] [--repeticiones 3] [--tolerancia 0.02]
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import casos
+import momento_curvatura_parche_sap as mc
+
+
+CASOS = [
+    ("columna", casos.COLUMNA, "x", "hognestad", "hognestad"),
+    ("columna", casos.COLUMNA, "x", "mander_u", "mander_u"),
+    ("columna", casos.COLUMNA, "x", "mander_u", "mander_c"),
+    ("columna", casos.COLUMNA, "y", "mander_u", "mander_c"),
+    ("viga", casos.VIGA, "x", "hognestad", "hognestad"),
+    ("viga", casos.VIGA, "x", "mander_u", "mander_u"),
+]
+
+
+def _medir(func, repeticiones):
+    mejor = np.inf
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        salida = func()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, salida
+
+
+def _diferencia_curvatura(seccion, M, phi):
+    # Máxima diferencia de M frente al equilibrio por curvatura en los mismos phi
+    M_ref, c_prev, phi_prev = [], None, None
+    for p in phi[1:]:
+        Mi, ci = mc.momrot(seccion, -seccion.h / 2, seccion.h / 2, p, 1e-5, seccion.h, c_prev, phi_prev)
+        if Mi is None:
+            return np.inf
+        M_ref.append(-Mi)
+        c_prev, phi_prev = ci, p
+    M_ref = np.array(M_ref)
+    return float(np.max(np.abs(M[1:] - M_ref)) / np.max(M_ref))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fibras", type=int, nargs="+", default=(20, 50))
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--tolerancia", type=float, default=0.02)
+    args = parser.parse_args()
+
+    print(f"{'caso':26s} {'control':12s} {'pasos':>6s} {'evals':>7s} {'t [s]':>7s} "
+          f"{'phi final':>10s} {'Mmax':>10s} {'limite':>15s} {'creciente':>10s} {'dif. M':>8s}")
+
+    fallas = []
+    for fibras, (tipo, seccion_datos, eje, modelo_cover, modelo_core) in (
+            (f, caso) for f in args.fibras for caso in CASOS):
+        seccion = mc.construir_seccion(
+            casos.HORMIGON, casos.ACERO, seccion_datos, casos.fibras(fibras),
+            tipo, eje, modelo_cover, modelo_core,
+        )
+        nombre = f"{tipo}-{eje} {modelo_core} ({fibras})"
+
+        def curvatura():
+            registro = []
+            M, phi, _ = mc.diagrama_MC_seccion(seccion, 1e-5, registro=registro)
+            return M, phi, registro, "-"
+
+        def deformacion():
+            registro = []
+            M, phi, _, limite = mc.diagrama_MC_deformacion(seccion, 1e-5, registro=registro)
+            return M, phi, registro, limite
+
+        for control, func in (("curvatura", curvatura), ("deformacion", deformacion)):
+            t, (M, phi, registro, limite) = _medir(func, args.repeticiones)
+            resumen = mc.resumen_registro(registro)
+            verificacion = ""
+            if control == "deformacion":
+                creciente = bool(np.all(np.diff(phi) > 0))
+                diferencia = _diferencia_curvatura(seccion, M, phi)
+                verificacion = f" {str(creciente):>10s} {diferencia:8.1e}"
+                if not creciente or diferencia > args.tolerancia:
+                    fallas.append(nombre)
+            print(f"{nombre:26s} {control:12s} {len(registro):6d} {resumen['evaluaciones_totales']:7d} "
+                  f"{t:7.3f} {phi[-1]:10.3e} {M.max():10.4g} {limite:>15s}{verificacion}")
+
+    if fallas:
+        print(f"\nControl por deformación fuera de tolerancia ({args.tolerancia:g}): {', '.join(fallas)}")
+        sys.exit(1)
+    print(f"\nControl por deformación: phi creciente y dentro de {args.tolerancia:g}·Mmax del control por curvatura.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Familia M-φ por carga axial (calcular_familia_axial) de la columna
+canónica: evaluaciones de resultantes y tiempo con cada nivel partiendo en
+frío (barrido global de momrot en el primer paso) frente al arranque en
+caliente desde los niveles vecinos, por solver del eje neutro, y tiempo en
+serie frente a varios procesos. Se informa también la mayor diferencia de
+los momentos máximos respecto de la familia en frío con brentq.
+
+Verifica además que la familia con las opciones por defecto coincida nivel
+a nivel con calcular_momento_curvatura a la misma carga: mismos pasos y
+M dentro de --tolerancia·Mmax.
+
+Uso:
+    python benchmarks/bench_familia_axial.py [--niveles 15] [--divisiones 20] [--procesos 1 4] [--tolerancia 1e-6]
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import casos
+import momento_curvatura_parche_sap as mc
+from momento_curvatura_familia import calcular_familia_axial
+
+
+def _familia(args, **kwargs):
+    t0 = time.perf_counter()
+    familia = calcular_familia_axial(casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(args.divisiones),
+                                     args.eje, n_niveles=args.niveles, **kwargs)
+    return time.perf_counter() - t0, familia
+
+
+def _diferencia(tabla, referencia):
+    # Mayor diferencia del momento máximo de cada nivel, relativa a la
+    # referencia (las curvaturas de cada paso dependen del solver)
+    Mmax, Mmax_ref = np.nanmax(tabla[..., 2], axis=1), np.nanmax(referencia[..., 2], axis=1)
+    return np.max(np.abs(Mmax - Mmax_ref) / np.abs(Mmax_ref))
+
+
+def _diferencia_por_nivel(args, familia):
+    # Mayor diferencia de M de cada nivel frente a la curva suelta con la
+    # misma carga, relativa a su Mmax (inf si los pasos no coinciden)
+    diferencias = []
+    for P, (phi, M, _) in zip(familia["niveles"], familia["curvas"]):
+        phi_ref, M_ref, _, _ = mc.calcular_momento_curvatura(
+            casos.HORMIGON, casos.ACERO, casos.columna(P), casos.fibras(args.divisiones), "columna", args.eje,
+            "mander_u", "mander_c", usar_cache=False,
+        )
+        if len(phi) != len(phi_ref) or not np.allclose(phi, phi_ref):
+            diferencias.append(np.inf)
+        else:
+            diferencias.append(np.max(np.abs(M - M_ref)) / np.max(np.abs(M_ref)))
+    return diferencias
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--eje", default="x", choices=("x", "y"))
+    parser.add_argument("--niveles", type=int, default=15)
+    parser.add_argument("--divisiones", type=int, default=20)
+    parser.add_argument("--procesos", type=int, nargs="+", default=(1, 4))
+    parser.add_argument("--tolerancia", type=float, default=1e-6)
+    args = parser.parse_args()
+
+    _, referencia = _familia(args, metodo="brentq", en_caliente=False)
+
+    print(f"{'metodo':>7s} {'inicio':>8s} {'procesos':>9s} {'evaluaciones':>13s} {'t [s]':>7s} {'dif. Mmax':>10s}")
+    for metodo in ("brentq", "newton"):
+        for en_caliente in (False, True):
+            for n_procesos in args.procesos:
+                t, familia = _familia(args, metodo=metodo, en_caliente=en_caliente, n_procesos=n_procesos)
+                print(f"{metodo:>7s} {'caliente' if en_caliente else 'frio':>8s} {n_procesos:9d} "
+                      f"{sum(familia['evaluaciones']):13d} {t:7.2f} "
+                      f"{_diferencia(familia['tabla'], referencia['tabla']):10.1e}")
+
+    _, familia = _familia(args)
+    diferencias = _diferencia_por_nivel(args, familia)
+    fallas = [f"{P / 1e3:.1f} t ({d:.1e})" for P, d in zip(familia["niveles"], diferencias) if not d <= args.tolerancia]
+    if fallas:
+        print(f"\nFamilia distinta de calcular_momento_curvatura ({args.tolerancia:g}·Mmax): {', '.join(fallas)}")
+        sys.exit(1)
+    print(f"\nFamilia por defecto: cada nivel coincide con calcular_momento_curvatura "
+          f"(dif. máx. {max(diferencias):.1e}·Mmax).")
+
+
+if __name__ == "__main__":
+    main()
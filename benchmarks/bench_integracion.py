@@ -0,0 +1,67 @@
+"""
+Integración por fibras (punto medio) frente a integración exacta por
+franjas y a tablas de prefijos: error de N y M frente a una referencia y
+tiempo por evaluación, según el número de divisiones de la malla.
+
+Las tablas de prefijos dan el mismo resultado que la suma por fibras pero
+con costo O(log n) en el hormigón; solo aplican a Hognestad (con Mander la
+sección usa la suma directa y el tiempo coincide con "fibras").
+
+La referencia es la integración exacta con --referencia divisiones (con
+Hognestad es exacta con cualquier malla; con Mander la cuadratura de alto
+orden converge con muy pocas franjas).
+
+Uso:
+    python benchmarks/bench_integracion.py [--eje x] [--referencia 200]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import casos
+import momento_curvatura_parche_sap as mc
+
+MODELOS = (("hognestad", "hognestad"), ("mander_u", "mander_u"), ("mander_u", "mander_c"))
+DIVISIONES = {"fibras": (5, 10, 20, 50, 100, 200, 500), "exacta": (1, 2, 5, 10),
+              "prefijos": (10, 100, 500, 2000)}
+PUNTOS = [(c, phi) for c in (-20.0, 0.0, 5.0, 12.0, 25.0, 40.0) for phi in (1e-5, 1e-4, 5e-4, 2e-3)]
+
+
+def _seccion(n, eje, cover, core, integracion):
+    return mc.construir_seccion(casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(n),
+                                "columna", eje, cover, core, integracion=integracion)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--eje", default="x", choices=("x", "y"))
+    parser.add_argument("--referencia", type=int, default=200)
+    parser.add_argument("--repeticiones", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'modelo':10s} {'integracion':12s} {'div':>5s} {'fibras':>7s} {'error N':>9s} {'error M':>9s} "
+          f"{'t/eval [us]':>12s}")
+    for cover, core in MODELOS:
+        ref = _seccion(args.referencia, args.eje, cover, core, "exacta")
+        NM_ref = np.array([ref.NM(c, phi) for c, phi in PUNTOS])
+        escala = np.abs(NM_ref).max(axis=0)
+
+        for integracion, divisiones in DIVISIONES.items():
+            for n in divisiones:
+                s = _seccion(n, args.eje, cover, core, integracion)
+                NM = np.array([s.NM(c, phi) for c, phi in PUNTOS])
+                error = (np.abs(NM - NM_ref) / escala).max(axis=0)
+
+                t0 = time.perf_counter()
+                for _ in range(args.repeticiones):
+                    s.NM(12.0, 1e-4)
+                t = (time.perf_counter() - t0) / args.repeticiones
+
+                print(f"{core:10s} {integracion:12s} {n:5d} {len(s.y):7d} {error[0]:9.1e} {error[1]:9.1e} "
+                      f"{t * 1e6:12.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Tiempo de utilidades.malla (malla de fibras vectorizada) frente al número
+de divisiones, hasta 2000×2000 celdas, en ambos ejes de análisis.
+
+Uso:
+    python benchmarks/bench_malla.py [--max 2000] [--repeticiones 3]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import casos
+from momento_curvatura_parche_sap import _f
+from seccion import utilidades
+
+DIVISIONES = (10, 50, 100, 200, 500, 1000, 2000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max", type=int, default=2000, help="divisiones máximas por lado")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    S = casos.COLUMNA
+    b, h = _f(S, "disenar_columna_base"), _f(S, "disenar_columna_altura")
+    r = _f(S, "disenar_columna_recubrimiento")
+    de = _f(S, "disenar_columna_diametro_transversal") / 10.0
+
+    print(f"{'n':>6s} {'eje':>4s} {'celdas':>10s} {'capas cover':>12s} {'capas core':>11s} {'t [ms]':>9s}")
+    for n in (d for d in DIVISIONES if d <= args.max):
+        for eje in ("x", "y"):
+            mejor = np.inf
+            for _ in range(args.repeticiones):
+                t0 = time.perf_counter()
+                cover, core = utilidades.malla(b, h, r, de, n, n, eje)
+                mejor = min(mejor, time.perf_counter() - t0)
+            print(f"{n:6d} {eje:>4s} {(n + 2) ** 2:10d} {len(cover):12d} {len(core):11d} {mejor * 1e3:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Materiales tabulados (MaterialTabulado): para cada modelo de la columna
+canónica y cada tolerancia, nodos de la malla adaptativa, error máximo de
+esfuerzo alcanzado y aceleración de la evaluación del esfuerzo frente a la
+fórmula del modelo (informe de construir_seccion en "tabulacion").
+
+Luego compara la curva M-φ completa con materiales tabulados frente a las
+fórmulas: tiempo y diferencia del momento máximo y de la curvatura última.
+
+Uso:
+    python benchmarks/bench_materiales_tabulados.py [--tolerancias 1e-3 1e-4 1e-5] [--divisiones 20]
+"""
+import argparse
+import time
+
+import casos
+import momento_curvatura_parche_sap as mc
+
+MODELOS = (("hognestad", "hognestad"), ("mander_u", "mander_c"))
+
+
+def _curva(cover, core, n, tabulado, metodo):
+    t0 = time.perf_counter()
+    phi, M, _, _ = mc.calcular_momento_curvatura(
+        casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(n), "columna", "x", cover, core,
+        metodo=metodo, usar_cache=False, tabulado=tabulado,
+    )
+    return time.perf_counter() - t0, phi, M
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tolerancias", type=float, nargs="+", default=(1e-3, 1e-4, 1e-5))
+    parser.add_argument("--divisiones", type=int, default=20)
+    parser.add_argument("--metodo", default="brentq", choices=("brentq", "newton"))
+    args = parser.parse_args()
+
+    print(f"{'modelo':10s} {'tol':>7s} {'nodos':>6s} {'error [kgf/cm2]':>16s} {'error rel':>10s} {'x':>6s}")
+    for tol in args.tolerancias:
+        diagnostico = {}
+        mc.construir_seccion(casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(args.divisiones),
+                             "columna", "x", "mander_u", "mander_c", diagnostico=diagnostico, tabulado=tol)
+        diag_hog = {}
+        mc.construir_seccion(casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(args.divisiones),
+                             "columna", "x", "hognestad", "hognestad", diagnostico=diag_hog, tabulado=tol)
+        informes = dict(diagnostico["tabulacion"], hognestad=diag_hog["tabulacion"]["hognestad"])
+        for modelo in ("park", "hognestad", "mander_u", "mander_c"):
+            info = informes[modelo]
+            print(f"{modelo:10s} {tol:7.0e} {info['nodos']:6d} {info['error_max']:16.2e} "
+                  f"{info['error_relativo']:10.1e} {info['aceleracion']:6.1f}")
+    print()
+
+    print(f"{'core':10s} {'tol':>7s} {'t [s]':>7s} {'formula [s]':>12s} {'dif. Mmax':>10s} {'dif. phi_u':>11s}")
+    for cover, core in MODELOS:
+        t_ref, phi_ref, M_ref = _curva(cover, core, args.divisiones, None, args.metodo)
+        for tol in args.tolerancias:
+            t, phi, M = _curva(cover, core, args.divisiones, tol, args.metodo)
+            print(f"{core:10s} {tol:7.0e} {t:7.2f} {t_ref:12.2f} {abs(M.max() / M_ref.max() - 1):10.1e} "
+                  f"{abs(phi[-1] / phi_ref[-1] - 1):11.1e}")
+
+
+if __name__ == "__main__":
+    main()
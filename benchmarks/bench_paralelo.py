@@ -0,0 +1,62 @@
+"""
+calcular_resultados_seccion en serie frente al pool de procesos. Se
+reporta también el tiempo de la serie más lenta por separado, que es la
+cota a la que debe acercarse la ejecución en paralelo. El pool de
+procesos es de la sesión: su arranque se mide aparte, antes de los casos,
+y las llamadas siguientes lo reutilizan.
+
+Uso:
+    python benchmarks/bench_paralelo.py [--procesos 4] [--fibras 50]
+"""
+import argparse
+import os
+import time
+
+import casos
+import momento_curvatura_parche_sap as mc
+from diagrama_interaccion import calcular_series_di
+
+
+def _tiempo(func):
+    t0 = time.perf_counter()
+    func()
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--fibras", type=int, default=50)
+    args = parser.parse_args()
+
+    fibras = casos.fibras(args.fibras)
+    print(f"núcleos: {os.cpu_count()}  procesos: {args.procesos}")
+    if args.procesos > 1:
+        vacias = {i: (os.getpid, {}, False) for i in range(args.procesos)}
+        print(f"arranque del pool: {_tiempo(lambda: mc._ejecutar_tareas(vacias, args.procesos)):.3f} s  "
+              f"(reutilizado: {_tiempo(lambda: mc._ejecutar_tareas(vacias, args.procesos)):.3f} s)")
+    print(f"{'caso':12s} {'serie [s]':>10s} {'paralelo [s]':>13s} {'mas lenta [s]':>14s} {'x':>5s}")
+
+    for tipo, datos, eje in (("columna", casos.COLUMNA, "x"), ("columna", casos.COLUMNA, "y"),
+                             ("viga", casos.VIGA, "x")):
+        def correr(n):
+            return mc.calcular_resultados_seccion(casos.HORMIGON, casos.ACERO, datos, fibras, tipo, eje,
+                                                  n_procesos=n, usar_cache=False)
+
+        t_serie = _tiempo(lambda: correr(1))
+        t_paralelo = _tiempo(lambda: correr(args.procesos))
+
+        parciales = [
+            _tiempo(lambda: mc.calcular_momento_curvatura(casos.HORMIGON, casos.ACERO, datos, fibras,
+                                                          tipo, eje, cover, core, usar_cache=False))
+            for _, cover, core in mc.SERIES_MC[tipo]
+        ]
+        if tipo == "columna":
+            parciales.append(_tiempo(lambda: calcular_series_di(casos.HORMIGON, casos.ACERO, datos, eje, usar_cache=False)))
+
+        print(f"{tipo + '-' + eje:12s} {t_serie:10.3f} {t_paralelo:13.3f} {max(parciales):14.3f} "
+              f"{t_serie / t_paralelo:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
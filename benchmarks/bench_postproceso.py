@@ -0,0 +1,68 @@
+"""
+Postproceso de la curva M-φ (parámetros característicos): tiempo de
+extraer_parametros_caracteristicos_mc sobre la curva de la columna
+canónica remuestreada a n puntos, para ver que crece linealmente con n,
+y costo por punto de PostprocesoMC (agregar durante la curva y resultado
+al final) con la diferencia de parámetros entre ambos.
+
+Uso:
+    python benchmarks/bench_postproceso.py [--puntos 100 1000 10000 100000] [--repeticiones 5]
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+import casos
+import momento_curvatura_parche_sap as mc
+
+
+def _mejor_tiempo(funcion, repeticiones):
+    mejor = np.inf
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, resultado
+
+
+def _en_streaming(phi, M):
+    postproceso = mc.PostprocesoMC()
+    for x, y in zip(phi.tolist(), M.tolist()):
+        postproceso.agregar(x, y)
+    return postproceso.resultado()
+
+
+def _diferencia(a, b):
+    claves = ("rigidez_inicial", "area_bajo_curva", "ductilidad_curvatura")
+    puntos = ("punto_fluencia", "punto_maximo", "punto_falla")
+    valores = [(a[k], b[k]) for k in claves] + [(a[p][e], b[p][e]) for p in puntos for e in ("phi", "M")]
+    return max(abs(x - y) / max(abs(x), 1e-30) for x, y in valores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--puntos", type=int, nargs="+", default=(100, 1000, 10000, 100000))
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    phi_base, M_base, _, _ = mc.calcular_momento_curvatura(
+        casos.HORMIGON, casos.ACERO, casos.COLUMNA, casos.fibras(20), "columna", "x", "mander_u", "mander_c",
+        usar_cache=False,
+    )
+
+    print(f"{'n':>8s} {'lote [ms]':>10s} {'us/punto':>9s} {'streaming [ms]':>15s} {'us/punto':>9s} {'dif.':>8s}")
+    for n in args.puntos:
+        phi = np.linspace(0.0, phi_base[-1], n)
+        M = np.interp(phi, phi_base, M_base)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            t_lote, lote = _mejor_tiempo(lambda: mc.extraer_parametros_caracteristicos_mc(phi, M), args.repeticiones)
+            t_flujo, flujo = _mejor_tiempo(lambda: _en_streaming(phi, M), args.repeticiones)
+        print(f"{n:8d} {t_lote * 1e3:10.3f} {t_lote / n * 1e6:9.3f} {t_flujo * 1e3:15.3f} "
+              f"{t_flujo / n * 1e6:9.3f} {_diferencia(lote, flujo):8.1e}")
+
+
+if __name__ == "__main__":
+    main()
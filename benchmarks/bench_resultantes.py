@@ -0,0 +1,87 @@
+"""
+Costo por evaluación de resultantes: función resultantes (19 argumentos,
+rebana y crea temporales en cada llamada) frente a FiberSection.NM
+(arreglos empaquetados y buffers reutilizados).
+
+Uso:
+    python benchmarks/bench_resultantes.py [--repeticiones 2000]
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import casos
+import momento_curvatura_parche_sap as mc
+from kernel_fibras import FiberSection
+
+
+def _datos_sueltos(n_fibras, modelo_core):
+    H, A, S = casos.HORMIGON, casos.ACERO, casos.COLUMNA
+    f = mc._f
+    b, h = f(S, "disenar_columna_base"), f(S, "disenar_columna_altura")
+    r = f(S, "disenar_columna_recubrimiento")
+    de = f(S, "disenar_columna_diametro_transversal") / 10.0
+    cover, core = mc.malla(b, h, r, de, n_fibras, n_fibras, "x")
+    As = mc.barras_columna(
+        b, h, r, de,
+        int(f(S, "disenar_columna_varillasX_2")), int(f(S, "disenar_columna_varillasY_2")),
+        f(S, "disenar_columna_diametro_longitudinal_esq") / 10.0,
+        f(S, "disenar_columna_diametro_longitudinal_2") / 10.0, "x",
+    )
+    datos_h = mc._mander_confinado(H, A, S) if modelo_core == "mander_c" else None
+    materiales = (
+        f(H, "esfuerzo_fc"), f(H, "def_max_sin_confinar"), f(H, "def_ultima_sin_confinar"), f(H, "modulo_Ec"),
+        f(A, "esfuerzo_fy"), f(A, "esfuerzo_ultimo_acero"), f(A, "modulo_Es"),
+        f(A, "def_fluencia_acero"), f(A, "def_inicio_endurecimiento"), f(A, "def_ultima_acero"),
+    )
+    P = f(S, "disenar_columna_axial")
+    sg_cover = mc.sigma_hormigon("mander_u" if modelo_core == "mander_c" else modelo_core)
+    sg_core = mc.sigma_hormigon(modelo_core)
+    return cover, core, As, materiales, P, datos_h, sg_cover, sg_core, h
+
+
+def _medir(func, repeticiones):
+    func()
+    t0 = time.perf_counter()
+    for _ in range(repeticiones):
+        func()
+    t = (time.perf_counter() - t0) / repeticiones
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    for _ in range(20):
+        func()
+    pico = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return t, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=2000)
+    args = parser.parse_args()
+
+    c, phi = 12.0, 0.004
+    print(f"{'modelo':10s} {'fibras':>6s} {'antes [us]':>11s} {'despues [us]':>13s} {'x':>5s} "
+          f"{'temp antes [B]':>15s} {'temp despues [B]':>17s}")
+
+    for modelo_core in ("hognestad", "mander_c"):
+        for n in (10, 50, 200, 500):
+            cover, core, As, mat, P, datos_h, sg_cover, sg_core, h = _datos_sueltos(n, modelo_core)
+            seccion = FiberSection.desde_parametros(cover, core, As, *mat, P, datos_h, sg_cover, sg_core, h=h)
+
+            antes = lambda: mc.resultantes(c, phi, cover, core, As, *mat, P, datos_h, sg_cover, sg_core)
+            despues = lambda: seccion.NM(c, phi)
+            assert np.allclose(antes(), despues())
+
+            t_a, m_a = _medir(antes, args.repeticiones)
+            t_d, m_d = _medir(despues, args.repeticiones)
+            print(f"{modelo_core:10s} {n:6d} {t_a * 1e6:11.1f} {t_d * 1e6:13.1f} {t_a / t_d:5.1f} "
+                  f"{m_a:15d} {m_d:17d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Evaluación de resultantes solo en la zona comprimida activa (FiberSection)
+frente a la evaluación de todas las fibras (resultantes, que pasa por
+resultantes_hormigon con la sección completa), en columnas de altura
+creciente.
+
+Se comparan dos mallas con las mismas divisiones:
+
+    capas    la salida de utilidades.malla (fibras de igual coordenada
+             fusionadas en una capa: ~2 x divisiones fibras)
+    celdas   una fibra por celda (divisiones² fibras), como una malla 2D
+             sin fusionar
+
+Los estados (c, phi) se toman de la propia curva M-φ de cada sección, así
+que el porcentaje de fibras activas es el que ve el solver: tras la
+fluencia el eje neutro sube y la zona activa es una franja delgada cerca
+del borde comprimido. Con pocas capas el costo lo domina el overhead por
+llamada y ambos caminos cuestan lo mismo; el ahorro crece con el número de
+fibras y con la altura de la sección.
+
+Uso:
+    python benchmarks/bench_zona_activa.py [--alturas 90 200 400] [--divisiones 100 300]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import casos
+import momento_curvatura_parche_sap as mc
+from kernel_fibras import FiberSection
+
+ESTADOS = 20
+
+
+def _datos(altura):
+    datos = casos.columna()
+    datos["disenar_columna_altura"] = str(altura)
+    return datos
+
+
+def _celdas(capas, n):
+    # Reparte cada capa en n fibras de igual área y misma coordenada
+    return np.column_stack((np.repeat(capas[:, 0], n), np.repeat(capas[:, 1] / n, n)))
+
+
+def _por_evaluacion(func, estados, repeticiones):
+    t0 = time.perf_counter()
+    for _ in range(repeticiones):
+        for c, phi in estados:
+            func(c, phi)
+    return (time.perf_counter() - t0) / (repeticiones * len(estados))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alturas", type=float, nargs="+", default=(90, 200, 400), help="altura de la columna [cm]")
+    parser.add_argument("--divisiones", type=int, nargs="+", default=(100, 300))
+    parser.add_argument("--modelo", default="hognestad", choices=("hognestad", "mander_u"))
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    H, A = casos.HORMIGON, casos.ACERO
+    f = mc._f
+    fc0, Ec, ec0, esp = (f(H, k) for k in ("esfuerzo_fc", "modulo_Ec", "def_max_sin_confinar",
+                                         "def_ultima_sin_confinar"))
+    fy, fsu, Es, ey, esh, esu = (f(A, k) for k in ("esfuerzo_fy", "esfuerzo_ultimo_acero", "modulo_Es",
+                                                  "def_fluencia_acero", "def_inicio_endurecimiento",
+                                                  "def_ultima_acero"))
+    sg = mc.sigma_hormigon(args.modelo)
+
+    print(f"{'h [cm]':>7s} {'div':>5s} {'malla':>7s} {'fibras':>8s} {'activas':>8s} {'todas [us]':>11s} "
+          f"{'activa [us]':>12s} {'x':>6s}")
+    for altura in args.alturas:
+        datos = _datos(altura)
+        b, h = f(datos, "disenar_columna_base"), f(datos, "disenar_columna_altura")
+        r = f(datos, "disenar_columna_recubrimiento")
+        de = f(datos, "disenar_columna_diametro_transversal") / 10.0
+        estados = None
+        for n in args.divisiones:
+            referencia = mc.construir_seccion(H, A, datos, casos.fibras(n), "columna", "x", args.modelo, args.modelo)
+            if estados is None:
+                # Estados de la curva de la malla más gruesa (la curva casi no cambia con n)
+                _, phi, c = mc.diagrama_MC_seccion(referencia, 1e-5)
+                i = np.linspace(1, len(phi) - 1, ESTADOS).astype(int)
+                estados = list(zip(c[i].tolist(), phi[i].tolist()))
+            As = np.column_stack((referencia.y_acero, referencia.A[referencia._acero]))
+            P = referencia.P
+
+            capas = mc.malla(b, h, r, de, n, n, "x")
+            for nombre, (cover, core) in (("capas", capas), ("celdas", [_celdas(g, n) for g in capas])):
+                seccion = FiberSection.desde_parametros(cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh,
+                                                        esu, P, None, sg, sg, h=h)
+
+                def todas(c, phi):
+                    return mc.resultantes(c, phi, cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu,
+                                          P, None, sg, sg)
+
+                n_hormigon = len(cover) + len(core)
+                activas = np.mean([
+                    sum(t.stop - t.start for t in (seccion._activas(tramo, limite, c, phi)
+                                                   for tramo, _, _, limite in seccion._tramos[:2]))
+                    for c, phi in estados
+                ])
+                t_todas = _por_evaluacion(todas, estados, args.repeticiones)
+                t_activa = _por_evaluacion(seccion.NM, estados, args.repeticiones)
+                print(f"{altura:7g} {n:5d} {nombre:>7s} {n_hormigon:8d} {activas / n_hormigon:8.1%} "
+                      f"{t_todas * 1e6:11.1f} {t_activa * 1e6:12.1f} {t_todas / t_activa:6.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Casos canónicos para los benchmarks del motor M-φ y del diagrama de
+interacción. Los diccionarios tienen el mismo formato que usa la interfaz
+(valores como texto) para pasar por las mismas funciones de lectura.
+"""
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+HORMIGON = {
+    "nombre_hormigon": "f'c 210",
+    "esfuerzo_fc": "210",
+    "modulo_Ec": "218819.788",
+    "def_max_sin_confinar": "0.002",
+    "def_ultima_sin_confinar": "0.0038",
+    "def_ultima_confinada": "0.09",
+}
+
+ACERO = {
+    "nombre_acero": "fy 4200",
+    "esfuerzo_fy": "4200",
+    "modulo_Es": "2000000",
+    "esfuerzo_ultimo_acero": "7457",
+    "def_fluencia_acero": "0.0021",
+    "def_inicio_endurecimiento": "0.0139",
+    "def_ultima_acero": "0.09",
+}
+
+COLUMNA = {
+    "disenar_columna_base": "40",
+    "disenar_columna_altura": "90",
+    "disenar_columna_varillasX_2": "10",
+    "disenar_columna_varillasY_2": "10",
+    "disenar_columna_diametro_longitudinal_2": "25",
+    "disenar_columna_recubrimiento": "3",
+    "disenar_columna_ramalesX": "4",
+    "disenar_columna_ramalesY": "4",
+    "disenar_columna_diametro_transversal": "12",
+    "disenar_columna_espaciamiento": "10",
+    "disenar_columna_diametro_longitudinal_esq": "30",
+    "disenar_columna_axial": "3000",
+}
+
+VIGA = {
+    "disenar_viga_base": "40",
+    "disenar_viga_altura": "80",
+    "disenar_viga_recubrimiento": "3",
+    "disenar_viga_varillas_inferior": "4",
+    "disenar_viga_diametro_inferior": "25",
+    "disenar_viga_varillas_superior": "2",
+    "disenar_viga_diametro_superior": "14",
+    "disenar_viga_diametro_transversal": "10",
+    "disenar_viga_espaciamiento": "10",
+}
+
+
+def fibras(n_x, n_y=None):
+    return {"fibras_x": str(n_x), "fibras_y": str(n_y if n_y is not None else n_x)}
+
+
+def columna(axial=None):
+    datos = dict(COLUMNA)
+    if axial is not None:
+        datos["disenar_columna_axial"] = str(axial)
+    return datos
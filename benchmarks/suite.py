@@ -0,0 +1,228 @@
+"""
+Suite de benchmarks del motor M-φ y del diagrama de interacción.
+
+Casos: columna y viga canónicas (casos.py) con densidades de fibras de 10
+a 500 y, en columnas, niveles de carga axial P = k·f'c·Ag. Por caso se
+mide (mejor de N repeticiones):
+
+    construir_seccion   malla de fibras + capas de acero + materiales
+    diagrama_MC         diagrama_MC_seccion; además pasos y evaluaciones
+                        de N (equilibrio del eje neutro) según el registro
+    parametros_mc       extraer_parametros_caracteristicos_mc
+    buscar_ecu          deformación última confinada (por columna), sin
+                        la memoria de _ecu_por_equilibrio; además
+                        evaluaciones del balance de energía
+    calcular_series_di  diagrama de interacción (por columna y eje); además
+                        puntos del diagrama y error de cuerda frente a la
+                        curva densa (bench_di_whitney.error_cuerda)
+
+Los resultados se guardan en JSON. Con --base se comparan contra una
+corrida previa y el proceso termina con código 1 si algún tiempo o
+conteo de evaluaciones empeora más que --umbral. Los tiempos dependen de
+la máquina: para comparar en otra máquina usar --sin-tiempos (solo los
+conteos, que son deterministas) o regenerar la base con --guardar.
+
+benchmarks/base.json es la corrida completa de referencia del repositorio.
+
+Uso:
+    python benchmarks/suite.py --base benchmarks/base.json [--umbral 0.25]
+    python benchmarks/suite.py --rapido --base benchmarks/base.json --sin-tiempos
+    python benchmarks/suite.py --guardar benchmarks/base.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+import scipy
+
+import casos
+import momento_curvatura_parche_sap as mc
+from bench_di_whitney import datos_whitney, error_cuerda
+from diagrama_interaccion import calcular_series_di, di
+from materiales import ManderConfinado, _ecu_por_equilibrio, modelos
+
+DENSIDADES = (10, 50, 200, 500)
+DENSIDADES_RAPIDAS = (10, 50)
+NIVELES_AXIALES = (0.0, 0.1, 0.3)       # P / (f'c·Ag)
+NIVELES_AXIALES_RAPIDOS = (0.1,)
+MODELOS_COLUMNA = (("hognestad", "hognestad"), ("mander_u", "mander_c"))
+MODELOS_VIGA = (("hognestad", "hognestad"), ("mander_u", "mander_u"))
+
+
+def _mejor_tiempo(func, repeticiones):
+    mejor, salida = np.inf, None
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        salida = func()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, salida
+
+
+def _columna(nivel):
+    f = mc._f
+    S = casos.COLUMNA
+    Ag = f(S, "disenar_columna_base") * f(S, "disenar_columna_altura")
+    return casos.columna(axial=nivel * f(casos.HORMIGON, "esfuerzo_fc") * Ag)
+
+
+def _caso_mc(tipo, datos, eje, n, cover, core, repeticiones):
+    fibras = casos.fibras(n)
+    t_sec, seccion = _mejor_tiempo(
+        lambda: mc.construir_seccion(casos.HORMIGON, casos.ACERO, datos, fibras, tipo, eje, cover, core),
+        repeticiones,
+    )
+
+    def curva():
+        registro = []
+        M, phi, _ = mc.diagrama_MC_seccion(seccion, 1e-5, registro=registro)
+        return M, phi, registro
+
+    t_mc, (M, phi, registro) = _mejor_tiempo(curva, repeticiones)
+    resumen = mc.resumen_registro(registro)
+    t_par, _ = _mejor_tiempo(lambda: mc.extraer_parametros_caracteristicos_mc(phi * 100.0, M / 1e5), repeticiones)
+
+    return {
+        "tiempos": {"construir_seccion": t_sec, "diagrama_MC": t_mc, "parametros_mc": t_par},
+        "conteos": {
+            "fibras": int(len(seccion.y)),
+            "pasos": resumen["pasos"],
+            "evaluaciones_N": resumen["evaluaciones_totales"],
+        },
+        "Mmax": float(M.max()),
+    }
+
+
+def _caso_ecu(datos, repeticiones):
+    H, A = casos.HORMIGON, casos.ACERO
+    f = mc._f
+    mander = mc._mander_confinado(H, A, datos)
+    args = [f(H, k) for k in ("esfuerzo_fc", "def_max_sin_confinar", "def_ultima_sin_confinar", "modulo_Ec")]
+    args += [f(A, k) for k in ("esfuerzo_fy", "esfuerzo_ultimo_acero", "modulo_Es", "def_fluencia_acero",
+                               "def_inicio_endurecimiento", "def_ultima_acero")]
+    sin_ecu = ManderConfinado(*args[:4], mander.datos_h[:11] + (None, None))
+    diagnostico = {}
+
+    def buscar():
+        # _mander_confinado ya dejó el resultado en memoria: se mide el solver
+        _ecu_por_equilibrio.cache_clear()
+        return modelos.buscar_ecu(*args, datos_h=sin_ecu, diagnostico=diagnostico)
+
+    t, ecu = _mejor_tiempo(buscar, repeticiones)
+    return {"tiempos": {"buscar_ecu": t}, "conteos": {"evaluaciones_ecu": diagnostico["evaluaciones"]},
+            "ecu": float(ecu)}
+
+
+def _caso_di(datos, eje, repeticiones):
+    t, (di_matriz, _) = _mejor_tiempo(
+        lambda: calcular_series_di(casos.HORMIGON, casos.ACERO, datos, eje, usar_cache=False), repeticiones
+    )
+    error = error_cuerda(datos_whitney(eje), *di(*datos_whitney(eje)))
+    return {"tiempos": {"calcular_series_di": t}, "conteos": {"puntos": int(len(di_matriz))},
+            "error_cuerda": error}
+
+
+def ejecutar(densidades, niveles, repeticiones, informar=print):
+    resultados = {}
+
+    def registrar(nombre, datos):
+        resultados[nombre] = datos
+        tiempos = "  ".join(f"{k}={v * 1e3:.1f}ms" for k, v in datos["tiempos"].items())
+        conteos = "  ".join(f"{k}={v}" for k, v in datos["conteos"].items())
+        informar(f"{nombre:45s} {tiempos}  {conteos}")
+
+    for nivel in niveles:
+        datos = _columna(nivel)
+        for eje in ("x", "y"):
+            for n in densidades:
+                for cover, core in MODELOS_COLUMNA:
+                    registrar(f"mc/columna-{eje}/P{nivel:g}/n{n}/{core}",
+                              _caso_mc("columna", datos, eje, n, cover, core, repeticiones))
+        registrar(f"ecu/columna/P{nivel:g}", _caso_ecu(datos, repeticiones))
+
+    for n in densidades:
+        for cover, core in MODELOS_VIGA:
+            registrar(f"mc/viga-x/n{n}/{core}", _caso_mc("viga", casos.VIGA, "x", n, cover, core, repeticiones))
+
+    for eje in ("x", "y"):
+        registrar(f"di/columna-{eje}", _caso_di(casos.COLUMNA, eje, repeticiones))
+
+    return resultados
+
+
+def comparar(actual, base, umbral, con_tiempos=True, tolerancia_s=5e-3):
+    """
+    Retorna la lista de regresiones (texto) de actual frente a base. Un
+    tiempo es regresión si supera el umbral relativo y además crece más de
+    tolerancia_s (las operaciones de pocos ms son sobre todo ruido).
+    """
+    regresiones = []
+    for nombre, caso in actual.items():
+        if nombre not in base:
+            continue
+        ref = base[nombre]
+        if con_tiempos:
+            for k, t in caso["tiempos"].items():
+                t0 = ref["tiempos"].get(k)
+                if t0 is not None and t > t0 * (1 + umbral) and t - t0 > tolerancia_s:
+                    regresiones.append(f"{nombre} {k}: {t0 * 1e3:.1f} -> {t * 1e3:.1f} ms (x{t / t0:.2f})")
+        for k, v in caso["conteos"].items():
+            v0 = ref["conteos"].get(k)
+            if k.startswith("evaluaciones") and v0 and v > v0 * (1 + umbral):
+                regresiones.append(f"{nombre} {k}: {v0} -> {v} (x{v / v0:.2f})")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rapido", action="store_true", help="densidades 10 y 50, un nivel axial")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--guardar", help="ruta del JSON de resultados")
+    parser.add_argument("--base", help="JSON de una corrida previa para comparar")
+    parser.add_argument("--umbral", type=float, default=0.25, help="empeoramiento relativo tolerado")
+    parser.add_argument("--tolerancia-ms", type=float, default=5.0, help="aumento absoluto de tiempo tolerado")
+    parser.add_argument("--sin-tiempos", action="store_true", help="comparar solo conteos de evaluaciones")
+    args = parser.parse_args()
+
+    densidades = DENSIDADES_RAPIDAS if args.rapido else DENSIDADES
+    niveles = NIVELES_AXIALES_RAPIDOS if args.rapido else NIVELES_AXIALES
+    resultados = ejecutar(densidades, niveles, args.repeticiones)
+
+    salida = {
+        "meta": {
+            "fecha": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+            "plataforma": platform.platform(),
+            "procesador": platform.processor(),
+            "rapido": args.rapido,
+            "repeticiones": args.repeticiones,
+        },
+        "casos": resultados,
+    }
+    if args.guardar:
+        os.makedirs(os.path.dirname(os.path.abspath(args.guardar)), exist_ok=True)
+        with open(args.guardar, "w", encoding="utf-8") as f:
+            json.dump(salida, f, indent=2)
+        print(f"\nResultados guardados en {args.guardar}")
+
+    if args.base:
+        with open(args.base, "r", encoding="utf-8") as f:
+            base = json.load(f)["casos"]
+        regresiones = comparar(resultados, base, args.umbral, con_tiempos=not args.sin_tiempos,
+                               tolerancia_s=args.tolerancia_ms / 1e3)
+        if regresiones:
+            print(f"\n{len(regresiones)} regresiones (umbral {args.umbral:.0%}):")
+            for r in regresiones:
+                print("  " + r)
+            return 1
+        print(f"\nSin regresiones frente a {args.base} (umbral {args.umbral:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
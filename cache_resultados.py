@@ -0,0 +1,261 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# Cambiar al modificar los solvers: invalida todas las entradas guardadas
+VERSION_CACHE = 4
+
+
+def _normalizar(valor):
+    """
+    Forma canónica de las entradas: los textos numéricos de la interfaz se
+    convierten a float ("40" == "40.0"), los diccionarios se ordenan y se
+    omiten los campos de nombre, que no afectan al cálculo.
+    """
+    if isinstance(valor, dict):
+        return {str(k): _normalizar(v) for k, v in valor.items() if "nombre" not in str(k)}
+    if isinstance(valor, (list, tuple)):
+        return [_normalizar(v) for v in valor]
+    if isinstance(valor, np.ndarray):
+        return _normalizar(valor.tolist())
+    if isinstance(valor, str):
+        texto = valor.strip()
+        try:
+            return float(texto.replace(",", "."))
+        except ValueError:
+            return texto.lower()
+    if isinstance(valor, (bool, np.bool_)):
+        return bool(valor)
+    if isinstance(valor, (int, float, np.integer, np.floating)):
+        return float(valor)
+    return valor
+
+
+def clave_canonica(*partes):
+    """
+    Hash SHA-256 de la forma canónica de las entradas de un cálculo.
+    """
+    texto = json.dumps([VERSION_CACHE, _normalizar(partes)], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def _empaquetar(valor, arreglos):
+    # Estructura JSON con los arreglos reemplazados por referencias del npz
+    if isinstance(valor, np.ndarray):
+        nombre = f"a{len(arreglos)}"
+        arreglos[nombre] = valor
+        return {"__arreglo__": nombre}
+    if isinstance(valor, tuple):
+        return {"__tupla__": [_empaquetar(v, arreglos) for v in valor]}
+    if isinstance(valor, list):
+        return [_empaquetar(v, arreglos) for v in valor]
+    if isinstance(valor, dict):
+        return {str(k): _empaquetar(v, arreglos) for k, v in valor.items()}
+    if isinstance(valor, np.generic):
+        return valor.item()
+    return valor
+
+
+def _desempaquetar(valor, arreglos):
+    if isinstance(valor, dict):
+        if "__arreglo__" in valor:
+            return arreglos[valor["__arreglo__"]]
+        if "__tupla__" in valor:
+            return tuple(_desempaquetar(v, arreglos) for v in valor["__tupla__"])
+        return {k: _desempaquetar(v, arreglos) for k, v in valor.items()}
+    if isinstance(valor, list):
+        return [_desempaquetar(v, arreglos) for v in valor]
+    return valor
+
+
+class CacheResultados:
+    """
+    Caché de resultados direccionada por contenido (clave_canonica).
+
+    Nivel en memoria: LRU acotado a max_memoria entradas.
+    Nivel en disco (opcional): un .npz por entrada más indice.json con la
+    fecha de último uso; se acota a max_disco entradas, eliminando las
+    menos usadas.
+
+    Los valores son estructuras de arreglos, tuplas, listas, dicts y
+    escalares (las salidas de calcular_momento_curvatura y
+    calcular_series_di). Se retornan copias, de modo que modificar un
+    resultado no altera la caché.
+
+    Es segura entre hilos (el cálculo en segundo plano de la interfaz la
+    comparte). Si el disco falla al escribir, la caché sigue solo en
+    memoria.
+    """
+
+    def __init__(self, max_memoria=64, directorio=None, max_disco=512):
+        self.max_memoria = int(max_memoria)
+        self.max_disco = int(max_disco)
+        self.directorio = directorio
+        self._memoria = OrderedDict()
+        self._indice = None
+        self._candado = threading.Lock()
+        self.reiniciar_estadisticas()
+
+    # ---------- estadísticas ----------
+
+    def reiniciar_estadisticas(self):
+        self.aciertos_memoria = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+        self.guardados = 0
+
+    def estadisticas(self):
+        consultas = self.aciertos_memoria + self.aciertos_disco + self.fallos
+        return {
+            "aciertos_memoria": self.aciertos_memoria,
+            "aciertos_disco": self.aciertos_disco,
+            "fallos": self.fallos,
+            "guardados": self.guardados,
+            "tasa_acierto": (self.aciertos_memoria + self.aciertos_disco) / consultas if consultas else 0.0,
+            "entradas_memoria": len(self._memoria),
+            "entradas_disco": len(self._leer_indice()) if self.directorio else 0,
+        }
+
+    # ---------- API ----------
+
+    def obtener(self, clave):
+        """
+        Retorna una copia del valor guardado, o None si no existe.
+        """
+        with self._candado:
+            if clave in self._memoria:
+                self._memoria.move_to_end(clave)
+                self.aciertos_memoria += 1
+                return copy.deepcopy(self._memoria[clave])
+
+            valor = self._leer_disco(clave)
+            if valor is not None:
+                self.aciertos_disco += 1
+                self._guardar_memoria(clave, valor)
+                return copy.deepcopy(valor)
+
+            self.fallos += 1
+            return None
+
+    def guardar(self, clave, valor):
+        valor = copy.deepcopy(valor)
+        with self._candado:
+            self._guardar_memoria(clave, valor)
+            self._escribir_disco(clave, valor)
+            self.guardados += 1
+
+    def limpiar(self, disco=False):
+        with self._candado:
+            self._memoria.clear()
+            if disco and self.directorio:
+                for clave in list(self._leer_indice()):
+                    self._borrar_disco(clave)
+                self._escribir_indice()
+
+    # ---------- memoria ----------
+
+    def _guardar_memoria(self, clave, valor):
+        self._memoria[clave] = valor
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.max_memoria:
+            self._memoria.popitem(last=False)
+
+    # ---------- disco ----------
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, f"{clave}.npz")
+
+    def _leer_indice(self):
+        if self._indice is None:
+            self._indice = {}
+            ruta = os.path.join(self.directorio, "indice.json")
+            if os.path.exists(ruta):
+                try:
+                    with open(ruta, "r", encoding="utf-8") as f:
+                        self._indice = json.load(f)
+                except (OSError, ValueError):
+                    self._indice = {}
+        return self._indice
+
+    def _escribir_indice(self):
+        ruta = os.path.join(self.directorio, "indice.json")
+        tmp = ruta + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._indice, f)
+        os.replace(tmp, ruta)
+
+    def _leer_disco(self, clave):
+        if not self.directorio:
+            return None
+        indice = self._leer_indice()
+        if clave not in indice:
+            return None
+        try:
+            with np.load(self._ruta(clave), allow_pickle=False) as datos:
+                arreglos = {k: datos[k] for k in datos.files if k != "__estructura__"}
+                estructura = json.loads(str(datos["__estructura__"]))
+        except (OSError, ValueError, KeyError):
+            # Entrada corrupta o borrada a mano: se descarta
+            indice.pop(clave, None)
+            return None
+        indice[clave]["usado"] = time.time()
+        return _desempaquetar(estructura, arreglos)
+
+    def _escribir_disco(self, clave, valor):
+        if not self.directorio:
+            return
+        tmp = self._ruta(clave) + ".tmp.npz"
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            arreglos = {}
+            estructura = _empaquetar(valor, arreglos)
+            np.savez_compressed(tmp, __estructura__=np.array(json.dumps(estructura)), **arreglos)
+            os.replace(tmp, self._ruta(clave))
+
+            indice = self._leer_indice()
+            indice[clave] = {"usado": time.time()}
+            while len(indice) > self.max_disco:
+                antigua = min(indice, key=lambda k: indice[k]["usado"])
+                self._borrar_disco(antigua)
+            self._escribir_indice()
+        except (OSError, ValueError, TypeError):
+            # Disco lleno, sin permisos o valor no serializable: se sigue
+            # solo en memoria
+            for ruta in (tmp, os.path.join(self.directorio, "indice.json.tmp")):
+                try:
+                    os.remove(ruta)
+                except OSError:
+                    pass
+            self.directorio = None
+            self._indice = None
+
+    def _borrar_disco(self, clave):
+        self._leer_indice().pop(clave, None)
+        try:
+            os.remove(self._ruta(clave))
+        except OSError:
+            pass
+
+
+# Caché compartida por los módulos de cálculo (solo memoria hasta configurarla)
+CACHE = CacheResultados()
+
+
+def configurar_cache(max_memoria=None, directorio=None, max_disco=None):
+    """
+    Ajusta la caché compartida. directorio activa el nivel en disco.
+    """
+    if max_memoria is not None:
+        CACHE.max_memoria = int(max_memoria)
+    if max_disco is not None:
+        CACHE.max_disco = int(max_disco)
+    if directorio is not None:
+        CACHE.directorio = directorio
+        CACHE._indice = None
+    return CACHE
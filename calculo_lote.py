@@ -0,0 +1,292 @@
+"""
+Cálculo por lotes sin interfaz gráfica (no importa Qt ni matplotlib).
+
+Lee proyectos .mcproj o una tabla CSV/XLSX de secciones, calcula en
+procesos paralelos las curvas M-φ, el diagrama de interacción (columnas)
+y la curva ASCE 41-17, y escribe por sección un .npz con las curvas y un
+.json con los parámetros característicos, más un resumen.csv del lote.
+
+Tabla CSV/XLSX: una fila por sección. Columnas reconocidas:
+    nombre, tipo (columna/viga), eje (x/y) o direccion ("Dirección X"),
+    y cualquier campo de los diccionarios de la interfaz (esfuerzo_fc,
+    disenar_columna_base, fibras_x, long_viga_asce, ...). Los campos que
+    falten toman los valores por defecto de datos_por_defecto.
+
+Uso:
+    python calculo_lote.py secciones.csv proyectos/*.mcproj --salida resultados --procesos 8
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from datos_por_defecto import datos_por_defecto
+from momento_curvatura_parche_sap import calcular_resultados_seccion
+from class_calcular_asce import CalculadoraASCE
+
+# Diccionario de la interfaz al que pertenece cada campo de la tabla
+_GRUPOS = (
+    "material_hormigon_data",
+    "material_acero_data",
+    "seccion_columna_data",
+    "seccion_viga_data",
+    "capas_fibras_data",
+    "asce_data",
+)
+
+
+def _campo_a_grupo():
+    base = datos_por_defecto()
+    grupos = {campo: g for g in _GRUPOS for campo in base[g]}
+    grupos["corte_viga_asce"] = "asce_data"
+    return grupos
+
+
+def _eje_desde_texto(texto):
+    texto = str(texto or "").strip().lower()
+    return "y" if texto.endswith("y") else "x"
+
+
+def _nombre_archivo(nombre):
+    return re.sub(r"[^\w\-.]+", "_", str(nombre)).strip("_") or "seccion"
+
+
+def _trabajo(nombre, tipo, eje, datos):
+    tipo = str(tipo or "columna").strip().lower()
+    return {
+        "nombre": nombre,
+        "tipo": tipo,
+        "eje": "x" if tipo == "viga" else eje,
+        "datos_hormigon": datos["material_hormigon_data"],
+        "datos_acero": datos["material_acero_data"],
+        "datos_seccion": datos["seccion_viga_data" if tipo == "viga" else "seccion_columna_data"],
+        "datos_fibras": datos["capas_fibras_data"],
+        "datos_asce": datos["asce_data"],
+    }
+
+
+def leer_proyecto(ruta):
+    """
+    Un .mcproj (JSON guardado por la interfaz) -> un trabajo.
+    """
+    with open(ruta, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+
+    datos = datos_por_defecto()
+    for g in _GRUPOS:
+        if isinstance(payload.get(g), dict):
+            datos[g].update(payload[g])
+
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    return _trabajo(nombre, payload.get("tipo_seleccionado", "Columna"),
+                    _eje_desde_texto(payload.get("direccion_analisis")), datos)
+
+
+def _filas_tabla(ruta):
+    if ruta.lower().endswith((".xlsx", ".xlsm")):
+        try:
+            from openpyxl import load_workbook
+        except ImportError as e:
+            raise RuntimeError("Para leer archivos XLSX se necesita openpyxl.") from e
+        libro = load_workbook(ruta, read_only=True, data_only=True)
+        filas = libro.active.iter_rows(values_only=True)
+        encabezado = [str(c).strip() if c is not None else "" for c in next(filas)]
+        for fila in filas:
+            if fila is None or all(v is None for v in fila):
+                continue
+            yield {k: v for k, v in zip(encabezado, fila) if k and v is not None}
+        libro.close()
+    else:
+        with open(ruta, "r", encoding="utf-8-sig", newline="") as f:
+            for fila in csv.DictReader(f):
+                yield {k.strip(): v for k, v in fila.items() if k and v not in (None, "")}
+
+
+def leer_tabla(ruta):
+    """
+    Una tabla CSV/XLSX -> un trabajo por fila.
+    """
+    grupos = _campo_a_grupo()
+    base = os.path.splitext(os.path.basename(ruta))[0]
+    trabajos = []
+    for i, fila in enumerate(_filas_tabla(ruta), start=1):
+        datos = datos_por_defecto()
+        for campo, valor in fila.items():
+            if campo in grupos:
+                datos[grupos[campo]][campo] = str(valor).strip()
+        eje = fila.get("eje", fila.get("direccion", "x"))
+        trabajos.append(_trabajo(fila.get("nombre", f"{base}_{i}"), fila.get("tipo", "columna"),
+                                 _eje_desde_texto(eje), datos))
+    return trabajos
+
+
+def leer_entradas(rutas):
+    trabajos = []
+    for ruta in rutas:
+        if ruta.lower().endswith((".mcproj", ".json")):
+            trabajos.append(leer_proyecto(ruta))
+        else:
+            trabajos.extend(leer_tabla(ruta))
+
+    # Nombres de archivo únicos
+    usados = {}
+    for t in trabajos:
+        nombre = _nombre_archivo(t["nombre"])
+        usados[nombre] = usados.get(nombre, 0) + 1
+        t["archivo"] = nombre if usados[nombre] == 1 else f"{nombre}_{usados[nombre]}"
+    return trabajos
+
+
+def _a_json(valor):
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    raise TypeError(f"No serializable: {type(valor).__name__}")
+
+
+def procesar_seccion(trabajo, salida, con_asce=True, metodo="brentq", control="curvatura"):
+    """
+    Calcula una sección y escribe <archivo>.npz y <archivo>.json en salida.
+    Se ejecuta en un proceso del pool; los errores se retornan en el
+    resumen en lugar de propagarse, para no detener el lote.
+    """
+    t0 = time.perf_counter()
+    resumen = {"nombre": trabajo["nombre"], "tipo": trabajo["tipo"], "eje": trabajo["eje"]}
+    try:
+        resultados = calcular_resultados_seccion(
+            datos_hormigon=trabajo["datos_hormigon"],
+            datos_acero=trabajo["datos_acero"],
+            datos_seccion=trabajo["datos_seccion"],
+            datos_fibras=trabajo["datos_fibras"],
+            tipo_seccion=trabajo["tipo"],
+            eje=trabajo["eje"],
+            metodo=metodo,
+            control=control,
+            n_procesos=1,
+        )
+
+        arreglos = {}
+        for modelo, (phi, M) in resultados["mc_series"].items():
+            arreglos[f"mc_{modelo}_phi"] = phi
+            arreglos[f"mc_{modelo}_M"] = M
+        if resultados["di_matriz"] is not None:
+            arreglos["di_matriz"] = resultados["di_matriz"]
+
+        parametros = {"mc": resultados["mc_parametros"]}
+
+        if con_asce:
+            direccion = "Dirección Y" if trabajo["eje"] == "y" else "Dirección X"
+            asce = CalculadoraASCE().calcular(
+                trabajo["tipo"].capitalize(), direccion,
+                trabajo["datos_hormigon"], trabajo["datos_acero"],
+                trabajo["datos_seccion"], trabajo["datos_asce"],
+            )
+            arreglos["asce_curvatura_phi"], arreglos["asce_curvatura_M"] = asce["curvatura"]
+            arreglos["asce_rotacion_theta"], arreglos["asce_rotacion_M"] = asce["rotacion"]
+            parametros["asce"] = asce["parametros"]
+
+        base = os.path.join(salida, trabajo["archivo"])
+        np.savez_compressed(base + ".npz", **arreglos)
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(parametros, f, ensure_ascii=False, indent=2, default=_a_json)
+
+        resumen["estado"] = "ok"
+        for modelo, p in resultados["mc_parametros"].items():
+            resumen[f"{modelo}_My"] = p.get("punto_fluencia", {}).get("M")
+            resumen[f"{modelo}_Mmax"] = p.get("punto_maximo", {}).get("M")
+            resumen[f"{modelo}_ductilidad"] = p.get("ductilidad_curvatura")
+    except Exception as e:
+        resumen["estado"] = "error"
+        resumen["error"] = f"{type(e).__name__}: {e}"
+        resumen["traza"] = traceback.format_exc()
+
+    resumen["tiempo_s"] = time.perf_counter() - t0
+    return resumen
+
+
+def ejecutar_lote(trabajos, salida, n_procesos=None, con_asce=True, metodo="brentq",
+                  control="curvatura", informar=print):
+    """
+    Reparte las secciones en un pool de procesos y retorna la lista de
+    resúmenes (en el orden de trabajos) y el tiempo total.
+    """
+    os.makedirs(salida, exist_ok=True)
+    n_procesos = n_procesos or os.cpu_count() or 1
+    kwargs = dict(salida=salida, con_asce=con_asce, metodo=metodo, control=control)
+
+    t0 = time.perf_counter()
+    resumenes = [None] * len(trabajos)
+    if n_procesos == 1:
+        for i, t in enumerate(trabajos):
+            resumenes[i] = procesar_seccion(t, **kwargs)
+            informar(_linea(i + 1, len(trabajos), resumenes[i]))
+    else:
+        with ProcessPoolExecutor(max_workers=n_procesos) as pool:
+            futuros = {pool.submit(procesar_seccion, t, **kwargs): i for i, t in enumerate(trabajos)}
+            for hechos, futuro in enumerate(as_completed(futuros), start=1):
+                i = futuros[futuro]
+                resumenes[i] = futuro.result()
+                informar(_linea(hechos, len(trabajos), resumenes[i]))
+    return resumenes, time.perf_counter() - t0
+
+
+def _linea(hechos, total, r):
+    estado = "ok" if r["estado"] == "ok" else f"ERROR {r['error']}"
+    return f"[{hechos}/{total}] {r['nombre']} ({r['tipo']}-{r['eje']}) {r['tiempo_s']:.2f} s {estado}"
+
+
+def escribir_resumen(resumenes, salida):
+    columnas = []
+    for r in resumenes:
+        for k in r:
+            if k != "traza" and k not in columnas:
+                columnas.append(k)
+    ruta = os.path.join(salida, "resumen.csv")
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=columnas, extrasaction="ignore")
+        escritor.writeheader()
+        escritor.writerows(resumenes)
+    return ruta
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("entradas", nargs="+", help="archivos .mcproj, .csv o .xlsx")
+    parser.add_argument("--salida", default="resultados_lote")
+    parser.add_argument("--procesos", type=int, default=None, help="por defecto, uno por núcleo")
+    parser.add_argument("--sin-asce", action="store_true", help="no calcular la curva ASCE 41-17")
+    parser.add_argument("--metodo", choices=("brentq", "newton"), default="brentq")
+    parser.add_argument("--control", choices=("curvatura", "deformacion"), default="curvatura")
+    args = parser.parse_args(argv)
+
+    trabajos = leer_entradas(args.entradas)
+    if not trabajos:
+        print("No hay secciones para calcular.")
+        return 1
+
+    resumenes, total = ejecutar_lote(
+        trabajos, args.salida, n_procesos=args.procesos, con_asce=not args.sin_asce,
+        metodo=args.metodo, control=args.control,
+    )
+    ruta = escribir_resumen(resumenes, args.salida)
+
+    fallidas = [r for r in resumenes if r["estado"] != "ok"]
+    print()
+    print(f"Secciones: {len(resumenes)}  correctas: {len(resumenes) - len(fallidas)}  fallidas: {len(fallidas)}")
+    print(f"Tiempo total: {total:.2f} s  ({len(resumenes) / total:.2f} secciones/s)")
+    print(f"Resumen: {ruta}")
+    for r in fallidas:
+        print(f"  {r['nombre']}: {r['error']}")
+    return 1 if fallidas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+import threading
+import time
+from contextlib import closing
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from momento_curvatura_familia import calcular_familia_axial, numero_bloques
+from cache_resultados import CACHE
+from momento_curvatura_parche_sap import (
+    SERIES_MC, CalculoCancelado, PostprocesoMC, calcular_resultados_seccion, clave_mc, construir_seccion,
+    iterar_MC_seccion,
+)
+
+ETIQUETAS = {
+    "hognestad": "Hognestad",
+    "mander_no_conf": "Mander No Confinado",
+    "mander_conf": "Mander Confinado",
+    "di": "Diagrama de interacción",
+    "di_fibras": "Diagrama de interacción por fibras",
+}
+
+
+class SenalesCalculo(QObject):
+    """
+    Señales del cálculo en segundo plano. El objeto se crea en el hilo de
+    la interfaz, así que las conexiones llegan encoladas a ese hilo.
+    """
+    progreso = Signal(int, str)      # porcentaje de tareas terminadas, texto
+    terminado = Signal(object)       # dict resultados de calcular_resultados_seccion (o de la familia)
+    error = Signal(str)
+    cancelado = Signal()
+
+
+class TrabajadorCalculo(QRunnable):
+    """
+    Ejecuta calcular_resultados_seccion fuera del hilo de la interfaz
+    (QThreadPool). Reporta avance por cada paso de curvatura convergido y
+    se detiene en el siguiente paso si se llama a cancelar().
+
+    Parámetros:
+        kwargs : argumentos de calcular_resultados_seccion
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.kwargs = kwargs
+        self.senales = SenalesCalculo()
+        self._cancelar = threading.Event()
+
+        tipo = kwargs.get("tipo_seccion", "").strip().lower()
+        self._total = len(SERIES_MC.get(tipo, SERIES_MC["viga"])) + (1 if tipo == "columna" else 0)
+        if tipo == "columna" and kwargs.get("di_fibras") is not None:
+            self._total += 1
+        self._terminadas = 0
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    def cancelado(self):
+        return self._cancelar.is_set()
+
+    def _avance(self, clave, pasos, terminada):
+        etiqueta = ETIQUETAS.get(clave, clave)
+        if terminada:
+            self._terminadas += 1
+            texto = f"{etiqueta}: terminado"
+        else:
+            texto = f"{etiqueta}: {pasos} pasos"
+        porcentaje = int(100 * self._terminadas / max(self._total, 1))
+        self.senales.progreso.emit(porcentaje, texto)
+
+    def run(self):
+        try:
+            resultados = calcular_resultados_seccion(
+                **self.kwargs, progreso=self._avance, cancelar=self._cancelar
+            )
+        except CalculoCancelado:
+            self.senales.cancelado.emit()
+            return
+        except Exception as e:
+            self.senales.error.emit(str(e))
+            return
+
+        if self._cancelar.is_set():
+            self.senales.cancelado.emit()
+        else:
+            self.senales.terminado.emit(resultados)
+
+
+class TrabajadorFamiliaAxial(QRunnable):
+    """
+    Ejecuta calcular_familia_axial fuera del hilo de la interfaz. Reporta
+    avance por bloque de niveles (ver momento_curvatura_familia) y por cada
+    paso de curvatura convergido; se cancela igual que TrabajadorCalculo.
+
+    Parámetros:
+        kwargs : argumentos de calcular_familia_axial
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.kwargs = kwargs
+        self.senales = SenalesCalculo()
+        self._cancelar = threading.Event()
+
+        n_niveles = len(kwargs["niveles"]) if kwargs.get("niveles") is not None else kwargs.get("n_niveles", 15)
+        self._total = numero_bloques(n_niveles, kwargs.get("n_procesos", 1))
+        self._terminadas = 0
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    def cancelado(self):
+        return self._cancelar.is_set()
+
+    def _avance(self, clave, pasos, terminada):
+        if terminada:
+            self._terminadas += 1
+            texto = f"Familia M-φ: {self._terminadas} de {self._total} bloques"
+        else:
+            texto = f"Familia M-φ ({clave}): {pasos} pasos"
+        porcentaje = int(100 * self._terminadas / max(self._total, 1))
+        self.senales.progreso.emit(porcentaje, texto)
+
+    def run(self):
+        try:
+            familia = calcular_familia_axial(**self.kwargs, progreso=self._avance, cancelar=self._cancelar)
+        except CalculoCancelado:
+            self.senales.cancelado.emit()
+            return
+        except Exception as e:
+            self.senales.error.emit(str(e))
+            return
+
+        if self._cancelar.is_set():
+            self.senales.cancelado.emit()
+        else:
+            self.senales.terminado.emit(familia)
+
+
+class SenalesCurvasMC(QObject):
+    """
+    Señales de TrabajadorCurvasMC (llegan encoladas al hilo de la interfaz).
+    """
+    puntos = Signal(str, object, object)     # clave de la serie, lote de φ (1/m), lote de M (t·m)
+    curva_terminada = Signal(str, object, object)  # clave, serie completa (φ, M), parámetros característicos
+    terminado = Signal(bool)                 # True si se detuvo antes de completar las series
+    error = Signal(str)
+
+
+class TrabajadorCurvasMC(QRunnable):
+    """
+    Calcula las series M-φ de la sección recorriendo iterar_MC_seccion y
+    envía los puntos a la interfaz a medida que convergen, en lotes de
+    como máximo INTERVALO_S segundos (el primero sale con el primer punto),
+    para que la curva se dibuje mientras se calcula.
+
+    Cada curva completa se guarda en cache_resultados.CACHE con la misma
+    clave que calcular_momento_curvatura (clave_mc, control por curvatura),
+    y antes de calcular una serie se consulta la caché: si ya está, se
+    envía entera de una vez.
+
+    detener() corta la curva en el siguiente punto convergido: el
+    trabajador deja de iterar y cierra el generador; la curva cortada no
+    se guarda ni se informa como terminada.
+
+    Parámetros:
+        datos_hormigon, datos_acero, datos_seccion, datos_fibras,
+        tipo_seccion, eje : los de calcular_series_mc
+        tol, metodo       : los de diagrama_MC_seccion
+        claves            : series de SERIES_MC a calcular (por defecto todas)
+    """
+
+    INTERVALO_S = 0.05
+
+    def __init__(self, datos_hormigon, datos_acero, datos_seccion, datos_fibras, tipo_seccion, eje,
+                 tol=1e-5, metodo="brentq", claves=None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.datos = (datos_hormigon, datos_acero, datos_seccion, datos_fibras)
+        self.tipo_seccion = tipo_seccion.strip().lower()
+        self.eje = eje
+        self.tol = tol
+        self.metodo = metodo
+        self.claves = claves
+        self.senales = SenalesCurvasMC()
+        self._detener = threading.Event()
+
+    def detener(self):
+        self._detener.set()
+
+    def detenido(self):
+        return self._detener.is_set()
+
+    def _enviar(self, clave, lote):
+        phi, M = np.array(lote, dtype=float).T
+        self.senales.puntos.emit(clave, phi * 100.0, M / 1e5)
+        lote.clear()
+
+    def _curva(self, clave, modelo_cover, modelo_core):
+        clave_cache = clave_mc(*self.datos, self.tipo_seccion, self.eje, modelo_cover, modelo_core,
+                               tol=self.tol, metodo=self.metodo, control="curvatura")
+        guardado = CACHE.obtener(clave_cache)
+        if guardado is not None:
+            phi, M, _, parametros = guardado
+            self.senales.puntos.emit(clave, phi, M)
+            self.senales.curva_terminada.emit(clave, (phi, M), parametros)
+            return
+
+        seccion = construir_seccion(*self.datos, self.tipo_seccion, self.eje, modelo_cover, modelo_core)
+        postproceso = PostprocesoMC(100.0, 1e-5)
+        curva, lote, ultimo_envio = [], [], -np.inf
+        with closing(iterar_MC_seccion(seccion, self.tol, metodo=self.metodo)) as puntos:
+            for phi, M, c in puntos:
+                if self._detener.is_set():
+                    break
+                postproceso.agregar(phi, M)
+                curva.append((phi, M, c))
+                lote.append((phi, M))
+                if time.perf_counter() - ultimo_envio >= self.INTERVALO_S:
+                    self._enviar(clave, lote)
+                    ultimo_envio = time.perf_counter()
+        if lote:
+            self._enviar(clave, lote)
+        if self._detener.is_set():
+            return
+        try:
+            parametros = postproceso.resultado()
+        except Exception as e:
+            parametros = {"error": str(e)}
+
+        # En las unidades y la forma de calcular_momento_curvatura
+        phi, M, c = np.array(curva, dtype=float).reshape(-1, 3).T
+        phi, M = phi * 100.0, M / 1e5
+        CACHE.guardar(clave_cache, (phi, M, c, parametros))
+        self.senales.curva_terminada.emit(clave, (phi, M), parametros)
+
+    def run(self):
+        try:
+            for clave, modelo_cover, modelo_core in SERIES_MC.get(self.tipo_seccion, SERIES_MC["viga"]):
+                if self.claves is not None and clave not in self.claves:
+                    continue
+                if self._detener.is_set():
+                    break
+                self._curva(clave, modelo_cover, modelo_core)
+        except Exception as e:
+            self.senales.error.emit(str(e))
+            return
+        self.senales.terminado.emit(self._detener.is_set())
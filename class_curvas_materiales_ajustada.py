@@ -1,5 +1,5 @@
 import numpy as np
-from materiales import modelos
+from materiales import modelos, ManderConfinado
 
 class CurvasMateriales:
     def __init__(self, datos_hormigon=None, datos_acero=None, datos_seccion=None):
@@ -72,10 +72,12 @@ class CurvasMateriales:
         nb = (nb_x - 2) * 2 + nb_y * 2
 
         fyh = fy
-        fcc = None
-        ecu = None
 
-        datos_h = (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, ecu, fcc)
+        # Confinamiento (incluido fcc) calculado una sola vez
+        mander = ManderConfinado(
+            fc0, ec0, esp, Ec,
+            (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, None, None),
+        )
         ecu = modelos.buscar_ecu(
             fc0=fc0,
             ec0=ec0,
@@ -87,10 +89,9 @@ class CurvasMateriales:
             ey=ey,
             esh=esh,
             esu=esu,
-            datos_h=datos_h,
+            datos_h=mander,
         )
-        datos_h = (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, ecu, fcc)
 
         ec = np.linspace(-ecu, 0.0, 100)
-        fc = modelos.mander_c(ec, fc0, ec0, esp, Ec, datos_h, 1)
+        fc = mander.con_ecu(ecu).esfuerzo(ec)
         return -ec, -fc
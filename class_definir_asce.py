@@ -16,7 +16,7 @@ from validation_utils2 import (
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import matplotlib.ticker as mticker
 import numpy as np
 
@@ -106,7 +106,7 @@ class VentanaDefinirASCE(QDialog):
         self.ui.btn_calcular_curvatura.clicked.connect(self._calc_y_plot_curvatura)
 
         # ====== Canvas Matplotlib ======
-        self.figure = plt.figure()
+        self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = CustomToolbar(self.canvas, self)
         self.toolbar.setMaximumHeight(28)
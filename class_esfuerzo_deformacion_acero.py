@@ -7,7 +7,7 @@ from class_mostrar_tabla import VentanaMostrarTabla
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
 
 class CustomToolbar(NavigationToolbar2QT):
@@ -66,7 +66,7 @@ class VentanaEsfuerzoAcero(QDialog):
         self.ui.tablePuntosControl.setItem(2, 1, item_21)
         # ---------------------------------------------------------------
         # Crear FigureCanvas y CustomToolbar
-        self.figure = plt.figure()
+        self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = CustomToolbar(self.canvas, self)
         self.toolbar.setMaximumHeight(28)
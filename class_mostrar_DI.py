@@ -8,7 +8,7 @@ from class_mostrar_tabla import VentanaMostrarTabla
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
 
 
@@ -29,6 +29,8 @@ class VentanaMostrarDI(QDialog):
     Requiere:
         - di_matriz: ndarray con columnas [c, φM, φP, M, P]
         - di_series: dict con series {'con_phi': (φM, φP), 'sin_phi': (M, P)}
+    Si di_series trae también 'fibras_con_phi' / 'fibras_sin_phi' (diagrama
+    por fibras), se superpone con línea discontinua a la serie seleccionada.
     """
     def __init__(self, seccion_columna_data: dict,
                  di_matriz=None, di_series=None,
@@ -76,7 +78,7 @@ class VentanaMostrarDI(QDialog):
         cont.installEventFilter(self)
 
         # ====== Canvas para el DI ======
-        self.figure = plt.figure()
+        self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = CustomToolbar(self.canvas, self)
         self.toolbar.setMaximumHeight(28)
@@ -290,10 +292,12 @@ class VentanaMostrarDI(QDialog):
         # Decide serie según checkbox
         if self.ui.checkBox_conphi.isChecked():
             datos = self._series.get("con_phi")
+            fibras = self._series.get("fibras_con_phi")
             etiqueta = "Diagrama con φ"
             color = "magenta"
         else:
             datos = self._series.get("sin_phi")
+            fibras = self._series.get("fibras_sin_phi")
             etiqueta = "Diagrama sin φ"
             color = "blue"
 
@@ -309,6 +313,15 @@ class VentanaMostrarDI(QDialog):
             self.x_total = x.tolist()
             self.y_total = y.tolist()
 
+        if fibras is not None:
+            x = np.asarray(fibras[0], dtype=float)
+            y = np.asarray(fibras[1], dtype=float)
+            ax.plot(x, y, label=f"{etiqueta} (fibras)", color=color, linestyle="--")
+            ax.legend(fontsize=9, loc="best", frameon=True)
+
+            self.x_total += x.tolist()
+            self.y_total += y.tolist()
+
         self.figure.tight_layout()
 
         # (Re)crear el marcador rojo para el hover
@@ -373,10 +386,14 @@ class VentanaMostrarDI(QDialog):
         checks = {
             "con_phi": self.ui.checkBox_conphi,
             "sin_phi": self.ui.checkBox_sinphi,
+            "fibras_con_phi": self.ui.checkBox_conphi,
+            "fibras_sin_phi": self.ui.checkBox_sinphi,
         }
         etiquetas = {
             "con_phi": "Diagrama con φ",
             "sin_phi": "Diagrama sin φ",
+            "fibras_con_phi": "Fibras con φ",
+            "fibras_sin_phi": "Fibras sin φ",
         }
 
         VentanaMostrarTabla(
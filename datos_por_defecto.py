@@ -0,0 +1,69 @@
+import copy
+
+# Datos por defecto de un proyecto (mismo formato de texto que la interfaz).
+# Sin dependencias de Qt: los usa main_app y el cálculo por lotes.
+DATOS_POR_DEFECTO = {
+    "material_hormigon_data": {
+        "nombre_hormigon": "f'c 210",
+        "esfuerzo_fc": "210",
+        "modulo_Ec": "218819.788",
+        "def_max_sin_confinar": "0.002",
+        "def_ultima_sin_confinar": "0.0038",  # esp 
+        "def_ultima_confinada": "0.09",
+    },
+    "material_acero_data": {
+        "nombre_acero": "fy 4200",
+        "esfuerzo_fy": "4200",
+        "modulo_Es": "2000000",
+        "esfuerzo_ultimo_acero": "7457",
+        "def_fluencia_acero": "0.0021",
+        "def_inicio_endurecimiento": "0.0139",
+        "def_ultima_acero": "0.09",
+    },
+    "seccion_columna_data": {
+        "disenar_columna_base": "40",
+        "disenar_columna_altura": "90",
+        "disenar_columna_varillasX_2": "10",
+        "disenar_columna_varillasY_2": "10",
+        "disenar_columna_diametro_longitudinal_2": "25",
+        "disenar_columna_recubrimiento": "3",
+        "disenar_columna_ramalesX": "4",
+        "disenar_columna_ramalesY": "4",
+        "disenar_columna_diametro_transversal": "12",
+        "disenar_columna_espaciamiento": "10",
+        "disenar_columna_diametro_longitudinal_esq": "30",
+        "disenar_columna_axial": "3000",
+    },
+    "seccion_viga_data": {
+        "disenar_viga_base": "40",
+        "disenar_viga_altura": "80",
+        "disenar_viga_recubrimiento": "3",
+        "disenar_viga_varillas_inferior": "4",
+        "disenar_viga_diametro_inferior": "25",
+        "disenar_viga_varillas_superior": "2",
+        "disenar_viga_diametro_superior": "14",
+        "disenar_viga_diametro_transversal": "10",
+        "disenar_viga_espaciamiento": "10",
+    },
+    "proyecto_data": {
+        "descripcion_proyecto": "Nombre Proyecto",
+        "descripcion_ingeniero": "Luis Flor",
+        "descripcion_seccion": "C40X40",
+    },
+    "capas_fibras_data": {"fibras_x": "10", "fibras_y": "10"},
+    "asce_data": {
+        "long_viga_asce": "6",
+        # Campos de solo-lectura (se sobreescriben SIEMPRE antes de abrir el diálogo)
+        "def_max_asce": "",
+        "def_ultima_asce": "",
+        "def_fluencia_asce": "",
+        "axial_columna_asce": "",
+    },
+}
+
+
+def datos_por_defecto():
+    """
+    Retorna una copia independiente de DATOS_POR_DEFECTO.
+    """
+    return copy.deepcopy(DATOS_POR_DEFECTO)
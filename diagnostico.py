@@ -0,0 +1,53 @@
+"""
+Ganchos (hooks) de instrumentación del solver M-φ.
+
+Los solvers llaman a emitir(evento, datos) solo si hay algún gancho
+registrado, así que sin ganchos el costo es una verificación de lista
+vacía por paso. Eventos:
+
+    "inicio_curva"  {"seccion": FiberSection, "metodo": str}
+    "paso"          dict del paso (phi, dphi, convergio, evaluaciones,
+                    iteraciones_brentq, ventana, tiempo_s, ...)
+    "fin_curva"     {"motivo_fin": str, "pasos": int}; motivo_fin es
+                    "detenido" si se dejó de iterar iterar_MC_seccion
+    "buscar_ecu"    dict con ecu, intervalo, iteraciones, memorizado, respaldo
+                    (y su motivo), tiempo_s
+
+Los ganchos viven en el proceso donde se registran: para perfilar con
+n_procesos > 1 hay que registrarlos también en los workers, o calcular
+con n_procesos=1.
+
+Ejemplo (cProfile solo durante el cálculo de cada curva):
+
+    import cProfile
+    perfil = cProfile.Profile()
+
+    def gancho(evento, datos):
+        if evento == "inicio_curva":
+            perfil.enable()
+        elif evento == "fin_curva":
+            perfil.disable()
+
+    agregar_gancho(gancho)
+"""
+
+GANCHOS = []
+
+
+def agregar_gancho(gancho):
+    """
+    Registra gancho(evento, datos). Retorna el mismo gancho.
+    """
+    if gancho not in GANCHOS:
+        GANCHOS.append(gancho)
+    return gancho
+
+
+def quitar_gancho(gancho):
+    if gancho in GANCHOS:
+        GANCHOS.remove(gancho)
+
+
+def emitir(evento, datos):
+    for gancho in list(GANCHOS):
+        gancho(evento, datos)
@@ -1,6 +1,7 @@
 import numpy as np
 from scipy.optimize import root_scalar
 from seccion import utilidades
+from cache_resultados import CACHE, clave_canonica
 
 barras_columna = utilidades.barras_columna
 
@@ -105,9 +106,59 @@ def tension_pura(As, fy):
 	P1 = - fy * As_tot
 	return P1
 
-def di(bw, d, As, fc0, e_cu, fy, Es):
+def resultantes_lote(bw, d, As, c, fc0, e_cu, fy, Es):
+	"""
+	Como resultantes, pero para un vector de profundidades c: todas las
+	barras y todas las profundidades se evalúan juntas (matriz c x barras).
+	"""
+	c = np.asarray(c, dtype=float)
+	b1 = max(min(0.85, 0.85 - 0.05 * (fc0 - 280) / 70), 0.65)
+	P_c, M_c = hormigon_whitney(fc0, bw, d, c, b1)
+
+	es = e_cu * (c[:, None] + As[:, 0] - d/2) / c[:, None]
+	sigma_s = acero_bilineal(es, fy, Es)
+
+	P = P_c + sigma_s @ As[:, 1]
+	M = M_c + sigma_s @ (As[:, 1] * As[:, 0])
+	return P, M, c
+
+def _quiebres_whitney(d, As, e_cu, fy, Es):
+	"""
+	Profundidades c en que la curva cambia de rama: fluencia de cada barra
+	en tracción y en compresión y límites de la transición de factor_phi.
+	"""
+	ey = fy/Es
+	d_t = np.min(As[:, 0])
+
+	# es = e_cu * (c + y - d/2) / c  =>  c = e_cu * (d/2 - y) / (e_cu - es)
+	y = np.concatenate((As[:, 0], As[:, 0], [d_t, d_t]))
+	es = np.concatenate((np.full(len(As), ey), np.full(len(As), -ey), [-ey, -(ey + 0.003)]))
+	with np.errstate(divide="ignore"):
+		c = e_cu * (d/2 - y) / (e_cu - es)
+	return c[np.isfinite(c) & (c > 0)]
+
+def _desvio_cuerda(x, y, x_m, y_m):
+	"""
+	Distancia de cada punto (x_m[i], y_m[i]) al segmento entre los puntos
+	i e i + 1 de la poligonal (x, y).
+	"""
+	dx = np.diff(x)
+	dy = np.diff(y)
+	L2 = dx*dx + dy*dy
+	t = ((x_m - x[:-1]) * dx + (y_m - y[:-1]) * dy) / np.where(L2 > 0, L2, 1.0)
+	t = np.clip(t, 0.0, 1.0)
+	return np.hypot(x[:-1] + t * dx - x_m, y[:-1] + t * dy - y_m)
+
+def di(bw, d, As, fc0, e_cu, fy, Es, tol=5e-4, n_inicial=9, max_pasadas=30):
 	"""
 	Calcula el diagrama de interacción nominal.
+
+	Los puntos se reparten de forma adaptativa: se parte de n_inicial
+	profundidades uniformes más las de cambio de rama (_quiebres_whitney)
+	y se dividen a la mitad los intervalos cuyo punto medio se aleja de la
+	cuerda más de tol, relativo al tamaño del diagrama, en la curva M-P o
+	en la curva φM-φP. Cada pasada evalúa todos los puntos medios juntos
+	con resultantes_lote.
 	"""
 	def maxima_c(c):
 		M = resultantes(bw, d, As, c, fc0, e_cu, fy, Es)[1]
@@ -116,23 +167,119 @@ def di(bw, d, As, fc0, e_cu, fy, Es):
 	# Para calcular el c donde M = 0
 	c_max = root_scalar(maxima_c, bracket=[1e-6, 2*d], method="brentq")
 	c_max = c_max.root
-	c = np.linspace(1e-6, c_max, 100)
-	
-	c_val = [0.0]
-	P_val = [tension_pura(As, fy)]
-	M_val = [0.0]
 
-	for i in range(1, len(c)):
-		Pi, Mi, ci = resultantes(bw, d, As, c[i], fc0, e_cu, fy, Es)
+	quiebres = _quiebres_whitney(d, As, e_cu, fy, Es)
+	c = np.union1d(np.linspace(1e-6, c_max, n_inicial), quiebres[quiebres < c_max])
+	P, M, _ = resultantes_lote(bw, d, As, c, fc0, e_cu, fy, Es)
+	phi = factor_phi(As, d, e_cu, c, fy, Es)
+	escala_P = np.max(np.abs(P))
+	escala_M = np.max(np.abs(M))
+
+	for _ in range(max_pasadas):
+		c_m = 0.5 * (c[:-1] + c[1:])
+		P_m, M_m, _ = resultantes_lote(bw, d, As, c_m, fc0, e_cu, fy, Es)
+		phi_m = factor_phi(As, d, e_cu, c_m, fy, Es)
+
+		desvio = np.maximum(
+			_desvio_cuerda(M / escala_M, P / escala_P, M_m / escala_M, P_m / escala_P),
+			_desvio_cuerda(phi * M / escala_M, phi * P / escala_P,
+				phi_m * M_m / escala_M, phi_m * P_m / escala_P),
+		)
+		dividir = desvio > tol
+		if not dividir.any():
+			break
 
-		c_val.append(ci)
-		P_val.append(Pi)
-		M_val.append(Mi)
+		i = np.flatnonzero(dividir) + 1
+		c = np.insert(c, i, c_m[dividir])
+		P = np.insert(P, i, P_m[dividir])
+		M = np.insert(M, i, M_m[dividir])
+		phi = np.insert(phi, i, phi_m[dividir])
 
-		if Mi <= 0:
-			break
+	n = len(c)
+	negativos = np.flatnonzero(M <= 0)
+	if len(negativos):
+		n = negativos[0] + 1
+
+	P_val = np.concatenate(([tension_pura(As, fy)], P[:n]))
+	M_val = np.concatenate(([0.0], M[:n]))
+	c_val = np.concatenate(([0.0], c[:n]))
+	return P_val / 10**3, M_val / 10**5, c_val
+
+def _planos_fibras(d, e_lim, h_t, esu, n_puntos):
+	"""
+	Planos de deformación límite de di_fibras (compresión positiva), dados
+	por la deformación e_t de la barra más traccionada y la pendiente; h_t
+	es la distancia de esa barra a la fibra de control.
+	"""
+	# Rotura del acero: la fibra de control desde -esu hasta e_lim
+	e_c = np.linspace(-esu, e_lim, 21)[:-1]
+
+	# Aplastamiento: profundidad del eje neutro medida desde la fibra de control
+	c_control = np.concatenate((
+		np.linspace(e_lim * h_t / (esu + e_lim), d, n_puntos - 40),
+		np.geomspace(d, 1e3 * d, 21)[1:],
+	))
+	e_c = np.concatenate((e_c, np.full(len(c_control), e_lim)))
+	e_t = np.concatenate((np.full(20, -esu), e_lim * (c_control - h_t) / c_control))
+	return e_t, (e_c - e_t) / h_t
+
+def di_fibras(cover, core, As, esfuerzos, d, e_lim, y_control, esu, n_puntos=100):
+	"""
+	Calcula el diagrama de interacción nominal integrando la malla de fibras
+	con los modelos no lineales de hormigón y acero. Cada punto es un plano
+	de deformaciones límite:
+
+		- rotura del acero: la barra más traccionada en esu y la fibra de
+		  control desde tracción uniforme (esu) hasta e_lim
+		- aplastamiento del hormigón: la fibra de control en e_lim y la
+		  profundidad del eje neutro desde esa posición hasta compresión
+		  casi uniforme
 
-	return np.array(P_val) / 10**3, np.array(M_val) / 10**5, np.array(c_val)
+	Todos los planos se evalúan juntos como una matriz (planos x fibras).
+
+	Parámetros:
+		cover, core : arreglos [coord_i, A_i] de fibras de hormigón (malla)
+		As          : arreglo [coord_i, A_i] de capas de acero
+		esfuerzos   : funciones de esfuerzo de recubrimiento, núcleo y acero
+		              (compresión negativa, ver kernel_fibras)
+		d           : profundidad de la sección en la dirección de deformación
+		e_lim       : deformación de compresión límite (positiva)
+		y_control   : coordenada de la fibra donde se alcanza e_lim
+		esu         : deformación última del acero
+		n_puntos    : número de puntos del diagrama (al menos 42)
+
+	Retorna:
+		P, M, c, es_t : carga axial, momento, profundidad del eje neutro
+		medida desde el borde comprimido (0 con la sección en tracción) y
+		deformación de tracción de la barra más traccionada
+	"""
+	y_t = np.min(As[:, 0])
+	e_t, pendiente = _planos_fibras(d, e_lim, y_control - y_t, esu, n_puntos)
+
+	P = np.zeros(len(e_t))
+	M = np.zeros(len(e_t))
+	for g, esfuerzo in zip((cover, core, As), esfuerzos):
+		if len(g) == 0:
+			continue
+		y = np.asarray(g[:, 0], dtype=float)
+		A = np.asarray(g[:, 1], dtype=float)
+		# Fila i: plano i; columna j: fibra j
+		e = e_t[:, None] + pendiente[:, None] * (y[None, :] - y_t)
+		sigma = -esfuerzo(-e)
+		P += sigma @ A
+		M += sigma @ (A * y)
+
+	# Eje neutro: donde el plano se anula
+	comprimida = e_t + pendiente * (y_control - y_t) > 0
+	c = np.zeros(len(e_t))
+	c[comprimida] = d/2 - y_t + e_t[comprimida] / pendiente[comprimida]
+
+	n = len(c)
+	negativos = np.flatnonzero(M[1:] <= 0)
+	if len(negativos):
+		n = negativos[0] + 2
+
+	return P[:n] / 10**3, M[:n] / 10**5, c[:n], -e_t[:n]
 
 def factor_phi(As, d, e_cu, c, fy, Es):
 	"""
@@ -143,6 +290,12 @@ def factor_phi(As, d, e_cu, c, fy, Es):
 	c = np.asarray(c, dtype=float)
 
 	es_t = -e_cu * (c + d_t - d/2) / np.maximum(c, 1e-9)
+	return _phi_traccion(es_t, ey)
+
+def _phi_traccion(es_t, ey):
+	"""
+	phi según la deformación de tracción es_t del acero más traccionado.
+	"""
 	es_t = np.maximum(es_t, 0.0)
 
 	phi = np.where(es_t <= ey, 0.65,
@@ -172,6 +325,32 @@ def d_iteracion(b, h, r, de, nb_x, nb_y, d_corner, d_edge,
 	return P, M, c, phi_P, phi_M
 
 
+def d_iteracion_fibras(b, h, r, de, nb_x, nb_y, d_corner, d_edge, nf_x, nf_y,
+						fc0, fy, Es, esu, esfuerzos, e_lim, confinado, eje):
+	"""
+	Como d_iteracion, pero con el diagrama nominal por fibras (di_fibras).
+	Con confinado, e_lim se controla en el borde del núcleo confinado; si
+	no, en el borde comprimido de la sección.
+	"""
+	bw, d = prop_eje(b, h, eje)
+	As = barras_columna(b, h, r, de, nb_x, nb_y, d_corner, d_edge, eje)
+	cover, core = utilidades.malla(b, h, r, de, nf_x, nf_y, eje)
+
+	y_control = d/2 - (r + de/2) if confinado else d/2
+	P, M, c, es_t = di_fibras(cover, core, As, esfuerzos, d, e_lim, y_control, esu)
+	P0 = compresion_pura(bw, d, As, fc0, fy) / 1000
+	phi = _phi_traccion(es_t, fy/Es)
+
+	Pn_max = 0.80 * P0
+	phi_Pn_max = 0.65 * Pn_max
+
+	phi_P = np.minimum(phi * P, phi_Pn_max)
+	P = np.minimum(P, Pn_max)
+	phi_M = phi * M
+
+	return P, M, c, phi_P, phi_M
+
+
 def _f(datos, clave, default=None):
 	valor = datos.get(clave, default)
 	if valor is None or valor == "":
@@ -179,7 +358,71 @@ def _f(datos, clave, default=None):
 	return float(valor)
 
 
-def calcular_series_di(datos_hormigon, datos_acero, datos_seccion, eje):
+def clave_di(datos_hormigon, datos_acero, datos_seccion, eje, metodo="whitney",
+			datos_fibras=None, modelo_cover="hognestad", modelo_core="hognestad"):
+	"""
+	Clave de caché del diagrama de interacción.
+	"""
+	if metodo == "whitney":
+		return clave_canonica("di", datos_hormigon, datos_acero, datos_seccion, eje)
+	return clave_canonica("di", datos_hormigon, datos_acero, datos_seccion, eje,
+						metodo, datos_fibras, modelo_cover, modelo_core)
+
+def _esfuerzos_fibras(datos_hormigon, datos_acero, datos_seccion, modelo_cover, modelo_core):
+	"""
+	Funciones de esfuerzo (recubrimiento, núcleo, acero) de los modelos de
+	la curva M-φ y deformación límite del núcleo.
+	"""
+	# Import diferido: momento_curvatura_parche_sap importa este módulo
+	from kernel_fibras import material_hormigon, material_acero, deformacion_ultima, mander_c
+	from momento_curvatura_parche_sap import sigma_hormigon, _mander_confinado
+
+	fc0 = _f(datos_hormigon, "esfuerzo_fc")
+	Ec = _f(datos_hormigon, "modulo_Ec")
+	ec0 = _f(datos_hormigon, "def_max_sin_confinar")
+	esp = _f(datos_hormigon, "def_ultima_sin_confinar")
+
+	fy = _f(datos_acero, "esfuerzo_fy")
+	fsu = _f(datos_acero, "esfuerzo_ultimo_acero")
+	Es = _f(datos_acero, "modulo_Es")
+	ey = _f(datos_acero, "def_fluencia_acero")
+	esh = _f(datos_acero, "def_inicio_endurecimiento")
+	esu = _f(datos_acero, "def_ultima_acero")
+
+	sg_cover = sigma_hormigon(modelo_cover)
+	sg_core = sigma_hormigon(modelo_core)
+	datos_h = None
+	if mander_c in (sg_cover, sg_core):
+		datos_h = _mander_confinado(datos_hormigon, datos_acero, datos_seccion)
+
+	esfuerzos = (
+		material_hormigon(sg_cover, fc0, ec0, esp, Ec, datos_h)[0],
+		material_hormigon(sg_core, fc0, ec0, esp, Ec, datos_h)[0],
+		material_acero(fy, fsu, Es, ey, esh, esu)[0],
+	)
+	return esfuerzos, deformacion_ultima(sg_core, esp, datos_h), sg_core is mander_c
+
+def calcular_series_di(datos_hormigon, datos_acero, datos_seccion, eje, usar_cache=True,
+					metodo="whitney", datos_fibras=None, modelo_cover="hognestad",
+					modelo_core="hognestad"):
+	"""
+	Diagrama de interacción de la columna. Con usar_cache, si las entradas
+	coinciden con un cálculo previo se retorna el guardado en CACHE.
+	metodo: "whitney" (bloque equivalente y acero bilineal) o "fibras"
+	(malla de datos_fibras con los modelos modelo_cover / modelo_core y
+	acero de Park, ver di_fibras). Ambos retornan las mismas columnas.
+	"""
+	if metodo not in ("whitney", "fibras"):
+		raise ValueError(f"Método de diagrama de interacción no válido: {metodo}")
+
+	clave = None
+	if usar_cache:
+		clave = clave_di(datos_hormigon, datos_acero, datos_seccion, eje,
+						metodo, datos_fibras, modelo_cover, modelo_core)
+		guardado = CACHE.obtener(clave)
+		if guardado is not None:
+			return guardado
+
 	fc0 = _f(datos_hormigon, "esfuerzo_fc")
 	e_cu = _f(datos_hormigon, "def_ultima_sin_confinar", 0.003)
 
@@ -197,10 +440,23 @@ def calcular_series_di(datos_hormigon, datos_acero, datos_seccion, eje):
 
 	eje = eje.strip().lower()
 
-	P, M, c, phi_P, phi_M = d_iteracion(
-		b, h, r, de, nb_x, nb_y, d_corner, d_edge,
-		fc0, e_cu, fy, Es, eje
-	)
+	if metodo == "fibras":
+		nf_x = int(_f(datos_fibras, "fibras_x"))
+		nf_y = int(_f(datos_fibras, "fibras_y"))
+		esu = _f(datos_acero, "def_ultima_acero")
+		esfuerzos, e_lim, confinado = _esfuerzos_fibras(
+			datos_hormigon, datos_acero, datos_seccion,
+			modelo_cover.strip().lower(), modelo_core.strip().lower()
+		)
+		P, M, c, phi_P, phi_M = d_iteracion_fibras(
+			b, h, r, de, nb_x, nb_y, d_corner, d_edge, nf_x, nf_y,
+			fc0, fy, Es, esu, esfuerzos, e_lim, confinado, eje
+		)
+	else:
+		P, M, c, phi_P, phi_M = d_iteracion(
+			b, h, r, de, nb_x, nb_y, d_corner, d_edge,
+			fc0, e_cu, fy, Es, eje
+		)
 
 	di_series = {
 		"sin_phi": (M, P),
@@ -209,4 +465,7 @@ def calcular_series_di(datos_hormigon, datos_acero, datos_seccion, eje):
 
 	di_matriz = np.column_stack([c, phi_M, phi_P, M, P])
 
+	if clave is not None:
+		CACHE.guardar(clave, (di_matriz, di_series))
+
 	return di_matriz, di_series
\ No newline at end of file
@@ -0,0 +1,866 @@
+import copy
+import time
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+from materiales import modelos, ManderConfinado
+
+park = modelos.park
+hognestad = modelos.hognestad
+mander_u = modelos.mander_u
+mander_c = modelos.mander_c
+
+
+def tangente_material(sigma):
+    """
+    Retorna el módulo tangente asociado a un modelo constitutivo de modelos.
+    """
+    tangentes = {
+        park: modelos.park_tangente,
+        hognestad: modelos.hognestad_tangente,
+        mander_u: modelos.mander_u_tangente,
+        mander_c: modelos.mander_c_tangente,
+    }
+    return tangentes[sigma]
+
+
+def material_hormigon(sigma_c, fc0, ec0, esp, Ec, datos_h=None):
+    """
+    Fija los parámetros de un modelo de hormigón. Para mander_c con un
+    ManderConfinado ya construido se usan directamente sus métodos.
+
+    Retorna:
+        (esfuerzo, tangente) : funciones de una sola variable, la deformación
+    """
+    if sigma_c is mander_c and isinstance(datos_h, ManderConfinado):
+        return datos_h.esfuerzo, datos_h.tangente
+
+    tangente_c = tangente_material(sigma_c)
+
+    def esfuerzo(ec):
+        return sigma_c(ec, fc0, ec0, esp, Ec, datos_h, 1)
+
+    def tangente(ec):
+        return tangente_c(ec, fc0, ec0, esp, Ec, datos_h, 1)
+
+    return esfuerzo, tangente
+
+
+def deformacion_ultima(sigma_c, esp, datos_h=None):
+    """
+    Deformación última (positiva) de un modelo de hormigón: ecu para
+    mander_c, esp para hognestad y mander_u.
+    """
+    if sigma_c is mander_c:
+        return float(datos_h.ecu if isinstance(datos_h, ManderConfinado) else datos_h[11])
+    return float(esp)
+
+
+def tramos_hormigon(sigma_c, fc0, ec0, esp, Ec, datos_h=None):
+    """
+    Ramas del modelo de hormigón en deformación (compresión negativa); cada
+    rama vale para e_min <= e < e_max y fuera de ellas el esfuerzo es cero.
+
+    Retorna:
+        tupla de (e_min, e_max, coeficientes); coeficientes = (a0, a1, a2)
+        si en la rama sigma = a0 + a1*e + a2*e**2, o None si la rama no es
+        polinómica (curvas de Mander)
+    """
+    if sigma_c is hognestad:
+        m = 0.15 * fc0 / (esp - ec0)
+        tramos = (
+            (-ec0, 0.0, (0.0, 2 * fc0 / ec0, fc0 / ec0 ** 2)),
+            (-esp, -ec0, (-fc0 - m * ec0, -m, 0.0)),
+        )
+    elif sigma_c is mander_u:
+        ec00 = 2 * ec0
+        r = Ec / (Ec - fc0 / ec0)
+        k = fc0 * (2 * r) / (r - 1 + 2 ** r) / (esp - ec00)
+        tramos = (
+            (-ec00, 0.0, None),
+            (-esp, -ec00, (-k * esp, -k, 0.0)),
+        )
+    elif sigma_c is mander_c:
+        tramos = ((-deformacion_ultima(sigma_c, esp, datos_h), 0.0, None),)
+    else:
+        raise ValueError("Modelo de hormigón sin tramos definidos")
+    return tuple((float(a), float(b), coef) for a, b, coef in tramos if a < b)
+
+
+def material_acero(fy, fsu, Es, ey, esh, esu):
+    """
+    Fija los parámetros del modelo de Park.
+
+    Retorna:
+        (esfuerzo, tangente) : funciones de una sola variable, la deformación
+    """
+    def esfuerzo(es):
+        return park(es, fy, fsu, Es, ey, esh, esu)
+
+    def tangente(es):
+        return modelos.park_tangente(es, fy, fsu, Es, ey, esh, esu)
+
+    return esfuerzo, tangente
+
+
+def quiebres_hormigon(sigma_c, fc0, ec0, esp, Ec, datos_h=None):
+    """
+    Deformaciones de cambio de rama (y pico) de un modelo de hormigón:
+    ec0, 2·ec0, esp o ecu según el modelo, y ecc en Mander confinado.
+    """
+    quiebres = {e for tramo in tramos_hormigon(sigma_c, fc0, ec0, esp, Ec, datos_h) for e in tramo[:2]}
+    if sigma_c is mander_c:
+        quiebres.add(-ManderConfinado.desde(fc0, ec0, esp, Ec, datos_h).ecc)
+    else:
+        quiebres.add(-ec0)
+    return sorted(quiebres)
+
+
+def quiebres_acero(ey, esh, esu):
+    """Deformaciones de cambio de rama del modelo de Park: ±ey, ±esh, ±esu."""
+    return sorted({0.0, ey, -ey, esh, -esh, esu, -esu})
+
+
+class MaterialTabulado:
+    """
+    Modelo constitutivo muestreado en una malla adaptativa de deformaciones
+    y evaluado por interpolación lineal (np.interp), sin máscaras por rama
+    ni potencias.
+
+    La malla contiene exactamente cada deformación de quiebre y sus vecinas
+    inmediatas en punto flotante, de modo que los saltos (fin de rama,
+    rotura) se reproducen sin error. Entre quiebres se parte cada intervalo
+    por la mitad hasta que la interpolación del esfuerzo difiere del modelo
+    en menos de tol·max|σ|, comprobado en puntos interiores de cada
+    intervalo; la tangente se interpola sobre la misma malla. Fuera de la
+    malla el esfuerzo y la tangente valen lo que el modelo en sus extremos
+    (cero en los modelos de este módulo).
+
+    Atributos:
+        e, sigma, Et : malla y valores tabulados
+        escala       : max|σ| del modelo en la malla
+        error_max    : mayor error de esfuerzo medido en la verificación
+        error_relativo : error_max / escala
+    """
+
+    PUNTOS_CONTROL = 3        # puntos interiores por intervalo durante el refinamiento
+    PUNTOS_VERIFICACION = 15  # puntos interiores por intervalo en la verificación final
+    MAX_PASADAS = 40
+
+    def __init__(self, esfuerzo, tangente, quiebres, tol=1e-4, nodos_iniciales=8):
+        """
+        Parámetros:
+            esfuerzo, tangente : funciones vectorizadas de la deformación
+            quiebres : deformaciones de cambio de rama; el primero y el último
+                       delimitan la malla
+            tol      : error de esfuerzo admitido, relativo a max|σ|
+        """
+        self.modelo = (esfuerzo, tangente)
+        self.tol = float(tol)
+        quiebres = np.unique(np.asarray(quiebres, dtype=float))
+
+        # Nodos iniciales: cada quiebre, sus vecinos y una malla uniforme entre quiebres
+        tramos = [np.linspace(a, b, nodos_iniciales + 1) for a, b in zip(quiebres[:-1], quiebres[1:])]
+        vecinos = np.concatenate((np.nextafter(quiebres, -np.inf), np.nextafter(quiebres, np.inf)))
+        e = np.unique(np.concatenate(tramos + [quiebres, vecinos]))
+        sigma = esfuerzo(e)
+        self.escala = float(np.abs(sigma).max()) or 1.0
+        limite = self.tol * self.escala
+
+        fracciones_control = np.arange(1, self.PUNTOS_CONTROL + 1) / (self.PUNTOS_CONTROL + 1)
+        fracciones_verificacion = np.arange(1, self.PUNTOS_VERIFICACION + 1) / (self.PUNTOS_VERIFICACION + 1)
+        # Intervalos de ancho punto flotante (quiebre y su vecino): toda
+        # deformación dentro de ellos es uno de sus nodos, sin error
+        self._ancho_min = 1e-12 * max(1.0, float(np.abs(e).max()))
+        for _ in range(self.MAX_PASADAS):
+            partir = self._error_intervalos(e, sigma, fracciones_control) > limite
+            if not partir.any():
+                # Verificación con más puntos; si falla, se sigue refinando
+                partir = self._error_intervalos(e, sigma, fracciones_verificacion) > limite
+            if not partir.any():
+                break
+            nuevos = 0.5 * (e[:-1][partir] + e[1:][partir])
+            posicion = np.flatnonzero(partir) + 1
+            e = np.insert(e, posicion, nuevos)
+            sigma = np.insert(sigma, posicion, esfuerzo(nuevos))
+
+        self.e = e
+        self.sigma = sigma
+        self.Et = tangente(e)
+        self.error_max = float(self._error_intervalos(e, sigma, fracciones_verificacion).max())
+        self.error_relativo = self.error_max / self.escala
+
+    def _error_intervalos(self, e, sigma, fracciones):
+        # Mayor error de interpolación de cada intervalo en las fracciones dadas
+        ancho = np.diff(e)
+        x = e[:-1, None] + ancho[:, None] * fracciones[None, :]
+        exacto = self.modelo[0](x)
+        interpolado = sigma[:-1, None] + (sigma[1:] - sigma[:-1])[:, None] * fracciones[None, :]
+        error = np.abs(exacto - interpolado).max(axis=1)
+        error[ancho <= self._ancho_min] = 0.0
+        return error
+
+    def esfuerzo(self, e):
+        return np.interp(e, self.e, self.sigma)
+
+    def tangente(self, e):
+        return np.interp(e, self.e, self.Et)
+
+    def informe(self, muestras=64, repeticiones=2000):
+        """
+        Nodos, error alcanzado y aceleración del esfuerzo tabulado frente al
+        modelo, medida en un vector de muestras deformaciones del rango de
+        la malla.
+
+        Retorna:
+            dict con "nodos", "error_max", "error_relativo" y "aceleracion"
+        """
+        e = np.linspace(self.e[0], self.e[-1], muestras)
+        tiempos = []
+        for funcion in (self.modelo[0], self.esfuerzo):
+            t0 = time.perf_counter()
+            for _ in range(repeticiones):
+                funcion(e)
+            tiempos.append(time.perf_counter() - t0)
+        return {
+            "nodos": len(self.e),
+            "error_max": self.error_max,
+            "error_relativo": self.error_relativo,
+            "aceleracion": tiempos[0] / tiempos[1],
+        }
+
+
+def tabular_materiales(materiales, quiebres, tol=1e-4):
+    """
+    Reemplaza cada par (esfuerzo, tangente) por el de un MaterialTabulado.
+
+    Retorna:
+        (materiales, tablas) : los pares tabulados y los MaterialTabulado
+    """
+    tablas = [MaterialTabulado(esfuerzo, tangente, q, tol) for (esfuerzo, tangente), q in zip(materiales, quiebres)]
+    return tuple((t.esfuerzo, t.tangente) for t in tablas), tablas
+
+
+class FiberSection:
+    """
+    Sección de fibras empaquetada una sola vez para el solver M-φ.
+
+    Guarda en arreglos contiguos la coordenada y, el área A y el producto
+    A*y de todas las fibras (recubrimiento, núcleo y acero, en ese orden),
+    el identificador de material de cada fibra y buffers de trabajo que se
+    reutilizan en cada evaluación.
+
+    Convención (igual que resultantes): deformación eps = -phi * (y - c),
+    compresión negativa, y N se retorna ya descontada la carga axial P.
+
+    Las fibras de hormigón se guardan ordenadas por y dentro de cada grupo.
+    Como los modelos de hormigón dan esfuerzo nulo en tracción y más allá
+    del último tramo (tramos_hormigon), en cada evaluación solo se calcula
+    el rango contiguo de fibras comprimidas y sin aplastar, ubicado con
+    searchsorted a partir de c y phi.
+
+    Con integracion="exacta" las fibras de hormigón son franjas
+    rectangulares [coord_i, A_i, t_i] que se integran con Gauss-Legendre
+    en cada tramo del modelo (las franjas se parten en las deformaciones
+    de cambio de rama): 2 puntos por tramo bastan para las ramas
+    polinómicas (Hognestad y ramas lineales), que quedan integradas de
+    forma exacta; las curvas de Mander usan ORDEN_CUADRATURA puntos. El
+    acero sigue como capas puntuales.
+
+    Con integracion="prefijos" la integral es la misma que con "fibras",
+    pero en los grupos de hormigón con ramas polinómicas (Hognestad) se
+    evalúa con tablas de sumas prefijas de A, A*y, A*y² y A*y³ sobre las
+    fibras ordenadas por y: cada rama es un rango contiguo de fibras que
+    se ubica con searchsorted, así que N y M cuestan O(log n) por
+    evaluación. Los grupos con ramas no polinómicas (Mander) y el acero se
+    suman fibra a fibra.
+
+    Con desde_parametros(..., tabulado=tol) los modelos se evalúan por
+    interpolación en tablas (MaterialTabulado) en lugar de sus fórmulas.
+
+    Métodos:
+        - N(c, phi), M(c, phi), NM(c, phi): resultantes para un par (c, phi)
+        - NM_lote(c, phi): resultantes para vectores de c y/o phi
+        - N_tangente(c, phi): N y su derivada analítica dN/dc
+        - deformacion_acero(c, phi): deformaciones de las capas de acero
+        - y_extremo(grupo): fibra extrema comprimida de un grupo
+        - con_carga(P): la misma sección con otra carga axial
+    """
+
+    COVER, CORE, ACERO = 0, 1, 2
+    ORDEN_CUADRATURA = 8
+
+    def __init__(self, cover, core, As, materiales, P=0.0, h=None, esu=np.inf,
+                 deformaciones_ultimas=None, integracion="fibras", tramos=None):
+        """
+        Parámetros:
+            cover, core : arreglos [coord_i, A_i] de fibras de hormigón
+            As          : arreglo [coord_i, A_i] de capas de acero
+            materiales  : tres pares (esfuerzo, tangente) para recubrimiento,
+                          núcleo y acero
+            P           : carga axial
+            h           : altura de la sección en la dirección de análisis
+            esu         : deformación última del acero
+            deformaciones_ultimas : deformaciones últimas (positivas) de
+                          recubrimiento, núcleo y acero
+            integracion : "fibras" (punto medio por fibra), "prefijos"
+                          (misma integral con tablas de momentos) o
+                          "exacta" (franjas; cover y core con la columna t_i)
+            tramos      : tramos_hormigon de recubrimiento y núcleo;
+                          requeridos con integracion "prefijos" o "exacta".
+                          Con "fibras" son opcionales: fijan hasta qué
+                          deformación se evalúa el hormigón
+        """
+        # Hormigón ordenado por y: las fibras comprimidas forman un rango contiguo
+        grupos = tuple(
+            g[np.argsort(g[:, 0], kind="stable")] if k != self.ACERO and len(g) else g
+            for k, g in enumerate((cover, core, As))
+        )
+        tamanos = [len(g) for g in grupos]
+
+        self.y = np.ascontiguousarray(np.concatenate([g[:, 0] for g in grupos]), dtype=float)
+        self.A = np.ascontiguousarray(np.concatenate([g[:, 1] for g in grupos]), dtype=float)
+        self.Ay = self.A * self.y
+        self._y_lista = self.y.tolist()
+        self.material = np.repeat(np.arange(3, dtype=np.int8), tamanos)
+
+        self.P = float(P)
+        self.h = float(h) if h is not None else float(np.ptp(self.y))
+        self.esu = float(esu)
+        if deformaciones_ultimas is None:
+            deformaciones_ultimas = (np.inf, np.inf, self.esu)
+        self.deformaciones_ultimas = tuple(float(e) for e in deformaciones_ultimas)
+
+        # Deformación (positiva) más allá de la cual el hormigón no tiene
+        # esfuerzo, según sus tramos; sin tramos solo se omite la tracción
+        self._aplastamiento = tuple(
+            -min(e_min for e_min, _, _ in tramos[k]) if tramos is not None else np.inf
+            for k in (self.COVER, self.CORE)
+        ) + (None,)
+
+        # (fibras, esfuerzo, tangente, aplastamiento); None en el acero, que
+        # se evalúa completo
+        limites = np.concatenate(([0], np.cumsum(tamanos)))
+        self._tramos = [
+            (slice(limites[k], limites[k + 1]), materiales[k][0], materiales[k][1], self._aplastamiento[k])
+            for k in range(3) if tamanos[k] > 0
+        ]
+        self._acero = slice(limites[2], limites[3])
+        self._grupos = [slice(limites[k], limites[k + 1]) for k in range(3)]
+        self.evaluaciones = 0
+        self.materiales_tabulados = None
+
+        n = len(self.y)
+        self._eps = np.empty(n, dtype=float)
+
+        # Coordenada del borde más comprimido de cada fibra (el centro, salvo franjas)
+        self._y_borde = self.y.copy()
+        self.integracion = integracion
+        self._integrador = None
+        if integracion not in ("fibras", "prefijos", "exacta"):
+            raise ValueError(f"Integración no válida: {integracion}")
+        if integracion != "fibras" and tramos is None:
+            raise ValueError(f"La integración '{integracion}' requiere los tramos de los modelos de hormigón")
+        if integracion == "exacta":
+            self._preparar_franjas(grupos, materiales, tramos)
+        elif integracion == "prefijos":
+            self._preparar_prefijos(materiales, tramos)
+
+    def _preparar_franjas(self, grupos, materiales, tramos):
+        self._integrador = self._integrar_franjas
+        self._franjas = []
+        for k in (self.COVER, self.CORE):
+            g = grupos[k]
+            if len(g) == 0:
+                continue
+            if g.shape[1] < 3:
+                raise ValueError("La integración exacta requiere franjas [coord_i, A_i, t_i] (malla con franjas=True)")
+            y, A, t = (np.asarray(g[:, j], dtype=float) for j in range(3))
+            self._y_borde[self._grupos[k]] = y + t / 2
+            quiebres = np.unique([e for a, b, _ in tramos[k] for e in (a, b)])
+            polinomico = all(coef is not None for _, _, coef in tramos[k])
+            nodos, pesos = np.polynomial.legendre.leggauss(2 if polinomico else self.ORDEN_CUADRATURA)
+            self._franjas.append((
+                y - t / 2, y + t / 2, A / t, quiebres, nodos, pesos,
+                materiales[k][0], materiales[k][1],
+            ))
+        self._directos = [(self._acero, *materiales[self.ACERO], None)]
+
+    def _preparar_prefijos(self, materiales, tramos):
+        self._integrador = self._integrar_prefijos
+        self._tablas = []
+        self._directos = [(self._acero, *materiales[self.ACERO], None)]
+        for k in (self.COVER, self.CORE):
+            grupo = self._grupos[k]
+            if grupo.stop == grupo.start:
+                continue
+            if not all(coef is not None for _, _, coef in tramos[k]):
+                self._directos.append((grupo, *materiales[k], self._aplastamiento[k]))
+                continue
+            orden = np.argsort(self.y[grupo], kind="stable")
+            y = self.y[grupo][orden]
+            A = self.A[grupo][orden]
+            # S[j, i] = suma de A*y**j de las primeras i fibras
+            S = np.zeros((4, len(y) + 1))
+            np.cumsum(np.vstack([A * y ** j for j in range(4)]), axis=1, out=S[:, 1:])
+            # Listas de Python para la evaluación escalar (bisect, sin numpy)
+            self._tablas.append((y, S, y.tolist(), S.tolist(), tramos[k]))
+
+        # Sin ramas polinómicas no hay nada que tabular: suma fibra a fibra
+        if not self._tablas:
+            self._integrador = None
+
+    @classmethod
+    def desde_parametros(cls, cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu,
+                         P, datos_h, sg_cover, sg_core, h=None, integracion="fibras", tabulado=None):
+        """
+        Construye la sección a partir de los mismos datos que recibe resultantes.
+        Con tabulado = tol los tres materiales se reemplazan por
+        MaterialTabulado con esa tolerancia relativa de esfuerzo; quedan en
+        el atributo materiales_tabulados (recubrimiento, núcleo, acero).
+        """
+        materiales = (
+            material_hormigon(sg_cover, fc0, ec0, esp, Ec, datos_h),
+            material_hormigon(sg_core, fc0, ec0, esp, Ec, datos_h),
+            material_acero(fy, fsu, Es, ey, esh, esu),
+        )
+        tablas = None
+        if tabulado is not None:
+            quiebres = (
+                quiebres_hormigon(sg_cover, fc0, ec0, esp, Ec, datos_h),
+                quiebres_hormigon(sg_core, fc0, ec0, esp, Ec, datos_h),
+                quiebres_acero(ey, esh, esu),
+            )
+            materiales, tablas = tabular_materiales(materiales, quiebres, tabulado)
+        ultimas = (
+            deformacion_ultima(sg_cover, esp, datos_h),
+            deformacion_ultima(sg_core, esp, datos_h),
+            esu,
+        )
+        tramos = (
+            tramos_hormigon(sg_cover, fc0, ec0, esp, Ec, datos_h),
+            tramos_hormigon(sg_core, fc0, ec0, esp, Ec, datos_h),
+        )
+        seccion = cls(cover, core, As, materiales, P=P, h=h, esu=esu, deformaciones_ultimas=ultimas,
+                      integracion=integracion, tramos=tramos)
+        seccion.materiales_tabulados = tablas
+        return seccion
+
+    def con_carga(self, P):
+        """
+        Copia de la sección con otra carga axial P. La malla, los materiales
+        y las tablas son de solo lectura y se comparten; solo se duplican
+        los buffers de trabajo y el contador de evaluaciones.
+        """
+        seccion = copy.copy(self)
+        seccion.P = float(P)
+        seccion.evaluaciones = 0
+        seccion._eps = np.empty_like(self._eps)
+        if self._integrador is not None:
+            seccion._integrador = getattr(seccion, self._integrador.__name__)
+        return seccion
+
+    @property
+    def y_acero(self):
+        return self.y[self._acero]
+
+    def y_extremo(self, grupo):
+        """
+        Coordenada de la fibra más comprimida (mayor y) de un grupo
+        (COVER, CORE o ACERO); None si el grupo está vacío. Con franjas,
+        el borde superior de la franja extrema.
+        """
+        y = self._y_borde[self._grupos[grupo]]
+        return float(np.max(y)) if len(y) else None
+
+    def _activas(self, tramo, limite, c, phi):
+        """
+        Rango de fibras de un grupo de hormigón (ordenado por y) que están
+        comprimidas y sin aplastar, 0 <= -eps <= limite; fuera de él los
+        modelos de hormigón dan esfuerzo y tangente nulos. En el acero
+        (limite None) retorna el grupo completo.
+        """
+        if limite is None:
+            return tramo
+        # Margen relativo en el borde de aplastamiento: las fibras dudosas
+        # por redondeo quedan dentro y el modelo les da el esfuerzo correcto
+        if phi > 0:
+            desde, hasta = c, c + limite * (1 + 1e-9) / phi
+        elif phi < 0:
+            desde, hasta = c + limite * (1 + 1e-9) / phi, c
+        else:
+            desde = hasta = c
+        return slice(bisect_left(self._y_lista, desde, tramo.start, tramo.stop),
+                     bisect_right(self._y_lista, hasta, tramo.start, tramo.stop))
+
+    def _activas_lote(self, tramo, limite, c, phi):
+        """
+        Unión de los rangos de _activas para arreglos de c y phi.
+        """
+        if limite is None:
+            return tramo
+        alcance = np.divide(limite * (1 + 1e-9), phi, out=np.zeros_like(phi), where=phi != 0)
+        y = self.y[tramo]
+        inicio = int(np.searchsorted(y, np.minimum(c, c + alcance), side="left").min())
+        fin = int(np.searchsorted(y, np.maximum(c, c + alcance), side="right").max())
+        return slice(tramo.start + inicio, tramo.start + max(inicio, fin))
+
+    def _resultantes(self, c, phi, con_tangente=False):
+        """
+        Suma por fibras: retorna N (sin descontar P), M y sum(Et_i * A_i)
+        (cero si no se pide la tangente). En el hormigón solo se evalúa el
+        rango activo.
+        """
+        N = M = K = 0.0
+        for tramo, esfuerzo, tangente, limite in self._tramos:
+            activas = self._activas(tramo, limite, c, phi)
+            if activas.stop == activas.start:
+                continue
+            eps = self._eps[activas]
+            np.subtract(self.y[activas], c, out=eps)
+            eps *= -phi
+            sigma = esfuerzo(eps)
+            A = self.A[activas]
+            N += float(np.dot(sigma, A))
+            M += float(np.dot(sigma, self.Ay[activas]))
+            if con_tangente:
+                K += float(np.dot(tangente(eps), A))
+        self.evaluaciones += 1
+        return N, M, K
+
+    def _integrar_franjas(self, c, phi, con_tangente=False):
+        """
+        Resultantes con franjas para arreglos 1D c y phi (un candidato por
+        posición): retorna N (sin descontar P), M y, si se pide, dN/dc.
+        """
+        m = len(c)
+        N = np.zeros(m)
+        M = np.zeros(m)
+        dN = np.zeros(m) if con_tangente else None
+        c4 = c[:, None, None, None]
+        phi4 = phi[:, None, None, None]
+
+        # 1/phi (0 si phi = 0: deformación nula, no hace falta partir)
+        inv_phi = np.divide(1.0, phi, out=np.zeros(m), where=phi != 0)
+
+        for y_inf, y_sup, ancho, quiebres, nodos, pesos, esfuerzo, tangente in self._franjas:
+            # Bordes de los tramos de cada franja (candidato, franja, tramo):
+            # los bordes de la franja y las coordenadas donde la deformación
+            # cruza un cambio de rama, recortadas a la franja
+            bordes = np.empty((m, len(y_inf), len(quiebres) + 2))
+            bordes[:, :, 0] = y_inf
+            bordes[:, :, -1] = y_sup
+            interiores = bordes[:, :, 1:-1]
+            y_k = c[:, None] - quiebres[None, :] * inv_phi[:, None]
+            np.maximum(y_k[:, None, :], y_inf[None, :, None], out=interiores)
+            np.minimum(interiores, y_sup[None, :, None], out=interiores)
+            bordes.sort(axis=2)
+            medio = 0.5 * (bordes[..., 1:] - bordes[..., :-1])
+            centro = 0.5 * (bordes[..., 1:] + bordes[..., :-1])
+
+            y_q = centro[..., None] + medio[..., None] * nodos
+            A_q = (ancho[None, :, None, None] * medio[..., None]) * pesos
+            eps = -phi4 * (y_q - c4)
+            sA = esfuerzo(eps) * A_q
+            N += sA.reshape(m, -1).sum(axis=1)
+            M += (sA * y_q).reshape(m, -1).sum(axis=1)
+            if con_tangente:
+                dN += phi * (tangente(eps) * A_q).reshape(m, -1).sum(axis=1)
+
+        self._sumar_directos(c, phi, N, M, dN)
+        self.evaluaciones += m
+        return N, M, dN
+
+    def _integrar_prefijos(self, c, phi, con_tangente=False):
+        """
+        Resultantes con tablas de momentos para arreglos 1D c y phi:
+        retorna N (sin descontar P), M y, si se pide, dN/dc.
+        """
+        m = len(c)
+        if m == 1:
+            return self._prefijos_escalar(float(c[0]), float(phi[0]), con_tangente)
+        N = np.zeros(m)
+        M = np.zeros(m)
+        dN = np.zeros(m) if con_tangente else None
+
+        # eps = alfa + beta*y; con phi = 0 la deformación es nula y los
+        # límites de cada rama colapsan en y = c
+        alfa = phi * c
+        beta = -phi
+        inv_phi = np.divide(1.0, phi, out=np.zeros(m), where=phi != 0)
+        positiva = phi > 0
+
+        for y, S, _, _, tramos in self._tablas:
+            for e_min, e_max, (a0, a1, a2) in tramos:
+                # Rango de fibras con e_min <= eps < e_max
+                y_max = c - e_max * inv_phi
+                y_min = c - e_min * inv_phi
+                i0 = np.where(positiva, np.searchsorted(y, y_max, side="right"),
+                              np.searchsorted(y, y_min, side="left"))
+                i1 = np.where(positiva, np.searchsorted(y, y_min, side="right"),
+                              np.searchsorted(y, y_max, side="left"))
+                D = S[:, i1] - S[:, i0]
+
+                # sigma = b0 + b1*y + b2*y**2 sobre el rango
+                b0 = a0 + (a1 + a2 * alfa) * alfa
+                b1 = (a1 + 2 * a2 * alfa) * beta
+                b2 = a2 * beta * beta
+                N += b0 * D[0] + b1 * D[1] + b2 * D[2]
+                M += b0 * D[1] + b1 * D[2] + b2 * D[3]
+                if con_tangente:
+                    dN += phi * ((a1 + 2 * a2 * alfa) * D[0] + 2 * a2 * beta * D[1])
+
+        self._sumar_directos(c, phi, N, M, dN)
+        self.evaluaciones += m
+        return N, M, dN
+
+    def _prefijos_escalar(self, c, phi, con_tangente):
+        # Misma cuenta que _integrar_prefijos para un solo (c, phi): con
+        # escalares de Python y bisect el costo no depende del número de fibras
+        N = M = dN = 0.0
+        alfa = phi * c
+        beta = -phi
+        inv_phi = 1.0 / phi if phi != 0 else 0.0
+
+        for _, _, y, (S0, S1, S2, S3), tramos in self._tablas:
+            for e_min, e_max, (a0, a1, a2) in tramos:
+                y_max = c - e_max * inv_phi
+                y_min = c - e_min * inv_phi
+                if phi > 0:
+                    i0, i1 = bisect_right(y, y_max), bisect_right(y, y_min)
+                else:
+                    i0, i1 = bisect_left(y, y_min), bisect_left(y, y_max)
+                if i1 <= i0:
+                    continue
+                D0, D1, D2, D3 = S0[i1] - S0[i0], S1[i1] - S1[i0], S2[i1] - S2[i0], S3[i1] - S3[i0]
+
+                b0 = a0 + (a1 + a2 * alfa) * alfa
+                b1 = (a1 + 2 * a2 * alfa) * beta
+                b2 = a2 * beta * beta
+                N += b0 * D0 + b1 * D1 + b2 * D2
+                M += b0 * D1 + b1 * D2 + b2 * D3
+                if con_tangente:
+                    dN += phi * ((a1 + 2 * a2 * alfa) * D0 + 2 * a2 * beta * D1)
+
+        N, M = np.array([N]), np.array([M])
+        dN = np.array([dN]) if con_tangente else None
+        c, phi = np.array([c]), np.array([phi])
+        self._sumar_directos(c, phi, N, M, dN)
+        self.evaluaciones += 1
+        return N, M, dN
+
+    def _sumar_directos(self, c, phi, N, M, dN):
+        # Suma fibra a fibra de los grupos que no pasan por el integrador
+        for grupo, esfuerzo, tangente, limite in self._directos:
+            grupo = self._activas_lote(grupo, limite, c, phi)
+            y = self.y[grupo]
+            if not len(y):
+                continue
+            eps = -phi[:, None] * (y[None, :] - c[:, None])
+            sigma = esfuerzo(eps)
+            N += sigma @ self.A[grupo]
+            M += sigma @ self.Ay[grupo]
+            if dN is not None:
+                dN += phi * (tangente(eps) @ self.A[grupo])
+
+    def _NM_integrador(self, c, phi):
+        N, M, _ = self._integrador(np.array([c], dtype=float), np.array([phi], dtype=float))
+        return float(N[0]) - self.P, float(M[0])
+
+    def N(self, c, phi):
+        if self._integrador is not None:
+            return self._NM_integrador(c, phi)[0]
+        return self._resultantes(c, phi)[0] - self.P
+
+    def M(self, c, phi):
+        if self._integrador is not None:
+            return self._NM_integrador(c, phi)[1]
+        return self._resultantes(c, phi)[1]
+
+    def NM(self, c, phi):
+        if self._integrador is not None:
+            return self._NM_integrador(c, phi)
+        N, M, _ = self._resultantes(c, phi)
+        return N - self.P, M
+
+    def NM_lote(self, c, phi):
+        """
+        Resultantes para un lote de candidatos: una sola matriz de
+        deformaciones (candidatos x fibras).
+        """
+        c, phi = np.broadcast_arrays(np.atleast_1d(np.asarray(c, dtype=float)),
+                                     np.atleast_1d(np.asarray(phi, dtype=float)))
+        if self._integrador is not None:
+            N, M, _ = self._integrador(c, phi)
+            return N - self.P, M
+        N = np.zeros(len(c))
+        M = np.zeros(len(c))
+        for tramo, esfuerzo, _, limite in self._tramos:
+            activas = self._activas_lote(tramo, limite, c, phi)
+            eps = np.subtract.outer(c, self.y[activas])
+            eps *= phi[:, None]
+            sigma = esfuerzo(eps)
+            N += sigma @ self.A[activas]
+            M += sigma @ self.Ay[activas]
+        self.evaluaciones += len(c)
+        return N - self.P, M
+
+    def N_tangente(self, c, phi):
+        """
+        Retorna (N, dN/dc) con dN/dc = phi * sum(Et_i * A_i).
+        """
+        if self._integrador is not None:
+            N, _, dN = self._integrador(np.array([c], dtype=float), np.array([phi], dtype=float),
+                                        con_tangente=True)
+            return float(N[0]) - self.P, float(dN[0])
+        N, _, K = self._resultantes(c, phi, con_tangente=True)
+        return N - self.P, phi * K
+
+    def deformacion_acero(self, c, phi):
+        return -phi * (self.y_acero - c)
+
+
+class FiberSection2D:
+    """
+    Sección de fibras 2D para flexión biaxial: cada fibra de hormigón y
+    cada barra guarda su posición (x, y) y su área.
+
+    El eje neutro forma un ángulo theta con el eje x: la deformación es
+    eps = -phi * (u - c) con u = x*sin(theta) + y*cos(theta), así que
+    theta = 0 equivale al análisis con eje "x" (u = y) y theta = pi/2 al
+    análisis con eje "y" (u = x). Las resultantes se evalúan para
+    vectores de (c, phi, theta) con una sola matriz (candidatos x fibras),
+    de modo que muchos ángulos se resuelven a la vez.
+
+    Métodos:
+        - resultantes(c, phi, theta): N (descontada P), Mx = sum(sigma*A*y)
+          y My = sum(sigma*A*x), con el mismo signo que FiberSection.M
+        - u_extremo(theta, grupo): fibra extrema comprimida de un grupo
+        - deformacion_acero(c, phi, theta): deformaciones de las barras
+        - proyectar(theta): FiberSection 1D para un ángulo fijo
+    """
+
+    COVER, CORE, ACERO = 0, 1, 2
+
+    def __init__(self, cover, core, As, materiales, P=0.0, esu=np.inf,
+                 deformaciones_ultimas=None, tramos=None):
+        """
+        Parámetros:
+            cover, core : arreglos [x_i, y_i, A_i] de fibras de hormigón
+            As          : arreglo [x_i, y_i, A_i] de barras de acero
+            materiales, P, esu, deformaciones_ultimas, tramos : como en
+                          FiberSection
+        """
+        grupos = (cover, core, As)
+        tamanos = [len(g) for g in grupos]
+
+        self.x = np.ascontiguousarray(np.concatenate([g[:, 0] for g in grupos]), dtype=float)
+        self.y = np.ascontiguousarray(np.concatenate([g[:, 1] for g in grupos]), dtype=float)
+        self.A = np.ascontiguousarray(np.concatenate([g[:, 2] for g in grupos]), dtype=float)
+        self.Ax = self.A * self.x
+        self.Ay = self.A * self.y
+
+        limites = np.concatenate(([0], np.cumsum(tamanos)))
+        self._grupos = [slice(limites[k], limites[k + 1]) for k in range(3)]
+        self._tramos = [
+            (self._grupos[k], materiales[k][0], materiales[k][1]) for k in range(3) if tamanos[k] > 0
+        ]
+        self._acero = self._grupos[self.ACERO]
+        self._materiales = materiales
+        self._tramos_hormigon = tramos
+
+        self.P = float(P)
+        self.b = float(np.ptp(self.x))
+        self.h = float(np.ptp(self.y))
+        self.esu = float(esu)
+        if deformaciones_ultimas is None:
+            deformaciones_ultimas = (np.inf, np.inf, self.esu)
+        self.deformaciones_ultimas = tuple(float(e) for e in deformaciones_ultimas)
+        self.evaluaciones = 0
+
+    @classmethod
+    def desde_parametros(cls, cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu,
+                         P, datos_h, sg_cover, sg_core):
+        """
+        Construye la sección a partir de los mismos datos que
+        FiberSection.desde_parametros (fibras y barras con [x_i, y_i, A_i]).
+        """
+        materiales = (
+            material_hormigon(sg_cover, fc0, ec0, esp, Ec, datos_h),
+            material_hormigon(sg_core, fc0, ec0, esp, Ec, datos_h),
+            material_acero(fy, fsu, Es, ey, esh, esu),
+        )
+        ultimas = (
+            deformacion_ultima(sg_cover, esp, datos_h),
+            deformacion_ultima(sg_core, esp, datos_h),
+            esu,
+        )
+        tramos = (
+            tramos_hormigon(sg_cover, fc0, ec0, esp, Ec, datos_h),
+            tramos_hormigon(sg_core, fc0, ec0, esp, Ec, datos_h),
+        )
+        return cls(cover, core, As, materiales, P=P, esu=esu, deformaciones_ultimas=ultimas, tramos=tramos)
+
+    def coordenada(self, theta, grupo=None):
+        """
+        Coordenada u de las fibras (todas o las de un grupo) para cada
+        ángulo: arreglo (ángulos x fibras).
+        """
+        theta = np.atleast_1d(np.asarray(theta, dtype=float))
+        fibras = slice(None) if grupo is None else self._grupos[grupo]
+        # Sin el residuo de redondeo (cos(pi/2) ~ 6e-17), los múltiplos de
+        # 90° dan exactamente la coordenada x o y de los análisis uniaxiales
+        seno, coseno = np.sin(theta), np.cos(theta)
+        seno[np.abs(seno) < 1e-15] = 0.0
+        coseno[np.abs(coseno) < 1e-15] = 0.0
+        return seno[:, None] * self.x[None, fibras] + coseno[:, None] * self.y[None, fibras]
+
+    def u_extremo(self, theta, grupo):
+        """
+        Coordenada u de la fibra más comprimida de un grupo para cada
+        ángulo; None si el grupo está vacío.
+        """
+        if self._grupos[grupo].stop == self._grupos[grupo].start:
+            return None
+        return self.coordenada(theta, grupo).max(axis=1)
+
+    def resultantes(self, c, phi, theta):
+        """
+        Resultantes para vectores de c, phi y theta (se combinan por
+        broadcasting; un candidato por posición).
+
+        Retorna:
+            N, Mx, My : arreglos con N ya descontada la carga axial P
+        """
+        c, phi, theta = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (c, phi, theta)))
+        eps = self.coordenada(theta)
+        eps -= c[:, None]
+        eps *= -phi[:, None]
+        N = np.zeros(len(c))
+        Mx = np.zeros(len(c))
+        My = np.zeros(len(c))
+        for tramo, esfuerzo, _ in self._tramos:
+            sigma = esfuerzo(eps[:, tramo])
+            N += sigma @ self.A[tramo]
+            Mx += sigma @ self.Ay[tramo]
+            My += sigma @ self.Ax[tramo]
+        self.evaluaciones += len(c)
+        return N - self.P, Mx, My
+
+    def deformacion_acero(self, c, phi, theta):
+        """
+        Deformaciones de las barras (ángulos x barras).
+        """
+        c, phi, theta = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (c, phi, theta)))
+        return -phi[:, None] * (self.coordenada(theta, self.ACERO) - c[:, None])
+
+    def proyectar(self, theta):
+        """
+        FiberSection 1D con la coordenada u de un ángulo fijo (una fibra
+        por fibra 2D), para usar los solvers de flexión uniaxial alrededor
+        de un eje girado. El momento que entregan es sum(sigma*A*u).
+        """
+        u = self.coordenada(theta)[0]
+        grupos = [np.column_stack((u[g], self.A[g])) for g in self._grupos]
+        return FiberSection(*grupos, self._materiales, P=self.P, h=float(np.ptp(u)), esu=self.esu,
+                            deformaciones_ultimas=self.deformaciones_ultimas, tramos=self._tramos_hormigon)
@@ -1,37 +1,32 @@
 from PySide6.QtWidgets import (
-    QMainWindow, QApplication, QDialog, QMessageBox, QFileDialog
+    QMainWindow, QApplication, QDialog, QMessageBox, QFileDialog, QProgressBar
 )
-from PySide6.QtCore import Slot
+from PySide6.QtCore import Slot, QThreadPool
 import sys
 import os
+import multiprocessing
 import json
 import numpy as np
 
 # ==== UIs (ajusta si tus nombres difieren) ====
 from ui_ventana_principal import Ui_ventana_principal
-from ui_ayuda import Ui_ayuda
 
-# ==== Vistas/Controladores existentes (ajusta si difieren) ====
-from class_material_hormigon import VentanaMaterialHormigon
-from class_material_acero import VentanaMaterialAcero
-from class_definir_fibras import VentanaDefinirFibras
+# ==== Vistas/Controladores de la página inicial ====
 from seccion_columna_controller import SeccionColumnaController
 from vista_dinamica_seccion_columna import SeccionColumnaGrafico
-from seccion_viga_controller import SeccionVigaController
-from vista_dinamica_seccion_viga import SeccionVigaGrafico
-from class_definir_asce import VentanaDefinirASCE
-from class_calcular_asce import CalculadoraASCE
-#from momento_curvatura import calcular_resultados_seccion
-from momento_curvatura_parche_sap import calcular_resultados_seccion
-from mostrar_mc_dialog import VentanaMostrarMC
-from class_mostrar_DI import VentanaMostrarDI
-from class_mostrar_fibras import class_mostrar_fibras
+from cache_resultados import configurar_cache
+from datos_por_defecto import datos_por_defecto
+
+# Los diálogos, la vista de viga, las fibras y los solvers (scipy) se
+# importan en el método que los usa: así no retrasan la primera ventana.
+# benchmarks/bench_arranque.py mide el arranque y el costo de cada import.
 
 # ---------------- Ventanas auxiliares ----------------
 
 class VentanaAyuda(QDialog):
     def __init__(self):
         super().__init__()
+        from ui_ayuda import Ui_ayuda
         self.ui = Ui_ayuda()
         self.ui.setupUi(self)
         self.setFixedSize(self.size())
@@ -56,8 +51,8 @@ class VentanaPrincipal(QMainWindow):
         # ====== Datos iniciales de ejemplo (reemplaza por los tuyos si ya los cargas) ======
         self._set_default_data()
 
-        # ====== Ventanas auxiliares ======
-        self.ventana_ayuda = VentanaAyuda()
+        # ====== Ventanas auxiliares (se crean al abrirlas por primera vez) ======
+        self.ventana_ayuda = None
 
         # Resultados (se reemplazan en cada click a Calcular)
         self.mc_matriz = None   # np.ndarray columnas: [θ_Hog, M_Hog, θ_Mu, M_Mu, θ_Mc, M_Mc]
@@ -65,6 +60,18 @@ class VentanaPrincipal(QMainWindow):
         self.mc_parametros = {}
         self.di_matriz = None   # np.ndarray (n,3): [c,  Pn,  Mn]
         self.di_series = {}     # {'phi':(x=Mn,y=Pn), 'sinphi':(x,y)}
+
+        # Caché de resultados: memoria + disco, compartida entre sesiones
+        configurar_cache(directorio=os.path.join(os.path.expanduser("~"), ".diagrama_mc", "cache"))
+
+        # Cálculo en segundo plano (uno a la vez; editar datos lo cancela)
+        self._trabajador = None
+        self._trabajadores_vivos = set()   # referencias hasta que cada hilo emita su señal final
+        self.barra_progreso = QProgressBar()
+        self.barra_progreso.setRange(0, 100)
+        self.barra_progreso.setMaximumWidth(220)
+        self.barra_progreso.hide()
+        self.ui.statusbar.addPermanentWidget(self.barra_progreso)
         
         # ====== Inicializar interfaz ======
         self.actualizar_lineedit_materiales()
@@ -81,6 +88,14 @@ class VentanaPrincipal(QMainWindow):
         self.ui.actionCapas_de_Fibras.triggered.connect(self.abrir_definir_fibras)
         self.ui.actionDiagrama_de_iteracion.triggered.connect(self.abrir_mostrar_di)
         self.ui.actionDiagrama_M_C.triggered.connect(self.abrir_mostrar_mc)
+        self.actionFamilia_axial = self.ui.menuMostrar.addAction("Familia M-φ por carga axial")
+        self.actionFamilia_axial.triggered.connect(self.abrir_familia_axial)
+        # Opcional (apagado por defecto): el DI por fibras se suma al de
+        # Whitney en el próximo cálculo de columna
+        self.actionDI_fibras = self.ui.menuMostrar.addAction("Diagrama de interacción por fibras")
+        self.actionDI_fibras.setCheckable(True)
+        self.actionDI_fibras.setChecked(False)
+        self.actionDI_fibras.setStatusTip("Se aplica en el próximo cálculo de columna")
         self.ui.actionProyecto.triggered.connect(self.mostrar_proyecto)
         self.ui.actionSeccion.triggered.connect(self.mostrar_seccion)
         self.ui.seccion_analisis.currentTextChanged.connect(self.cambiar_pagina_analisis)
@@ -116,62 +131,14 @@ class VentanaPrincipal(QMainWindow):
 
     def _set_default_data(self):
         """Inicializa los diccionarios de datos por defecto."""
-        self.material_hormigon_data = {
-            "nombre_hormigon": "f'c 210",
-            "esfuerzo_fc": "210",
-            "modulo_Ec": "218819.788",
-            "def_max_sin_confinar": "0.002",
-            "def_ultima_sin_confinar": "0.0038",  # esp 
-            "def_ultima_confinada": "0.09",
-        }
-        self.material_acero_data = {
-            "nombre_acero": "fy 4200",
-            "esfuerzo_fy": "4200",
-            "modulo_Es": "2000000",
-            "esfuerzo_ultimo_acero": "7457",
-            "def_fluencia_acero": "0.0021",
-            "def_inicio_endurecimiento": "0.0139",
-            "def_ultima_acero": "0.09",
-        }
-        self.seccion_columna_data = {
-            "disenar_columna_base": "40",
-            "disenar_columna_altura": "90",
-            "disenar_columna_varillasX_2": "10",
-            "disenar_columna_varillasY_2": "10",
-            "disenar_columna_diametro_longitudinal_2": "25",
-            "disenar_columna_recubrimiento": "3",
-            "disenar_columna_ramalesX": "4",
-            "disenar_columna_ramalesY": "4",
-            "disenar_columna_diametro_transversal": "12",
-            "disenar_columna_espaciamiento": "10",
-            "disenar_columna_diametro_longitudinal_esq": "30",
-            "disenar_columna_axial": "3000",
-        }
-        self.seccion_viga_data = {
-            "disenar_viga_base": "40",
-            "disenar_viga_altura": "80",
-            "disenar_viga_recubrimiento": "3",
-            "disenar_viga_varillas_inferior": "4",
-            "disenar_viga_diametro_inferior": "25",
-            "disenar_viga_varillas_superior": "2",
-            "disenar_viga_diametro_superior": "14",
-            "disenar_viga_diametro_transversal": "10",
-            "disenar_viga_espaciamiento": "10",
-        }
-        self.proyecto_data = {
-            "descripcion_proyecto": "Nombre Proyecto",
-            "descripcion_ingeniero": "Luis Flor",
-            "descripcion_seccion": "C40X40",
-        }
-        self.capas_fibras_data = {"fibras_x": "10", "fibras_y": "10"}
-        self.asce_data = {
-            "long_viga_asce": "6",
-            # Campos de solo-lectura (se sobreescriben SIEMPRE antes de abrir el diálogo)
-            "def_max_asce": "",
-            "def_ultima_asce": "",
-            "def_fluencia_asce": "",
-            "axial_columna_asce": "",
-        }
+        datos = datos_por_defecto()
+        self.material_hormigon_data = datos["material_hormigon_data"]
+        self.material_acero_data = datos["material_acero_data"]
+        self.seccion_columna_data = datos["seccion_columna_data"]
+        self.seccion_viga_data = datos["seccion_viga_data"]
+        self.proyecto_data = datos["proyecto_data"]
+        self.capas_fibras_data = datos["capas_fibras_data"]
+        self.asce_data = datos["asce_data"]
 
     def _wire_dirty_flags(self):
         """Conecta callbacks que marcan el proyecto como modificado."""
@@ -215,10 +182,14 @@ class VentanaPrincipal(QMainWindow):
                 _c(btn.clicked)
 
     def _wire_dirty_lineedits(self, parent):
-        """Conecta todos los QLineEdit dentro del widget `parent` a _mark_dirty()."""
+        """
+        Conecta todos los QLineEdit dentro del widget `parent` a _mark_dirty()
+        y a cancelar_calculo() (editar la sección invalida el cálculo en curso).
+        """
         from PySide6.QtWidgets import QLineEdit
         for le in parent.findChildren(QLineEdit):
             le.textEdited.connect(self._mark_dirty)
+            le.textEdited.connect(self.cancelar_calculo)
 
     def _mark_dirty(self, *args, **kwargs):
         if not self._is_dirty:
@@ -395,6 +366,7 @@ class VentanaPrincipal(QMainWindow):
     def mostrar_fibras(self):
         """Dibuja la sección de fibras dentro de ui.cuadricula_seccion SIN cambiar de página."""
         if self.ui.actionCapas_de_Fibras_2.isChecked():
+            from class_mostrar_fibras import class_mostrar_fibras
             visor = class_mostrar_fibras(
                 self.ui,
                 self.seccion_columna_data,
@@ -459,6 +431,7 @@ class VentanaPrincipal(QMainWindow):
     # ---------------- Abrir diálogos ----------------
 
     def abrir_material_hormigon(self):
+        from class_material_hormigon import VentanaMaterialHormigon
         ventana = VentanaMaterialHormigon(self.material_hormigon_data, self.material_acero_data, self.seccion_columna_data)
         ventana.datos_guardados_callback = self._wrap_dirty(self.actualizar_material_hormigon_data)
         ventana.exec()
@@ -476,6 +449,7 @@ class VentanaPrincipal(QMainWindow):
         self.invalidar_resultados_y_apagar_fibras()
 
     def abrir_material_acero(self):
+        from class_material_acero import VentanaMaterialAcero
         ventana = VentanaMaterialAcero(self.material_acero_data)
         ventana.datos_guardados_callback = self._wrap_dirty(self.actualizar_material_acero_data)
         ventana.exec()
@@ -489,9 +463,14 @@ class VentanaPrincipal(QMainWindow):
         self.invalidar_resultados_y_apagar_fibras()
 
     def abrir_documentacion(self):
+        if self.ventana_ayuda is None:
+            self.ventana_ayuda = VentanaAyuda()
         self.ventana_ayuda.exec()
 
     def abrir_definir_asce(self):
+        from class_definir_asce import VentanaDefinirASCE
+        from class_calcular_asce import CalculadoraASCE
+
         # 1) Poblar SIEMPRE los 3 lineedits de solo-lectura desde los diccionarios de materiales
         self.asce_data["def_max_asce"]      = str(self.material_hormigon_data.get("def_max_sin_confinar", ""))
         self.asce_data["def_ultima_asce"]   = str(self.material_hormigon_data.get("def_ultima_sin_confinar", ""))
@@ -537,6 +516,7 @@ class VentanaPrincipal(QMainWindow):
 
     # en VentanaPrincipal (método nuevo)
     def invalidar_resultados_y_apagar_fibras(self):
+        self.cancelar_calculo()
         # 1) desmarcar la capa de fibras
         try:
             act = getattr(self.ui, "actionCapas_de_Fibras_2", None)
@@ -552,12 +532,14 @@ class VentanaPrincipal(QMainWindow):
         self.di_series = {}
 
     def abrir_definir_fibras(self):
+        from class_definir_fibras import VentanaDefinirFibras
         ventana = VentanaDefinirFibras(self.capas_fibras_data, self._wrap_dirty(self.actualizar_fibras_data), parent=self)
 
         ventana.exec()
 
     def actualizar_fibras_data(self, datos):
         self.capas_fibras_data = datos.copy()
+        self.cancelar_calculo()
         self.mc_matriz = None
         self.mc_series = {}
         self.mc_parametros = {}
@@ -568,6 +550,7 @@ class VentanaPrincipal(QMainWindow):
         if not getattr(self, "di_series", None):
             QMessageBox.warning(self, "Diagrama de Interacción", "Primero presiona Calcular para generar el DI.")
             return
+        from class_mostrar_DI import VentanaMostrarDI
         self.ventana_mostrar_di = VentanaMostrarDI(
             self.seccion_columna_data,
             di_matriz=self.di_matriz,
@@ -577,14 +560,89 @@ class VentanaPrincipal(QMainWindow):
         self.ventana_mostrar_di.exec()
 
     def abrir_mostrar_mc(self):
-        if not getattr(self, "mc_series", None):
-            QMessageBox.warning(self, "Diagrama M–C", "Primero presiona Calcular para generar las curvas.")
-            return
-
+        from mostrar_mc_dialog import VentanaMostrarMC
+        from momento_curvatura_parche_sap import SERIES_MC
         texto = self.ui.seccion_analisis.currentText()
+        tipo = texto.strip().lower()
+
+        calculo = None
+        faltantes = [clave for clave, _, _ in SERIES_MC.get(tipo, SERIES_MC["viga"]) if clave not in self.mc_series]
+        if faltantes:
+            # Series sin resultados todavía: la ventana las calcula (o las toma
+            # de la caché) y las dibuja a medida que convergen
+            if tipo == "columna":
+                datos_seccion = self.seccion_columna_data
+                direccion_txt = self.ui.direccion_analisis.currentText().strip().lower()
+                eje = "x" if direccion_txt.endswith("x") else "y"
+            else:
+                datos_seccion = self.seccion_viga_data
+                eje = "x"
+            calculo = dict(
+                datos_hormigon=dict(self.material_hormigon_data),
+                datos_acero=dict(self.material_acero_data),
+                datos_seccion=dict(datos_seccion),
+                datos_fibras=dict(self.capas_fibras_data),
+                tipo_seccion=tipo,
+                eje=eje,
+                claves=faltantes,
+            )
 
-        dlg = VentanaMostrarMC(self.seccion_columna_data, self.seccion_viga_data, self.mc_series, self.mc_parametros, tipo_seccion=texto.lower(), parent=self)
+        dlg = VentanaMostrarMC(self.seccion_columna_data, self.seccion_viga_data, self.mc_series, self.mc_parametros, tipo_seccion=tipo, parent=self, calculo=calculo)
+        dlg.curva_calculada.connect(self._curva_mc_calculada)
         dlg.exec()
+        # Las curvas que terminen después de cerrar quedan en la caché
+        dlg.curva_calculada.disconnect(self._curva_mc_calculada)
+
+    def _curva_mc_calculada(self, clave, serie, parametros):
+        # Curva completa calculada en VentanaMostrarMC: mismos resultados que Calcular
+        self.mc_series[clave] = serie
+        self.mc_parametros[clave] = parametros
+
+    def abrir_familia_axial(self):
+        """
+        Calcula en segundo plano la familia de curvas M-φ de la columna para
+        varios niveles de carga axial y la muestra al terminar.
+        """
+        if self.ui.seccion_analisis.currentText().strip().lower() != "columna":
+            QMessageBox.warning(self, "Familia M-φ", "La familia por carga axial solo está disponible para columnas.")
+            return
+        from calculo_segundo_plano import TrabajadorFamiliaAxial
+        self.cancelar_calculo()
+
+        direccion_txt = self.ui.direccion_analisis.currentText().strip().lower()
+        trabajador = TrabajadorFamiliaAxial(
+            datos_hormigon=dict(self.material_hormigon_data),
+            datos_acero=dict(self.material_acero_data),
+            datos_seccion=dict(self.seccion_columna_data),
+            datos_fibras=dict(self.capas_fibras_data),
+            eje="x" if direccion_txt.endswith("x") else "y",
+            # La familia sí compensa el pool; se arranca una vez por sesión
+            # y se reutiliza en las siguientes familias
+            n_procesos=None,
+        )
+        senales = trabajador.senales
+        senales.progreso.connect(lambda p, txt, t=trabajador: self._calculo_progreso(t, p, txt))
+        senales.terminado.connect(lambda r, t=trabajador: self._familia_terminada(t, r))
+        senales.error.connect(lambda msg, t=trabajador: self._calculo_error(t, msg))
+        for senal in (senales.terminado, senales.error, senales.cancelado):
+            senal.connect(lambda *_, t=trabajador: self._trabajadores_vivos.discard(t))
+
+        self._trabajador = trabajador
+        self._trabajadores_vivos.add(trabajador)
+        self.barra_progreso.setValue(0)
+        self.barra_progreso.show()
+        self.ui.statusbar.showMessage("Calculando familia M-φ...")
+        QThreadPool.globalInstance().start(trabajador)
+
+    def _familia_terminada(self, trabajador, familia):
+        if trabajador is not self._trabajador:
+            return
+        self._trabajador = None
+        self.barra_progreso.hide()
+        self.ui.statusbar.clearMessage()
+
+        from mostrar_familia_axial import VentanaFamiliaAxial
+        VentanaFamiliaAxial(familia, parent=self).exec()
 
     # ---------------- Vistas secciones / propiedades ----------------
 
@@ -638,23 +696,17 @@ class VentanaPrincipal(QMainWindow):
         direccion_txt = self.ui.direccion_analisis.currentText().strip().lower()
         eje = "x" if direccion_txt.endswith("x") else "y"
 
-        resultados = calcular_resultados_seccion(
-            datos_hormigon=self.material_hormigon_data,
-            datos_acero=self.material_acero_data,
+        self.lanzar_calculo(
+            self.seccion_columna_controller,
             datos_seccion=self.seccion_columna_data,
-            datos_fibras=self.capas_fibras_data,
             tipo_seccion="columna",
             eje=eje,
         )
 
-        self.mc_matriz = resultados["mc_matriz"]
-        self.mc_series = resultados["mc_series"]
-        self.mc_parametros = resultados.get("mc_parametros", {})
-        self.di_matriz = resultados["di_matriz"]
-        self.di_series = resultados["di_series"]
-
     @Slot()
     def mostrar_viga(self):
+        from seccion_viga_controller import SeccionVigaController
+        from vista_dinamica_seccion_viga import SeccionVigaGrafico
         self.ui.stackedWidget_seccion.setCurrentWidget(self.ui.pg_viga)
         self.seccion_viga_controller = SeccionVigaController(
             self.ui, self.seccion_viga_data, self._wrap_dirty(self.actualizar_seccion_viga_data)
@@ -686,26 +738,94 @@ class VentanaPrincipal(QMainWindow):
     def actualizar_seccion_viga_data(self, datos):
         self.seccion_viga_data = datos.copy()
 
-        resultados = calcular_resultados_seccion(
-            datos_hormigon=self.material_hormigon_data,
-            datos_acero=self.material_acero_data,
+        self.lanzar_calculo(
+            self.seccion_viga_controller,
             datos_seccion=self.seccion_viga_data,
-            datos_fibras=self.capas_fibras_data,
             tipo_seccion="viga",
             eje="x",
         )
 
+    # ---------------- Cálculo en segundo plano ----------------
+
+    def lanzar_calculo(self, controller, datos_seccion, tipo_seccion, eje):
+        """
+        Cancela el cálculo en curso (si hay) y lanza uno nuevo en el
+        QThreadPool. Los resultados llegan a _calculo_terminado.
+        """
+        from calculo_segundo_plano import TrabajadorCalculo
+        self.cancelar_calculo()
+
+        trabajador = TrabajadorCalculo(
+            datos_hormigon=dict(self.material_hormigon_data),
+            datos_acero=dict(self.material_acero_data),
+            datos_seccion=dict(datos_seccion),
+            datos_fibras=dict(self.capas_fibras_data),
+            tipo_seccion=tipo_seccion,
+            eje=eje,
+            # En serie: un cálculo corriente tarda menos que arrancar el pool
+            # de procesos (spawn en Windows)
+            n_procesos=1,
+            di_fibras=("mander_u", "mander_c") if self.actionDI_fibras.isChecked() else None,
+        )
+        senales = trabajador.senales
+        senales.progreso.connect(lambda p, txt, t=trabajador: self._calculo_progreso(t, p, txt))
+        senales.terminado.connect(lambda r, t=trabajador, c=controller: self._calculo_terminado(t, c, r))
+        senales.error.connect(lambda msg, t=trabajador: self._calculo_error(t, msg))
+        for senal in (senales.terminado, senales.error, senales.cancelado):
+            senal.connect(lambda *_, t=trabajador: self._trabajadores_vivos.discard(t))
+
+        self._trabajador = trabajador
+        self._trabajadores_vivos.add(trabajador)
+        self.barra_progreso.setValue(0)
+        self.barra_progreso.show()
+        self.ui.statusbar.showMessage("Calculando...")
+        QThreadPool.globalInstance().start(trabajador)
+
+    def cancelar_calculo(self, *args):
+        if self._trabajador is None:
+            return
+        self._trabajador.cancelar()
+        self._trabajador = None
+        self.barra_progreso.hide()
+        self.ui.statusbar.showMessage("Cálculo cancelado", 3000)
+
+    def _calculo_progreso(self, trabajador, porcentaje, texto):
+        if trabajador is not self._trabajador:
+            return
+        self.barra_progreso.setValue(porcentaje)
+        self.ui.statusbar.showMessage(texto)
+
+    def _calculo_terminado(self, trabajador, controller, resultados):
+        # Resultados de un cálculo ya cancelado/reemplazado: se descartan
+        if trabajador is not self._trabajador:
+            return
+        self._trabajador = None
+        self.barra_progreso.hide()
+        self.ui.statusbar.clearMessage()
+
         self.mc_matriz = resultados["mc_matriz"]
         self.mc_series = resultados["mc_series"]
         self.mc_parametros = resultados.get("mc_parametros", {})
         self.di_matriz = resultados["di_matriz"]
         self.di_series = resultados["di_series"]
 
+        if controller is not None:
+            controller.calculo_terminado()
+
+    def _calculo_error(self, trabajador, mensaje):
+        if trabajador is not self._trabajador:
+            return
+        self._trabajador = None
+        self.barra_progreso.hide()
+        self.ui.statusbar.clearMessage()
+        QMessageBox.critical(self, "Error de cálculo", mensaje)
+
     # ---------------- Acciones de menú (Archivo) ----------------
 
     def menu_nuevo(self):
         if not self._maybe_save_changes():
             return
+        self.cancelar_calculo()
         self._set_default_data()
         # Limpiar ruta y resultados
         self._invalidar_asce_persistencia()
@@ -741,6 +861,7 @@ class VentanaPrincipal(QMainWindow):
         try:
             with open(path, "r", encoding="utf-8") as f:
                 payload = json.load(f)
+            self.cancelar_calculo()
             self._apply_project_dict(payload)
             self._project_path = path
             self._clear_dirty()
@@ -764,6 +885,9 @@ class VentanaPrincipal(QMainWindow):
 
     def closeEvent(self, event):
         if self._maybe_save_changes():
+            from momento_curvatura_parche_sap import cerrar_pool
+            self.cancelar_calculo()
+            cerrar_pool()
             event.accept()
         else:
             event.ignore()
@@ -772,6 +896,7 @@ class VentanaPrincipal(QMainWindow):
 # ---------------- main ----------------
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = VentanaPrincipal()
     window.show()
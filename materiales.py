@@ -1,6 +1,12 @@
+import copy
+import os
+import time
+from functools import lru_cache
 import numpy as np
 from scipy.optimize import brentq
-from scipy.integrate import simpson
+from scipy.interpolate import RectBivariateSpline
+from scipy.special import hyp2f1
+from diagnostico import GANCHOS, emitir
 
 class modelos:
     """
@@ -12,6 +18,12 @@ class modelos:
         - mander_u: hormigón no confinado
         - mander_c: hormigón confinado
         - buscar_ecu: deformación última del hormigón confinado por equilibrio energético
+        - park_energia, mander_energia: integrales en forma cerrada de las curvas
+        - fccfco, fccfco_tabla: resistencia confinada exacta y por gráfico precalculado
+
+    Cada modelo tiene su módulo tangente (park_tangente, hognestad_tangente,
+    mander_u_tangente, mander_c_tangente) con la misma firma, usado por los
+    solvers de Newton.
     """
 
     @staticmethod
@@ -55,6 +67,36 @@ class modelos:
 
         return fs
 
+    @staticmethod
+    def park_tangente(es, fy, fsu, Es, ey, esh, esu):
+        """
+        Módulo tangente dfs/des del modelo de Park.
+
+        Parámetros:
+            mismos que park
+
+        Retorna:
+            Et : módulo tangente del acero
+        """
+        es = np.asarray(es, dtype=float)
+        Et = np.zeros_like(es, dtype=float)
+        abs_es = np.abs(es)
+
+        # Rama elástica lineal
+        z1 = abs_es <= ey
+        Et[z1] = Es
+
+        # Rama de endurecimiento por deformación (la rama plástica tiene Et = 0)
+        z3 = (abs_es > esh) & (abs_es <= esu)
+        delta_e = abs_es[z3] - esh
+        r = esu - esh
+        m = ((fsu / fy) * (30 * r + 1) ** 2 - 60 * r - 1) / (15 * r ** 2)
+        d_parte1 = (2 * m - 120) / (60 * delta_e + 2) ** 2
+        d_parte2 = (60 - m) / (2 * (30 * r + 1) ** 2)
+        Et[z3] = fy * (d_parte1 + d_parte2)
+
+        return Et
+
     @staticmethod
     def hognestad(ec, fc0, ec0, esp, Ec, datos_h=None, N=None):
         """
@@ -82,6 +124,25 @@ class modelos:
 
         return -fc
 
+    @staticmethod
+    def hognestad_tangente(ec, fc0, ec0, esp, Ec, datos_h=None, N=None):
+        """
+        Módulo tangente dfc/dec del modelo de Hognestad (convención de signos
+        de hognestad: compresión negativa).
+        """
+        ec = np.asarray(ec, dtype=float)
+        Et = np.zeros_like(ec, dtype=float)
+
+        # Rama ascendente parabólica
+        z1 = (ec <= 0) & (ec >= -ec0)
+        Et[z1] = fc0 * (2 - 2 * (-ec[z1] / ec0)) / ec0
+
+        # Rama descendente lineal
+        z2 = (ec < -ec0) & (ec >= -esp)
+        Et[z2] = -0.15 * fc0 / (esp - ec0)
+
+        return Et
+
     @staticmethod
     def mander_u(ec, fc0, ec0, esp, Ec, datos_h=None, N=None):
         """
@@ -119,6 +180,68 @@ class modelos:
 
         return -fc
 
+    @staticmethod
+    def mander_u_tangente(ec, fc0, ec0, esp, Ec, datos_h=None, N=None):
+        """
+        Módulo tangente dfc/dec del modelo de Mander no confinado
+        (convención de signos de mander_u: compresión negativa).
+        """
+        ec = np.asarray(ec, dtype=float)
+        Et = np.zeros_like(ec, dtype=float)
+
+        ec00 = 2 * ec0
+
+        Esec = fc0 / ec0
+        r = Ec / (Ec - Esec)
+
+        # Rama ascendente curva
+        z1 = (ec <= 0) & (ec >= -ec00)
+        x = ec[z1] / -ec0
+        Et[z1] = fc0 * r * (r - 1) * (1 - x ** r) / (r - 1 + x ** r) ** 2 / ec0
+
+        # Rama descendente lineal
+        z2 = (ec >= -esp) & (ec < -ec00)
+        Et[z2] = -fc0 * (2 * r) / (r - 1 + 2 ** r) / (esp - ec00)
+
+        return Et
+
+    @staticmethod
+    def fccfco(flx, fly, fc0):
+        """
+        Resistencia confinada fcc según la superficie de falla de cinco
+        parámetros (criterio octaédrico de Mander) para las presiones
+        laterales efectivas flx y fly.
+        """
+        sigma1 = -min(flx, fly)
+        sigma2 = -max(flx, fly)
+
+        def f(sigma3):
+            sigma_oct = (sigma1 + sigma2 + sigma3) / 3
+            tau_oct_i = (((sigma1 - sigma2) ** 2 + (sigma2 - sigma3) ** 2 + (sigma3 - sigma1) ** 2) ** 0.5 ) / 3
+
+            cos_theta = (sigma1 - sigma_oct) / (2 ** 0.5 * tau_oct_i)
+            cos_theta = np.clip(cos_theta, -1, 1)
+
+            sigmap_oct = sigma_oct / fc0
+
+            T = 0.069232 - 0.661091 * sigmap_oct - 0.049350 * sigmap_oct ** 2
+            C = 0.122965 - 1.150502 * sigmap_oct - 0.315545 * sigmap_oct ** 2
+            D = 4 * (C ** 2 - T ** 2) * cos_theta ** 2
+            tau_oct_j = fc0 * C * (D / (2 * cos_theta) + (2 * T - C) * (D + 5 * T**2 - 4 * T * C)**0.5) / (D + (2 * T - C)**2)
+
+            return tau_oct_i - tau_oct_j
+
+        return -brentq(f, -3*fc0, -fc0)
+
+    @staticmethod
+    def fccfco_tabla(flx, fly, fc0):
+        """
+        fcc de fccfco leído del gráfico adimensional precalculado
+        (TablaConfinamiento): vectorizado en flx y fly. Las presiones fuera
+        del gráfico se resuelven con fccfco.
+        """
+        return fc0 * TablaConfinamiento.cargar().relacion(np.asarray(flx) / fc0, np.asarray(fly) / fc0)
+
     @staticmethod
     def mander_c(ec, fc0, ec0, esp, Ec, datos_h=None, N=None):
         """
@@ -132,6 +255,7 @@ class modelos:
             Ec      : módulo de elasticidad del hormigón
             datos_h : tupla con:
                       (fyh, b, h, r, Sc, de, d_corner, d_edge, Nb, NLx, NLy, ecu, fcc)
+                      o un ManderConfinado ya construido (no recalcula nada)
             N       : selector de salida
                       N = 1 o None -> esfuerzo del hormigón
                       N = 2        -> retorna fc, psh, Acc, pcc
@@ -140,160 +264,392 @@ class modelos:
         Retorna:
             según N
         """
+        mc = ManderConfinado.desde(fc0, ec0, esp, Ec, datos_h)
+
+        if N == 3:
+            return mc.fcc
+
+        if N == 2:
+            return -mc.esfuerzo(ec), mc.psh, mc.Acc, mc.pcc
+
+        # salida por defecto: esfuerzo del hormigón
+        return mc.esfuerzo(ec)
+
+    @staticmethod
+    def mander_c_tangente(ec, fc0, ec0, esp, Ec, datos_h=None, N=None):
+        """
+        Módulo tangente dfc/dec del modelo de Mander confinado
+        (convención de signos de mander_c: compresión negativa).
+        """
+        return ManderConfinado.desde(fc0, ec0, esp, Ec, datos_h).tangente(ec)
+
+    @staticmethod
+    def park_energia(es, fy, fsu, Es, ey, esh, esu):
+        """
+        Energía de deformación del modelo de Park en forma cerrada: integral
+        de park entre 0 y es (es >= 0), por ramas.
+
+        Parámetros:
+            mismos que park
+
+        Retorna:
+            U : integral del esfuerzo (escalar)
+        """
+        es = float(es)
+        U = Es * min(es, ey) ** 2 / 2
+        if es > ey:
+            U += fy * (min(es, esh) - ey)
+        if es > esh:
+            r = esu - esh
+            d = min(es, esu) - esh
+            m = ((fsu / fy) * (30 * r + 1) ** 2 - 60 * r - 1) / (15 * r ** 2)
+            # (m d + 2)/(60 d + 2) = m/60 + (2 - m/30)/(60 d + 2)
+            U += fy * (m * d / 60 + (2 - m / 30) / 60 * np.log1p(30 * d)
+                       + d ** 2 * (60 - m) / (4 * (30 * r + 1) ** 2))
+        return U
 
-        fyh, b, h, r, Sc, de, d_corner, d_edge, Nb, NLx, NLy, ecu, fcc = datos_h
+    @staticmethod
+    def mander_energia(e, f_max, e_max, r):
+        """
+        Integral en forma cerrada de la curva de Mander
+        f = f_max·x·r/(r - 1 + x^r), x = e/e_max, entre 0 y e (e >= 0):
 
-        def fccfco(flx, fly, fc0):
-            sigma1 = -min(flx, fly)
-            sigma2 = -max(flx, fly)
+            f_max·e_max·r·X²/(2(r-1)) · 2F1(1, 2/r; 1 + 2/r; -X^r/(r-1)),  X = e/e_max
+        """
+        X = float(e) / e_max
+        if X <= 0.0:
+            return 0.0
+        return f_max * e_max * r * X ** 2 / (2 * (r - 1)) * hyp2f1(1.0, 2 / r, 1 + 2 / r, -X ** r / (r - 1))
+
+    @staticmethod
+    def buscar_ecu(fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu, datos_h, diagnostico=None):
+        """
+        Busca la deformación última del hormigón confinado ecu
+        mediante equilibrio energético.
+
+        Las energías (hormigón no confinado, acero transversal, hormigón
+        confinado y acero longitudinal hasta ecu) se integran en forma
+        cerrada (mander_energia, park_energia), así que cada paso de brentq
+        es O(1). El resultado se memoriza por firma de material y
+        confinamiento (_ecu_por_equilibrio).
+
+        Parámetros:
+            fc0, ec0, esp, Ec : parámetros del hormigón
+            fy, fsu, Es, ey, esh, esu : parámetros del acero transversal/longitudinal
+            datos_h : tupla de datos para mander_c:
+                      (fyh, b, h, r, Sc, de, d_corner, d_edge, Nb, NLx, NLy, ecu, fcc)
+                      o un ManderConfinado
+            diagnostico : dict opcional; se llena con el intervalo usado,
+                      iteraciones y evaluaciones de brentq, si el valor vino
+                      de la memoria, si se usó el valor de respaldo (con su
+                      motivo) y el tiempo
 
-            def f(sigma3):
-                sigma_oct = (sigma1 + sigma2 + sigma3) / 3
-                tau_oct_i = (((sigma1 - sigma2) ** 2 + (sigma2 - sigma3) ** 2 + (sigma3 - sigma1) ** 2) ** 0.5 ) / 3
+        Retorna:
+            ecu : deformación última del hormigón confinado
+        """
+        t0 = time.perf_counter()
+        # Parámetros de confinamiento: se calculan una sola vez
+        mc = ManderConfinado.desde(fc0, ec0, esp, Ec, datos_h)
+
+        aciertos = _ecu_por_equilibrio.cache_info().hits
+        ecu, intervalo, iteraciones, evaluaciones = _ecu_por_equilibrio(
+            *(float(v) for v in (fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu,
+                                 mc.fcc, mc.ecc, mc.r, mc.psh, mc.Acc, mc.pcc))
+        )
+        respaldo = intervalo is None
+
+        if respaldo:
+            # Basado en deformaciones típicas de hormigón confinado
+            import warnings
+            warnings.warn(
+                "No se pudo encontrar ecu mediante equilibrio energético. "
+                f"Usando valor por defecto de {ECU_RESPALDO} (deformación última típica).",
+                RuntimeWarning
+            )
+
+        # Sin diagnóstico ni ganchos no hay a quién informar (el respaldo ya se advirtió)
+        if diagnostico is None and not GANCHOS:
+            return ecu
+        info = {
+            "ecu": float(ecu),
+            "intervalo": intervalo,
+            "iteraciones": iteraciones,
+            "evaluaciones": evaluaciones,
+            "memorizado": _ecu_por_equilibrio.cache_info().hits > aciertos,
+            "respaldo": respaldo,
+            "tiempo_s": time.perf_counter() - t0,
+        }
+        if respaldo:
+            info["motivo"] = "sin cambio de signo del balance de energía en los intervalos de búsqueda"
+        if diagnostico is not None:
+            diagnostico.update(info)
+        emitir("buscar_ecu", info)
+        return ecu
+
+
+# Deformación última usada cuando el balance de energía no tiene raíz
+ECU_RESPALDO = 0.015
+
+
+@lru_cache(maxsize=256)
+def _ecu_por_equilibrio(fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu, fcc, ecc, r_cc, psh, Acc, pcc):
+    """
+    Raíz del balance de energía Ucc + Usc - Uco - Ush de buscar_ecu, con
+    las integrales en forma cerrada. Memorizada por sus argumentos (la
+    firma del material y del confinamiento).
 
-                cos_theta = (sigma1 - sigma_oct) / (2 ** 0.5 * tau_oct_i)
-                cos_theta = np.clip(cos_theta, -1, 1)
+    Retorna:
+        (ecu, intervalo, iteraciones, evaluaciones); intervalo None si se
+        usó ECU_RESPALDO
+    """
+    # Hormigón no confinado: rama curva hasta 2·ec0 y rama lineal hasta esp
+    r_uc = Ec / (Ec - fc0 / ec0)
+    ec00 = 2 * ec0
+    A_uc = modelos.mander_energia(ec00, fc0, ec0, r_uc)
+    if esp > ec00:
+        A_uc += 0.5 * (esp - ec00) * fc0 * (2 * r_uc) / (r_uc - 1 + 2 ** r_uc)
+
+    # Acero transversal
+    A_sh = modelos.park_energia(esu, fy, fsu, Es, ey, esh, esu)
+
+    Ush = psh * Acc * A_sh
+    Uco = Acc * A_uc
+
+    def f(ecu):
+        # Hormigón confinado y acero longitudinal en compresión hasta ecu
+        # (el acero con rotura en ecu, como en el balance original)
+        Ucc = Acc * modelos.mander_energia(ecu, fcc, ecc, r_cc)
+        Usc = pcc * Acc * modelos.park_energia(ecu, fy, fsu, Es, ey, esh, ecu)
+        return Ucc + Usc - Uco - Ush
+
+    for intervalo in ((2e-3, 5e-2), (1e-3, 1e-1)):
+        try:
+            ecu, sol = brentq(f, *intervalo, full_output=True)
+        except ValueError:
+            continue
+        return ecu, intervalo, sol.iterations, sol.function_calls
+    return ECU_RESPALDO, None, 0, 0
 
-                sigmap_oct = sigma_oct / fc0
 
-                T = 0.069232 - 0.661091 * sigmap_oct - 0.049350 * sigmap_oct ** 2
-                C = 0.122965 - 1.150502 * sigmap_oct - 0.315545 * sigmap_oct ** 2
-                D = 4 * (C ** 2 - T ** 2) * cos_theta ** 2
-                tau_oct_j = fc0 * C * (D / (2 * cos_theta) + (2 * T - C) * (D + 5 * T**2 - 4 * T * C)**0.5) / (D + (2 * T - C)**2)
+class ManderConfinado:
+    """
+    Parámetros del modelo de Mander confinado calculados una sola vez por
+    análisis (geometría del núcleo, área efectiva, cuantías, presiones
+    laterales, fcc, ecc, Esec y r). El esfuerzo y la tangente quedan como
+    evaluaciones por tramos sin recalcular el confinamiento.
+
+    Atributos principales:
+        dc, bc, Ss         : dimensiones del núcleo y separación libre de estribos
+        Wx, Wy, Ainef, Ae  : anchos libres, área inefectiva y área efectiva
+        Acc, pcc, Ke       : área de núcleo neta, cuantía longitudinal, coef. de confinamiento
+        psx, psy, psh      : cuantías de estribos
+        flx, fly           : presiones laterales efectivas
+        fcc, ecc, Esec, r  : parámetros de la curva de Mander
+        ecu                : deformación última (None hasta que se calcule)
+    """
 
-                return tau_oct_i - tau_oct_j
+    def __init__(self, fc0, ec0, esp, Ec, datos_h):
+        fyh, b, h, rec, Sc, de, d_corner, d_edge, Nb, NLx, NLy, ecu, fcc = datos_h
 
-            return -brentq(f, -3*fc0, -fc0)
+        self.fc0 = fc0
+        self.ec0 = ec0
+        self.esp = esp
+        self.Ec = Ec
+        self.datos_h = tuple(datos_h)
 
         # Dimensiones del núcleo
-        dc = h - 2 * r - de
-        bc = b - 2 * r - de
-        Ss = Sc - de
+        self.dc = h - 2 * rec - de
+        self.bc = b - 2 * rec - de
+        self.Ss = Sc - de
+        dc, bc = self.dc, self.bc
 
         # Área inefectiva
-        Wx = (bc - de - 2 * d_corner - (NLx - 2) * d_edge) / (NLx - 1)
-        Wy = (dc - de - 2 * d_corner - (NLy - 2) * d_edge) / (NLy - 1)
-
-        Ainef = (2 * (NLx - 1) * (Wx ** 2) / 6) + (2 * (NLy - 1) * Wy ** 2 / 6)
+        self.Wx = (bc - de - 2 * d_corner - (NLx - 2) * d_edge) / (NLx - 1)
+        self.Wy = (dc - de - 2 * d_corner - (NLy - 2) * d_edge) / (NLy - 1)
+        self.Ainef = (2 * (NLx - 1) * (self.Wx ** 2) / 6) + (2 * (NLy - 1) * self.Wy ** 2 / 6)
 
         # Área efectiva confinada
-        Ae = (bc * dc - Ainef) * (1 - Ss / (2 * bc)) * (1 - Ss / (2 * dc))
+        self.Ae = (bc * dc - self.Ainef) * (1 - self.Ss / (2 * bc)) * (1 - self.Ss / (2 * dc))
 
         # Cuantía longitudinal
         AsL = np.pi * (d_corner ** 2 + (Nb - 4) * d_edge ** 2 / 4)
         Ac = bc * dc
-        pcc = AsL / Ac
-        Acc = Ac * (1 - pcc)
+        self.pcc = AsL / Ac
+        self.Acc = Ac * (1 - self.pcc)
 
         # Coeficiente de confinamiento efectivo
-        Ke = Ae / Acc
+        self.Ke = self.Ae / self.Acc
 
         # Presión lateral de confinamiento
         Ash = np.pi * de ** 2 / 4
-        Ashx = NLx * Ash
-        Ashy = NLy * Ash
+        self.psx = (NLx * Ash * bc) / (Sc * bc * dc)
+        self.psy = (NLy * Ash * dc) / (Sc * bc * dc)
+        self.psh = self.psx + self.psy
 
-        psx = (Ashx * bc) / (Sc * bc * dc)
-        psy = (Ashy * dc) / (Sc * bc * dc)
-
-        flx = Ke * psx * fyh
-        fly = Ke * psy * fyh
+        self.flx = self.Ke * self.psx * fyh
+        self.fly = self.Ke * self.psy * fyh
 
         # Resistencia confinada
-        if fcc is None:
-            fcc = fccfco(flx, fly, fc0)
-
-        if N == 3:
-            return fcc
+        self.fcc = fcc if fcc is not None else float(modelos.fccfco_tabla(self.flx, self.fly, fc0))
 
         # Deformación en resistencia máxima confinada
-        ecc = ec0 * (1 + 5 * (fcc / fc0 - 1))
-        Esec = fcc / ecc
-        r = Ec / (Ec - Esec)
+        self.ecc = ec0 * (1 + 5 * (self.fcc / fc0 - 1))
+        self.Esec = self.fcc / self.ecc
+        self.r = Ec / (Ec - self.Esec)
 
-        # Cuantía volumétrica de estribos
-        psh = psx + psy
+        self.ecu = ecu
 
-        # Convención: compresión negativa en entrada
+    @classmethod
+    def desde(cls, fc0, ec0, esp, Ec, datos_h):
+        """
+        Retorna datos_h si ya es un ManderConfinado; si es la tupla de
+        mander_c, construye el objeto.
+        """
+        if isinstance(datos_h, cls):
+            return datos_h
+        return cls(fc0, ec0, esp, Ec, datos_h)
+
+    def con_ecu(self, ecu):
+        """
+        Copia con otra deformación última (el resto de parámetros no cambia).
+        """
+        nuevo = copy.copy(self)
+        nuevo.ecu = ecu
+        nuevo.datos_h = self.datos_h[:11] + (ecu, self.fcc)
+        return nuevo
+
+    def curva(self, e):
+        """
+        Esfuerzo de compresión (positivo) para deformaciones de compresión
+        e >= 0, sin truncar en ecu.
+        """
+        x = np.asarray(e, dtype=float) / self.ecc
+        r = self.r
+        return self.fcc * (x * r) / (r - 1 + x ** r)
+
+    def esfuerzo(self, ec):
+        """
+        Esfuerzo con la convención de mander_c (compresión negativa).
+        """
         ec = np.asarray(ec, dtype=float)
         fc = np.zeros_like(ec, dtype=float)
 
-        z1 = (ec <= 0) & (ec >= -ecu)
-        x = -ec[z1] / ecc
-        fc[z1] = fcc * (x * r) / (r - 1 + x ** r)
+        z1 = (ec <= 0) & (ec >= -self.ecu)
+        fc[z1] = self.curva(-ec[z1])
 
-        if N == 2:
-            return fc, psh, Acc, pcc
-
-        # salida por defecto: esfuerzo del hormigón
         return -fc
 
-    @staticmethod
-    def buscar_ecu(fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu, datos_h):
+    def tangente(self, ec):
         """
-        Busca la deformación última del hormigón confinado ecu
-        mediante equilibrio energético.
-
-        Parámetros:
-            fc0, ec0, esp, Ec : parámetros del hormigón
-            fy, fsu, Es, ey, esh, esu : parámetros del acero transversal/longitudinal
-            datos_h : tupla de datos para mander_c:
-                      (fyh, b, h, r, Sc, de, d_corner, d_edge, Nb, NLx, NLy, ecu, fcc)
-
-        Retorna:
-            ecu : deformación última del hormigón confinado
+        Módulo tangente dfc/dec con la convención de mander_c.
         """
+        ec = np.asarray(ec, dtype=float)
+        Et = np.zeros_like(ec, dtype=float)
+        r = self.r
 
-        # Hormigón no confinado
-        ec_uc = np.empty(100)
-        ec_uc[0] = -esp
-        ec_uc[1:] = np.linspace(-2 * ec0, 0.0, 99)
-        fc_uc = modelos.mander_u(ec_uc, fc0, ec0, esp, Ec, datos_h, 0)
-        A_uc = -simpson(fc_uc, x=ec_uc)
-
-        # Acero transversal
-        es_sh = np.linspace(0, esu, 100)
-        fs_sh = modelos.park(es_sh, fy, fsu, Es, ey, esh, esu)
-        A_sh = simpson(fs_sh, x=es_sh)
-
-        fyh, b, h, r, Sc, de, d_corner, d_edge, Nb, NLx, NLy, _, fcc = datos_h
+        z1 = (ec <= 0) & (ec >= -self.ecu)
+        x = -ec[z1] / self.ecc
+        Et[z1] = self.fcc * r * (r - 1) * (1 - x ** r) / (r - 1 + x ** r) ** 2 / self.ecc
 
-        def f(ecu):
-            # actualizar datos_h con el ecu de prueba
-            datos_h_ecu = (fyh, b, h, r, Sc, de, d_corner, d_edge, Nb, NLx, NLy, ecu, fcc)
+        return Et
 
-            # Hormigón confinado hasta ecu
-            ec_cc = np.linspace(-ecu, 0, 100)
-            fc_cc, psh, Acc, pcc = modelos.mander_c(ec_cc, fc0, ec0, esp, Ec, datos_h_ecu, 2)
-            A_cc = simpson(fc_cc, x=ec_cc)
 
-            # Acero longitudinal en compresión hasta ecu
-            es = np.linspace(0, ecu, 100)
-            fs_sc = modelos.park(es, fy, fsu, Es, ey, esh, ecu)
-            A_sc = simpson(fs_sc, x=es)
+class TablaConfinamiento:
+    """
+    Gráfico adimensional de resistencia confinada fcc/fc0 de la superficie
+    de falla de cinco parámetros (fccfco), que solo depende de flx/fc0 y
+    fly/fc0 y es simétrica en ellas.
+
+    Coordenadas: u = max(flx, fly)/fc0 en [0, u_max] y t = min/max en
+    [0, 1], con nodos más densos cerca de u = 0 y t = 0, donde la
+    superficie cambia más rápido; la diagonal flx = fly queda en el borde
+    t = 1 y no dentro de la malla. La lectura es bicúbica
+    (RectBivariateSpline) y vectorizada.
+
+    El gráfico se guarda en RUTA_TABLA junto al módulo y se reconstruye si
+    falta o si cambió la malla. error_max es el mayor error relativo
+    frente a fccfco en los centros de las celdas, medido al construirlo.
+    """
 
-            # Balance de energía: Ucc + Usc - Uco - Ush
-            Ush = psh * Acc * A_sh
-            Uco = Acc * A_uc
-            Ucc = Acc * A_cc
-            Usc = pcc * Acc * A_sc
+    RUTA_TABLA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fccfco_tabla.npz")
+    MALLA = (81, 31, 0.5)   # nodos en u, nodos en t, u_max
+    _cargada = None
 
-            return Ucc + Usc - Uco - Ush
+    def __init__(self, u, t, relaciones, error_max):
+        self.u = np.asarray(u, dtype=float)
+        self.t = np.asarray(t, dtype=float)
+        self.relaciones = np.asarray(relaciones, dtype=float)
+        self.error_max = float(error_max)
+        self.u_max = float(self.u[-1])
+        self._spline = RectBivariateSpline(self.u, self.t, self.relaciones, kx=3, ky=3)
 
-        # Manejo de error si brentq falla (f(a) y f(b) no tienen signos diferentes)
+    @staticmethod
+    def exacta(u, t):
+        """fcc/fc0 con el solver exacto para u = max/fc0 y t = min/max."""
+        return modelos.fccfco(u * t, u, 1.0)
+
+    @classmethod
+    def construir(cls, n_u=81, n_t=31, u_max=0.5):
+        u = u_max * np.linspace(0.0, 1.0, n_u) ** 1.5
+        t = np.linspace(0.0, 1.0, n_t) ** 2
+        relaciones = np.array([[cls.exacta(ui, ti) for ti in t] for ui in u])
+        tabla = cls(u, t, relaciones, np.nan)
+
+        # Verificación en los centros de las celdas
+        u_c = 0.5 * (u[:-1] + u[1:])
+        t_c = 0.5 * (t[:-1] + t[1:])
+        uu, tt = (m.ravel() for m in np.meshgrid(u_c, t_c, indexing="ij"))
+        exactas = np.array([cls.exacta(a, b) for a, b in zip(uu, tt)])
+        tabla.error_max = float(np.abs(tabla._spline.ev(uu, tt) / exactas - 1).max())
+        return tabla
+
+    @classmethod
+    def cargar(cls):
+        """
+        Gráfico del proceso: se lee de RUTA_TABLA una sola vez, o se
+        construye (y se intenta guardar) si falta o no coincide la malla.
+        """
+        if cls._cargada is not None:
+            return cls._cargada
+        n_u, n_t, u_max = cls.MALLA
+        tabla = None
         try:
-            return brentq(f, 2e-3, 5e-2)
-        except ValueError:
-            # Si falla, intentar con un rango más amplio
+            with np.load(cls.RUTA_TABLA) as datos:
+                if datos["relaciones"].shape == (n_u, n_t) and float(datos["u"][-1]) == u_max:
+                    tabla = cls(datos["u"], datos["t"], datos["relaciones"], datos["error_max"])
+        except (OSError, KeyError, ValueError):
+            pass
+        if tabla is None:
+            tabla = cls.construir(n_u, n_t, u_max)
             try:
-                return brentq(f, 1e-3, 1e-1)
-            except ValueError:
-                # Si aún falla, devolver un valor por defecto razonable para ecu
-                # Basado en deformaciones típicas de hormigón confinado
-                import warnings
-                warnings.warn(
-                    "No se pudo encontrar ecu mediante equilibrio energético. "
-                    "Usando valor por defecto de 0.015 (deformación última típica).",
-                    RuntimeWarning
-                )
-                return 0.015
\ No newline at end of file
+                np.savez(cls.RUTA_TABLA, u=tabla.u, t=tabla.t, relaciones=tabla.relaciones,
+                         error_max=tabla.error_max)
+            except OSError:
+                # Carpeta de solo lectura (instalación): queda en memoria
+                pass
+        cls._cargada = tabla
+        return tabla
+
+    def relacion(self, ax, ay):
+        """
+        fcc/fc0 para presiones laterales relativas ax = flx/fc0 y ay = fly/fc0
+        (escalares o arreglos). Fuera del gráfico (max > u_max) se usa fccfco.
+        """
+        ax, ay = np.broadcast_arrays(np.asarray(ax, dtype=float), np.asarray(ay, dtype=float))
+        u = np.maximum(ax, ay)
+        t = np.divide(np.minimum(ax, ay), u, out=np.zeros_like(u), where=u > 0)
+        relacion = self._spline.ev(u, t)
+        fuera = u > self.u_max
+        if fuera.any():
+            relacion[fuera] = [self.exacta(a, b) for a, b in zip(u[fuera], t[fuera])]
+        return relacion[()] if relacion.ndim == 0 else relacion
+
+    def verificar(self, muestras=2000, semilla=0):
+        """
+        Mayor error relativo frente a fccfco en presiones aleatorias dentro
+        del gráfico.
+        """
+        rng = np.random.default_rng(semilla)
+        ax, ay = rng.uniform(0.0, self.u_max, (2, muestras))
+        exactas = np.array([modelos.fccfco(a, b, 1.0) for a, b in zip(ax, ay)])
+        return float(np.abs(self.relacion(ax, ay) / exactas - 1).max())
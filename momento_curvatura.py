@@ -1,8 +1,9 @@
 import numpy as np
 from scipy.optimize import root_scalar
-from materiales import modelos
+from materiales import modelos, ManderConfinado
 from seccion import utilidades
 from diagrama_interaccion import calcular_series_di
+from kernel_fibras import FiberSection
 
 park = modelos.park
 hognestad = modelos.hognestad
@@ -54,18 +55,40 @@ def resultantes(c, phi, cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh
     return N_total, M_total
 
 # Funcion para encontrar la distancia al eje neutro
-def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
-           fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core, c_prev=None, phi_prev=None):
+def momrot(seccion, c_min, c_max, phi, tol, h, c_prev=None, phi_prev=None,
+           metodo="brentq", estadisticas=None):
+    """
+    Busca la profundidad del eje neutro c que equilibra la carga axial P
+    de la sección (FiberSection) para la curvatura phi y retorna (M, c),
+    o (None, None) si no converge.
+
+    metodo = "brentq" -> barrido por ventanas + brentq (método original)
+    metodo = "newton" -> Newton salvaguardado con dN/dc analítico, iniciado
+                         en c_prev; usa el barrido si Newton diverge o si
+                         hay una raíz más cercana a c_prev que la suya
+
+    Si se entrega el dict estadisticas, se llena con el método usado,
+    las iteraciones de Newton y el número de evaluaciones de resultantes.
+    """
+    max_iter_newton = 12
+    contador = {"evaluaciones": 0, "iteraciones": 0}
 
     def N_equilibrio(c):
-        N = resultantes(c, phi, cover, core, As, fc0, ec0, esp, Ec,
-                        fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core)[0]
-        return N
+        contador["evaluaciones"] += 1
+        return seccion.N(c, phi)
+
+    def N_lote(c_vals):
+        contador["evaluaciones"] += len(c_vals)
+        return seccion.NM_lote(c_vals, phi)[0]
+
+    def N_tangente(c):
+        contador["evaluaciones"] += 1
+        contador["iteraciones"] += 1
+        return seccion.N_tangente(c, phi)
 
     def es_max(c_eval, phi_eval):
-        yi = As[:, 0]
-        e_s = -phi_eval * (yi - c_eval)
-        es_validas = e_s[np.abs(e_s) < esu]
+        e_s = seccion.deformacion_acero(c_eval, phi_eval)
+        es_validas = e_s[np.abs(e_s) < seccion.esu]
         es = np.max(abs(es_validas)) if len(es_validas) else -np.inf
         return es
 
@@ -79,7 +102,7 @@ def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
 
     def encontrar_raices(a, b, npts):
         c_vals = np.linspace(a, b, npts)
-        N_vals = np.fromiter((N_equilibrio(c) for c in c_vals), dtype=float, count=npts)
+        N_vals = N_lote(c_vals)
         roots = []
         
         idx_signo = np.flatnonzero(N_vals[:-1] * N_vals[1:] < 0.0)
@@ -117,8 +140,7 @@ def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
         a0 = max(c_min, c_prev - dc0)
         b0 = min(c_max, c_prev + dc0)
 
-        N_a0 = N_equilibrio(a0)
-        N_b0 = N_equilibrio(b0)
+        N_a0, N_b0 = N_lote(np.array([a0, b0]))
 
         if abs(N_a0) < tol:
             roots = filtro([a0], es_prev)
@@ -153,17 +175,101 @@ def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
         
         return encontrar_raices(c_min, c_max, npts=50)
 
-    c_posibles = buscar_c()
+    def newton():
+        # Newton salvaguardado desde la raíz previa. Devuelve None si diverge.
+        c = c_prev
+        N, dN = N_tangente(c)
+        c_ant, N_ant = None, None
+        paso_max = 0.25 * h
+
+        for _ in range(max_iter_newton):
+            if abs(N) <= tol:
+                return c
+
+            # Si la tangente se anula (mesetas), usar la secante del paso anterior
+            if not np.isfinite(dN) or abs(dN) < 1e-12:
+                if c_ant is None or N == N_ant:
+                    return None
+                dN = (N - N_ant) / (c - c_ant)
+
+            dc = -N / dN
+            dc = max(-paso_max, min(paso_max, dc))
+
+            # Retroceso: exigir que |N| disminuya
+            for _ in range(6):
+                c_nuevo = c + dc
+                N_nuevo, dN_nuevo = N_tangente(c_nuevo)
+                if abs(N_nuevo) < abs(N):
+                    break
+                dc *= 0.5
+            else:
+                return None
+
+            c_ant, N_ant = c, N
+            c, N, dN = c_nuevo, N_nuevo, dN_nuevo
+            if abs(c - c_prev) > 3.0 * h:
+                return None
+
+        return c if abs(N) <= tol else None
+
+    def raiz_de_buscar_c(c_raiz):
+        # Newton puede saltar a otra rama después del pico: la raíz se acepta
+        # solo si está en el intento directo de buscar_c y N no cambia de
+        # signo a menos distancia de c_prev (por ambos lados)
+        d = c_raiz - c_prev
+        if abs(d) > 0.02 * h or not c_min <= c_raiz <= c_max:
+            return False
+        if d == 0.0:
+            return True
+        N_vals = N_lote(c_prev + d * np.linspace(-1.0, 0.9, 8))
+        return not np.any(N_vals[:-1] * N_vals[1:] <= 0.0)
+
+    metodo_usado = "brentq"
+    c_posibles = []
+    if metodo == "newton" and c_prev is not None:
+        c_newton = newton()
+        if c_newton is not None and raiz_de_buscar_c(c_newton):
+            c_posibles = filtro([c_newton], es_max(c_prev, phi_prev))
+        metodo_usado = "newton" if c_posibles else "newton->brentq"
+
+    if not c_posibles:
+        c_posibles = buscar_c()
+
+    if estadisticas is not None:
+        estadisticas["metodo"] = metodo_usado
+        estadisticas["iteraciones"] = contador["iteraciones"]
+        estadisticas["evaluaciones"] = contador["evaluaciones"]
+
     if not c_posibles:
         return None, None
 
     c = c_posibles[0] if c_prev is None else min(c_posibles, key=lambda x: abs(x - c_prev))
-    M = resultantes(c, phi, cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core)[1]
+    M = seccion.M(c, phi)
     return M, c
 
 # Funcion para obtener el diagrama momento-curvatura
-def diagrama_MC(cover, core, As, tol, h, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core):
-    
+def diagrama_MC(cover, core, As, tol, h, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core,
+                metodo="brentq", registro=None):
+    """
+    Diagrama momento-curvatura a partir de los datos sueltos de la sección.
+    Empaqueta la sección en un FiberSection y llama a diagrama_MC_seccion.
+    """
+    seccion = FiberSection.desde_parametros(
+        cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu,
+        P, datos_h, sg_cover, sg_core, h=h,
+    )
+    return diagrama_MC_seccion(seccion, tol, metodo=metodo, registro=registro)
+
+def diagrama_MC_seccion(seccion, tol, metodo="brentq", registro=None):
+    """
+    Diagrama momento-curvatura por incrementos de curvatura sobre una
+    sección empaquetada (FiberSection).
+
+    metodo   : solver del eje neutro en momrot ("brentq" o "newton")
+    registro : lista opcional; por cada paso se agrega un dict con phi,
+               método usado, iteraciones y evaluaciones de resultantes
+    """
+    h = seccion.h
     dphi_min, dphi_max = 2e-8, 5e-5
     phi_ini, dphi_ini = 2e-5, 1e-6
 
@@ -183,8 +289,13 @@ def diagrama_MC(cover, core, As, tol, h, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh
     n_pts_extra = 4
 
     for _ in range(1000):
-        Mi, ci = momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
-                        fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core, c_prev, phi_prev)
+        estadisticas = {} if registro is not None else None
+        Mi, ci = momrot(seccion, c_min, c_max, phi, tol, h, c_prev, phi_prev,
+                        metodo=metodo, estadisticas=estadisticas)
+        if registro is not None:
+            estadisticas["phi"] = phi
+            estadisticas["convergio"] = Mi is not None
+            registro.append(estadisticas)
 
         # No hay solucion de equilibrio: falla numerica/fisica.
         # Si falla, probar reduciendo paso antes de salir.
@@ -230,6 +341,24 @@ def diagrama_MC(cover, core, As, tol, h, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh
 
     return np.array(M_vals, dtype=float), np.array(phi_vals, dtype=float), np.array(c_vals, dtype=float)
 
+def resumen_registro(registro):
+    """
+    Resume el registro por pasos de diagrama_MC: pasos, evaluaciones
+    totales y por paso, iteraciones de Newton y pasos que cayeron al barrido.
+    """
+    pasos = [r for r in registro if r.get("convergio")]
+    evaluaciones = np.array([r["evaluaciones"] for r in registro], dtype=float)
+    metodos = [r.get("metodo") for r in registro]
+    return {
+        "pasos": len(pasos),
+        "pasos_fallidos": len(registro) - len(pasos),
+        "evaluaciones_totales": int(evaluaciones.sum()) if len(evaluaciones) else 0,
+        "evaluaciones_por_paso": float(evaluaciones.mean()) if len(evaluaciones) else 0.0,
+        "iteraciones_newton": [r["iteraciones"] for r in registro if r.get("metodo") == "newton"],
+        "pasos_newton": metodos.count("newton"),
+        "pasos_respaldo": metodos.count("newton->brentq"),
+    }
+
 # =========================
 # Postproceso M-φ
 # =========================
@@ -493,7 +622,7 @@ def _f(datos, clave, default=None):
     return float(valor)
 
 
-def _datos_h_mander_confinado(datos_hormigon, datos_acero, datos_seccion):
+def _mander_confinado(datos_hormigon, datos_acero, datos_seccion):
     fc0 = _f(datos_hormigon, "esfuerzo_fc")
     Ec  = _f(datos_hormigon, "modulo_Ec")
     ec0 = _f(datos_hormigon, "def_max_sin_confinar")
@@ -521,20 +650,12 @@ def _datos_h_mander_confinado(datos_hormigon, datos_acero, datos_seccion):
 
     fyh = fy
 
-    datos_h_base = (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, None, None)
-
-    fcc = mander_c(
-        ec=np.array([0.0]),
-        fc0=fc0,
-        ec0=ec0,
-        esp=esp,
-        Ec=Ec,
-        datos_h=datos_h_base,
-        N=3,
+    # Parámetros de confinamiento (fcc incluido) calculados una sola vez
+    mander = ManderConfinado(
+        fc0, ec0, esp, Ec,
+        (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, None, None),
     )
 
-    datos_h_ecu = (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, None, fcc)
-
     ecu = buscar_ecu(
         fc0=fc0,
         ec0=ec0,
@@ -546,10 +667,10 @@ def _datos_h_mander_confinado(datos_hormigon, datos_acero, datos_seccion):
         ey=ey,
         esh=esh,
         esu=esu,
-        datos_h=datos_h_ecu,
+        datos_h=mander,
     )
 
-    return (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, ecu, fcc)
+    return mander.con_ecu(ecu)
 
 
 def calcular_momento_curvatura(
@@ -563,6 +684,8 @@ def calcular_momento_curvatura(
     modelo_core,
     P=0.0,
     tol=1e-5,
+    metodo="brentq",
+    registro=None,
 ):
     tipo = tipo_seccion.strip().lower()
     eje = eje.strip().lower()
@@ -609,7 +732,7 @@ def calcular_momento_curvatura(
         P_real = _f(datos_seccion, "disenar_columna_axial", P)
 
         if usa_mander_c:
-            datos_h = _datos_h_mander_confinado(datos_hormigon, datos_acero, datos_seccion)
+            datos_h = _mander_confinado(datos_hormigon, datos_acero, datos_seccion)
 
     elif tipo == "viga":
         b      = _f(datos_seccion, "disenar_viga_base")
@@ -637,6 +760,7 @@ def calcular_momento_curvatura(
         fc0, ec0, esp, Ec,
         fy, fsu, Es, ey, esh, esu,
         P_real, datos_h, sg_cover, sg_core,
+        metodo=metodo, registro=registro,
     )
 
     phi_fin = phi * 100.0
@@ -652,6 +776,7 @@ def calcular_series_mc(
     datos_fibras,
     tipo_seccion,
     eje,
+    metodo="brentq",
 ):
     tipo = tipo_seccion.strip().lower()
 
@@ -660,14 +785,14 @@ def calcular_series_mc(
 
     phi, M, _, p = calcular_momento_curvatura(
         datos_hormigon, datos_acero, datos_seccion, datos_fibras,
-        tipo, eje, "hognestad", "hognestad"
+        tipo, eje, "hognestad", "hognestad", metodo=metodo
     )
     series["hognestad"] = (phi, M)
     parametros["hognestad"] = p
 
     phi, M, _, p = calcular_momento_curvatura(
         datos_hormigon, datos_acero, datos_seccion, datos_fibras,
-        tipo, eje, "mander_u", "mander_u"
+        tipo, eje, "mander_u", "mander_u", metodo=metodo
     )
     series["mander_no_conf"] = (phi, M)
     parametros["mander_no_conf"] = p
@@ -675,7 +800,7 @@ def calcular_series_mc(
     if tipo == "columna":
         phi, M, _, p = calcular_momento_curvatura(
             datos_hormigon, datos_acero, datos_seccion, datos_fibras,
-            tipo, eje, "mander_u", "mander_c"
+            tipo, eje, "mander_u", "mander_c", metodo=metodo
         )
         series["mander_conf"] = (phi, M)
         parametros["mander_conf"] = p
@@ -689,6 +814,7 @@ def calcular_resultados_seccion(
     datos_fibras,
     tipo_seccion,
     eje,
+    metodo="brentq",
 ):
     tipo = tipo_seccion.strip().lower()
 
@@ -699,6 +825,7 @@ def calcular_resultados_seccion(
         datos_fibras=datos_fibras,
         tipo_seccion=tipo,
         eje=eje,
+        metodo=metodo,
     )
 
     resultados = {
@@ -0,0 +1,761 @@
+"""
+Momento-curvatura biaxial de columnas sobre secciones de fibras 2D.
+
+La sección (FiberSection2D) guarda cada fibra y cada barra con su
+posición (x, y), así que el eje neutro puede tener cualquier ángulo theta
+(theta = 0 equivale al análisis con eje "x" y 90° al análisis con eje
+"y"). Los diagramas están controlados por deformación, como
+diagrama_MC_deformacion: en cada paso se fija la deformación de la fibra
+extrema del núcleo y se busca la profundidad del eje neutro que equilibra
+la carga axial.
+
+    diagrama_MC_biaxial    un diagrama por ángulo del eje neutro; todos los
+                           ángulos se resuelven a la vez (una matriz
+                           ángulos x fibras por evaluación)
+    diagrama_MC_direccion  diagrama para una dirección fija del momento:
+                           en cada paso se busca además el ángulo del eje
+                           neutro con el que el momento resultante queda en
+                           esa dirección (en secciones no simétricas respecto
+                           al eje de flexión el eje neutro gira)
+    capacidad_biaxial      barrido de ángulos con el momento máximo y la
+                           curvatura última de cada uno
+"""
+import numpy as np
+
+from kernel_fibras import FiberSection2D
+from momento_curvatura_parche_sap import _f, _illinois, _mander_confinado, sigma_hormigon
+from seccion import utilidades
+
+malla_2d = utilidades.malla_2d
+barras_columna_2d = utilidades.barras_columna_2d
+
+# Variación relativa máxima de d en un subpaso aceptado, como en diagrama_MC_deformacion
+SALTO_MAX = 0.05
+
+
+def construir_seccion_biaxial(
+    datos_hormigon,
+    datos_acero,
+    datos_seccion,
+    datos_fibras,
+    modelo_cover,
+    modelo_core,
+    P=0.0,
+    diagnostico=None,
+):
+    """
+    Lee los diccionarios de la interfaz de una columna y retorna la sección
+    de fibras 2D (FiberSection2D), con los mismos materiales que
+    construir_seccion.
+    diagnostico: dict opcional; con Mander confinado recibe en "buscar_ecu"
+    los datos de la búsqueda de la deformación última.
+    """
+    modelo_cover = modelo_cover.strip().lower()
+    modelo_core = modelo_core.strip().lower()
+
+    fc0 = _f(datos_hormigon, "esfuerzo_fc")
+    Ec  = _f(datos_hormigon, "modulo_Ec")
+    ec0 = _f(datos_hormigon, "def_max_sin_confinar")
+    esp = _f(datos_hormigon, "def_ultima_sin_confinar")
+
+    fy  = _f(datos_acero, "esfuerzo_fy")
+    fsu = _f(datos_acero, "esfuerzo_ultimo_acero")
+    Es  = _f(datos_acero, "modulo_Es")
+    ey  = _f(datos_acero, "def_fluencia_acero")
+    esh = _f(datos_acero, "def_inicio_endurecimiento")
+    esu = _f(datos_acero, "def_ultima_acero")
+
+    nf_x = int(_f(datos_fibras, "fibras_x"))
+    nf_y = int(_f(datos_fibras, "fibras_y"))
+
+    b        = _f(datos_seccion, "disenar_columna_base")
+    h        = _f(datos_seccion, "disenar_columna_altura")
+    r        = _f(datos_seccion, "disenar_columna_recubrimiento")
+    de       = _f(datos_seccion, "disenar_columna_diametro_transversal") / 10.0
+    nb_x     = int(_f(datos_seccion, "disenar_columna_varillasX_2"))
+    nb_y     = int(_f(datos_seccion, "disenar_columna_varillasY_2"))
+    d_edge   = _f(datos_seccion, "disenar_columna_diametro_longitudinal_2") / 10.0
+    d_corner = _f(datos_seccion, "disenar_columna_diametro_longitudinal_esq") / 10.0
+
+    cover, core = malla_2d(b, h, r, de, nf_x, nf_y)
+    As = barras_columna_2d(b, h, r, de, nb_x, nb_y, d_corner, d_edge)
+    P_real = _f(datos_seccion, "disenar_columna_axial", P)
+
+    datos_h = None
+    if "mander_c" in (modelo_cover, modelo_core):
+        diag_ecu = diagnostico.setdefault("buscar_ecu", {}) if diagnostico is not None else None
+        datos_h = _mander_confinado(datos_hormigon, datos_acero, datos_seccion, diag_ecu)
+
+    return FiberSection2D.desde_parametros(
+        cover, core, As,
+        fc0, ec0, esp, Ec,
+        fy, fsu, Es, ey, esh, esu,
+        P_real, datos_h, sigma_hormigon(modelo_cover), sigma_hormigon(modelo_core),
+    )
+
+
+def _grupo_control(seccion):
+    grupo = seccion.CORE if seccion.u_extremo(0.0, seccion.CORE) is not None else seccion.COVER
+    e_lim = seccion.deformaciones_ultimas[grupo]
+    if not np.isfinite(e_lim):
+        raise ValueError("La sección no tiene deformación última de hormigón definida.")
+    return grupo, e_lim
+
+
+def _profundidades(seccion, e, theta, u_ctrl, alcance, d_prev, tol, curvatura=None):
+    """
+    Profundidad d = u_ctrl - c del eje neutro que equilibra la carga axial
+    con deformación e en la fibra de control, para cada ángulo. Sin d_prev
+    (NaN) se hace un barrido global y se toma la primera raíz; con d_prev,
+    ventanas crecientes alrededor y la raíz más cercana. Con curvatura (un
+    arreglo por ángulo) se fija phi en lugar de e (control por curvatura).
+
+    Retorna:
+        d : arreglo por ángulo (NaN si no hay equilibrio)
+    """
+    m = len(theta)
+    if curvatura is None:
+        e = np.broadcast_to(np.asarray(e, dtype=float), (m,))
+
+        def N(idx, d):
+            return seccion.resultantes(u_ctrl[idx] - d, e[idx] / d, theta[idx])[0]
+    else:
+        def N(idx, d):
+            return seccion.resultantes(u_ctrl[idx] - d, curvatura[idx], theta[idx])[0]
+
+    def cambios(idx, d_vals):
+        k = d_vals.shape[1]
+        N_vals = N(np.repeat(idx, k), d_vals.ravel()).reshape(-1, k)
+        return N_vals, N_vals[:, :-1] * N_vals[:, 1:] <= 0.0
+
+    a = np.full(m, np.nan)
+    b = np.full(m, np.nan)
+    fa = np.full(m, np.nan)
+    fb = np.full(m, np.nan)
+
+    sin_previo = np.flatnonzero(np.isnan(d_prev))
+    if len(sin_previo):
+        d_vals = alcance[sin_previo, None] * np.geomspace(1e-3, 1e3, 121)[None, :]
+        N_vals, hay = cambios(sin_previo, d_vals)
+        j = hay.argmax(axis=1)
+        ok = hay.any(axis=1)
+        filas = np.flatnonzero(ok)
+        i = sin_previo[ok]
+        a[i], b[i] = d_vals[filas, j[ok]], d_vals[filas, j[ok] + 1]
+        fa[i], fb[i] = N_vals[filas, j[ok]], N_vals[filas, j[ok] + 1]
+
+    # Solo ventanas alrededor de la profundidad previa, para no saltar a
+    # otra rama de equilibrio
+    pendientes = np.flatnonzero(~np.isnan(d_prev))
+    for factor in (1.5, 3.0, 10.0):
+        if not len(pendientes):
+            break
+        d_vals = d_prev[pendientes, None] * np.geomspace(1 / factor, factor, 17)[None, :]
+        N_vals, hay = cambios(pendientes, d_vals)
+        distancia = np.abs(np.log(np.sqrt(d_vals[:, :-1] * d_vals[:, 1:]) / d_prev[pendientes, None]))
+        j = np.where(hay, distancia, np.inf).argmin(axis=1)
+        ok = hay.any(axis=1)
+        filas = np.flatnonzero(ok)
+        i = pendientes[ok]
+        a[i], b[i] = d_vals[filas, j[ok]], d_vals[filas, j[ok] + 1]
+        fa[i], fb[i] = N_vals[filas, j[ok]], N_vals[filas, j[ok] + 1]
+        pendientes = pendientes[~ok]
+
+    d = np.full(m, np.nan)
+    con_intervalo = np.flatnonzero(~np.isnan(a))
+    if len(con_intervalo):
+        d[con_intervalo] = _illinois(lambda idx, x: N(con_intervalo[idx], x),
+                                     a[con_intervalo], b[con_intervalo],
+                                     fa[con_intervalo], fb[con_intervalo], tol)
+    return d
+
+
+def _acero_max(seccion, d, e, theta, u_ctrl):
+    return np.abs(seccion.deformacion_acero(u_ctrl - d, e / d, theta)).max(axis=1)
+
+
+def _continuo(e_a, d_a, e_b, d_b):
+    # Mismo tramo de equilibrio: d no salta y la curvatura no retrocede
+    # (falso donde d_b es NaN)
+    return (np.abs(d_b - d_a) <= SALTO_MAX * d_a) & (e_b / d_b >= e_a / d_a)
+
+
+def _avanzar(seccion, e_a, d_a, e_obj, theta, u_ctrl, alcance, tol):
+    """
+    Lleva el equilibrio de cada ángulo de (e_a, d_a) a e_obj por el mismo
+    tramo, partiendo el incremento cuando d salta (otra rama) o no hay raíz
+    cerca de d_a, como avanzar en diagrama_MC_deformacion. El corte se da
+    por perdido cuando el subpaso baja de 1e-3 del incremento pedido: el
+    borde del tramo no se guarda (la curva sigue por curvatura desde el
+    punto previo), así que no hace falta ubicarlo con más precisión.
+
+    Retorna:
+        (e, d) alcanzados por ángulo (e = e_obj si no se cortó el tramo)
+    """
+    e_a, d_a, e_obj = (np.array(v, dtype=float) for v in (e_a, d_a, e_obj))
+    paso = e_obj - e_a
+    paso_min = 1e-3 * paso
+    en_curso = e_a < e_obj
+    fallo = np.zeros(len(e_a), dtype=bool)
+    while True:
+        idx = np.flatnonzero(en_curso)
+        if not len(idx):
+            break
+        e_b = np.minimum(e_a[idx] + paso[idx], e_obj[idx])
+        d_b = _profundidades(seccion, e_b, theta[idx], u_ctrl[idx], alcance[idx], d_a[idx], tol)
+        ok = _continuo(e_a[idx], d_a[idx], e_b, d_b)
+        e_a[idx[ok]], d_a[idx[ok]] = e_b[ok], d_b[ok]
+        # Tras un fallo el paso no crece: el siguiente intento es justo la
+        # deformación que falló, ahora desde más cerca
+        paso[idx] *= np.where(ok, np.where(fallo[idx], 1.0, 2.0), 0.5)
+        fallo[idx] = ~ok
+        en_curso[idx] = (e_a[idx] < e_obj[idx]) & (paso[idx] > paso_min[idx])
+    return e_a, d_a
+
+
+def _rotura_acero(seccion, e_a, e_b, d_b, theta, u_ctrl, alcance, d_prev, tol):
+    """
+    Bisección vectorizada sobre la deformación de control entre e_a (sin
+    rotura) y e_b (con rotura) hasta que la barra más traccionada llega a
+    esu. Cada estado se resuelve avanzando por el mismo tramo desde
+    (e_a, d_prev) inicial (_avanzar); sin d_prev (NaN), con el barrido
+    global. Retorna (e, d) del primer estado con rotura de cada ángulo.
+    """
+    e_a, e_b, d_b = (np.array(v, dtype=float) for v in (e_a, e_b, d_b))
+    e_0 = e_a.copy()
+    sin_previo = np.isnan(d_prev)
+    en_curso = np.ones(len(e_a), dtype=bool)
+    for _ in range(40):
+        idx = np.flatnonzero(en_curso)
+        if not len(idx):
+            break
+        e_m = 0.5 * (e_a[idx] + e_b[idx])
+        d_m = np.full(len(idx), np.nan)
+        s = sin_previo[idx]
+        if s.any():
+            d_m[s] = _profundidades(seccion, e_m[s], theta[idx[s]], u_ctrl[idx[s]], alcance[idx[s]],
+                                    d_prev[idx[s]], tol)
+        if (~s).any():
+            i = idx[~s]
+            e_alcanzada, d_avance = _avanzar(seccion, e_0[i], d_prev[i], e_m[~s], theta[i], u_ctrl[i], alcance[i], tol)
+            d_m[~s] = np.where(e_alcanzada == e_m[~s], d_avance, np.nan)
+        valido = ~np.isnan(d_m)
+        sobre = np.zeros(len(idx), dtype=bool)
+        sobre[valido] = _acero_max(seccion, d_m[valido], e_m[valido], theta[idx][valido],
+                                   u_ctrl[idx][valido]) > seccion.esu
+        e_b[idx[sobre]], d_b[idx[sobre]] = e_m[sobre], d_m[sobre]
+        e_a[idx[valido & ~sobre]] = e_m[valido & ~sobre]
+        en_curso[idx[~valido]] = False
+        en_curso[idx] &= e_b[idx] - e_a[idx] > 1e-6 * e_b[idx]
+    return e_b, d_b
+
+
+def _raiz_mas_cercana(seccion, phi, theta, u_ctrl, alcance, d_prev, tol):
+    """
+    Respaldo de _profundidades con curvatura fija para un ángulo, como la
+    búsqueda de momrot: ventanas crecientes alrededor de d_prev y, en cada
+    una, regula falsi sobre todos los cambios de signo de N (no solo el más
+    cercano, que puede ser un salto de N sin raíz cuando una fila de fibras
+    pierde su esfuerzo). Retorna la raíz más cercana a d_prev o NaN.
+    """
+    for ventana in (0.02, 0.04, 0.08, 0.15, 0.35, 0.75, 1.5, 3.0):
+        d_vals = d_prev + ventana * alcance * np.linspace(-1.0, 1.0, 60)
+        N_vals = seccion.resultantes(u_ctrl - d_vals, np.full(60, phi), np.full(60, theta))[0]
+        j = np.flatnonzero(N_vals[:-1] * N_vals[1:] <= 0.0)
+        if not len(j):
+            continue
+        raices = _illinois(lambda idx, x: seccion.resultantes(u_ctrl - x, np.full(len(x), phi),
+                                                              np.full(len(x), theta))[0],
+                           d_vals[j], d_vals[j + 1], N_vals[j], N_vals[j + 1], tol)
+        raices = raices[~np.isnan(raices)]
+        if len(raices):
+            return float(raices[np.abs(raices - d_prev).argmin()])
+    return np.nan
+
+
+def _continuar_por_curvatura(seccion, e_lim, theta, u_ctrl, alcance, phi, d, dphi_max, tol, max_pasos=2000):
+    """
+    Tramo final de diagrama_MC_biaxial para los ángulos cuyo control por
+    deformación ya no tiene un equilibrio continuo, como en
+    diagrama_MC_deformacion: incrementos de curvatura desde el último punto
+    (phi, d) hasta que la fibra de control llega a e_lim o el acero a esu,
+    con bisección sobre phi para cerrar en el estado límite. Si el límite
+    cae dentro de un salto de la raíz (d varía más de SALTO_MAX), la curva
+    termina en el último paso antes del salto.
+
+    Retorna:
+        (puntos, limite): por ángulo, la lista de pares (phi, d) agregados y
+        el estado límite ("hormigon", "acero" o "sin_equilibrio")
+    """
+    m = len(theta)
+    dphi_min = 2e-8
+    phi, d, dphi = (np.array(v, dtype=float) for v in (phi, d, dphi_max))
+    puntos = [[] for _ in range(m)]
+    limite = ["sin_equilibrio"] * m
+    activo = np.ones(m, dtype=bool)
+
+    def estado(idx, phi_b, d_a):
+        # d en phi_b (NaN sin equilibrio) y límite alcanzado: 0 ninguno,
+        # 1 hormigón, 2 acero
+        d_b = _profundidades(seccion, None, theta[idx], u_ctrl[idx], alcance[idx], d_a, tol, curvatura=phi_b)
+        for j in np.flatnonzero(np.isnan(d_b)):
+            d_b[j] = _raiz_mas_cercana(seccion, phi_b[j], theta[idx[j]], u_ctrl[idx[j]], alcance[idx[j]],
+                                       d_a[j], tol)
+        codigo = np.zeros(len(idx), dtype=int)
+        ok = np.flatnonzero(~np.isnan(d_b))
+        e_b = phi_b[ok] * d_b[ok]
+        codigo[ok[e_b >= e_lim]] = 1
+        codigo[ok[_acero_max(seccion, d_b[ok], e_b, theta[idx[ok]], u_ctrl[idx[ok]]) > seccion.esu]] = 2
+        return d_b, codigo
+
+    for _ in range(max_pasos):
+        idx = np.flatnonzero(activo)
+        if not len(idx):
+            break
+        phi_b = phi[idx] + dphi[idx]
+        d_b, codigo = estado(idx, phi_b, d[idx])
+
+        fallo = np.isnan(d_b)
+        i = idx[fallo]
+        dphi[i] *= 0.5
+        activo[i[dphi[i] < dphi_min]] = False
+
+        regular = ~fallo & (codigo == 0)
+        i = idx[regular]
+        for j, p, q in zip(i, phi_b[regular], d_b[regular]):
+            puntos[j].append((p, q))
+        phi[i], d[i] = phi_b[regular], d_b[regular]
+        dphi[i] = np.minimum(1.5 * dphi[i], dphi_max[i])
+
+        # Bisección sobre phi hasta el estado límite; cada estado se resuelve
+        # desde el último paso
+        for j, p_b, q_b, cod in zip(idx[codigo > 0], phi_b[codigo > 0], d_b[codigo > 0], codigo[codigo > 0]):
+            fila, p_a = np.array([j]), phi[j]
+            for _ in range(40):
+                if p_b - p_a <= 1e-6 * p_b:
+                    break
+                p_m = 0.5 * (p_a + p_b)
+                q_m, cod_m = estado(fila, np.array([p_m]), d[fila])
+                if np.isnan(q_m[0]):
+                    break
+                if cod_m[0] == 0:
+                    p_a = p_m
+                else:
+                    p_b, q_b, cod = p_m, q_m[0], cod_m[0]
+            if abs(q_b - d[j]) <= SALTO_MAX * d[j]:
+                puntos[j].append((p_b, q_b))
+            limite[j] = ("hormigon", "acero")[cod - 1]
+            activo[j] = False
+    return puntos, limite
+
+
+def diagrama_MC_biaxial(seccion, angulos, tol, n_pasos=60, progreso=None):
+    """
+    Diagramas momento-curvatura controlados por deformación para varios
+    ángulos del eje neutro, resueltos a la vez.
+
+    Como en diagrama_MC_deformacion, cada paso avanza por el mismo tramo de
+    equilibrio (_avanzar: si d salta más de SALTO_MAX o phi retrocede, el
+    incremento se parte a la mitad). Los ángulos cuyo tramo termina antes
+    del estado límite siguen con incrementos de curvatura
+    (_continuar_por_curvatura), así que phi es siempre creciente.
+
+    Parámetros:
+        seccion  : FiberSection2D
+        angulos  : ángulos theta del eje neutro en grados
+        tol      : tolerancia de equilibrio en N
+        n_pasos  : pasos del programa de deformaciones de la fibra de
+                   control, e_k = e_lim * (k / n_pasos)^1.5 (como en
+                   diagrama_MC_deformacion)
+        progreso : función opcional progreso(pasos)
+
+    Retorna:
+        dict con arreglos (ángulos x puntos, el origen incluido; NaN en los
+        pasos sin equilibrio del barrido inicial o posteriores al fin de
+        cada curva). Las columnas 1..n_pasos siguen el programa de
+        deformaciones; el tramo por curvatura ocupa las columnas siguientes
+        al último paso del programa, agregando columnas si hace falta:
+            "angulos", "phi", "c", "deformacion", "Mx", "My",
+            "M" (módulo del momento), "direccion" (ángulo del momento en
+            grados) y "limite" (lista por ángulo: "hormigon", "acero" o
+            "sin_equilibrio")
+    """
+    angulos = np.atleast_1d(np.asarray(angulos, dtype=float))
+    theta = np.radians(angulos)
+    m = len(theta)
+    grupo, e_lim = _grupo_control(seccion)
+    u_ctrl = seccion.u_extremo(theta, grupo)
+    alcance = np.ptp(seccion.coordenada(theta), axis=1)
+
+    forma = (m, n_pasos + 1)
+    salida = {k: np.full(forma, np.nan) for k in ("phi", "c", "deformacion", "Mx", "My")}
+    for k in salida:
+        salida[k][:, 0] = 0.0
+
+    def guardar(i, columnas, e, d):
+        phi = e / d
+        c = u_ctrl[i] - d
+        _, Mx, My = seccion.resultantes(c, phi, theta[i])
+        salida["phi"][i, columnas] = phi
+        salida["c"][i, columnas] = c
+        salida["deformacion"][i, columnas] = e
+        salida["Mx"][i, columnas] = -Mx
+        salida["My"][i, columnas] = -My
+
+    e_pasos = e_lim * (np.arange(1, n_pasos + 1) / n_pasos) ** 1.5
+    e_prev = np.zeros(m)
+    d_prev = np.full(m, np.nan)
+    phi_ant = np.zeros(m)
+    k_ult = np.zeros(m, dtype=int)
+    activo = np.ones(m, dtype=bool)
+    rama_perdida = np.zeros(m, dtype=bool)
+    limite = ["hormigon"] * m
+    fallos, max_fallos = np.zeros(m, dtype=int), 3
+
+    for k, e in enumerate(e_pasos, start=1):
+        idx = np.flatnonzero(activo)
+        if not len(idx):
+            break
+        e_k = np.full(len(idx), e)
+        d = np.full(len(idx), np.nan)
+        sin_previo = np.isnan(d_prev[idx])
+        if sin_previo.any():
+            i = idx[sin_previo]
+            d[sin_previo] = _profundidades(seccion, e_k[sin_previo], theta[i], u_ctrl[i], alcance[i],
+                                           d_prev[i], tol)
+        if (~sin_previo).any():
+            i = idx[~sin_previo]
+            e_alcanzada, d_avance = _avanzar(seccion, e_prev[i], d_prev[i], e_k[~sin_previo], theta[i],
+                                             u_ctrl[i], alcance[i], tol)
+            # El tramo continuo termina antes de e (una fila de fibras pierde
+            # su esfuerzo y la raíz salta): se sigue por curvatura desde el
+            # último punto del programa, sin el borde del tramo
+            perdida = e_alcanzada < e
+            rama_perdida[i[perdida]] = True
+            activo[i[perdida]] = False
+            d[~sin_previo] = np.where(perdida, np.nan, d_avance)
+
+        valido = ~np.isnan(d)
+        rotura = np.zeros(len(idx), dtype=bool)
+        rotura[valido] = _acero_max(seccion, d[valido], e, theta[idx][valido], u_ctrl[idx][valido]) > seccion.esu
+        if rotura.any():
+            i = idx[rotura]
+            e_k[rotura], d[rotura] = _rotura_acero(seccion, e_prev[i], e_k[rotura], d[rotura], theta[i],
+                                                   u_ctrl[i], alcance[i], d_prev[i], tol)
+            for j in i:
+                limite[j] = "acero"
+            activo[i] = False
+
+        # Solo en el barrido global inicial (sin punto previo) un paso sin
+        # equilibrio se salta, hasta max_fallos veces
+        fallidos = idx[~valido & sin_previo]
+        fallos[fallidos] += 1
+        for j in fallidos[fallos[fallidos] > max_fallos]:
+            limite[j] = "sin_equilibrio"
+            activo[j] = False
+
+        i = idx[valido]
+        guardar(i, k, e_k[valido], d[valido])
+        phi_ant[i] = np.where(np.isnan(d_prev[i]), 0.0, e_prev[i] / d_prev[i])
+        e_prev[i], d_prev[i], k_ult[i] = e_k[valido], d[valido], k
+        if progreso is not None:
+            progreso(k)
+
+    perdidos = np.flatnonzero(rama_perdida)
+    if len(perdidos):
+        # Paso del último tramo por deformación: mantiene la densidad de puntos del programa
+        phi_ult = e_prev[perdidos] / d_prev[perdidos]
+        dphi_max = np.clip(phi_ult - phi_ant[perdidos], 2e-8, 5e-5)
+        puntos, limite_curvatura = _continuar_por_curvatura(seccion, e_lim, theta[perdidos], u_ctrl[perdidos],
+                                                            alcance[perdidos], phi_ult, d_prev[perdidos],
+                                                            dphi_max, tol)
+        columnas = max(k_ult[j] + len(p) + 1 for j, p in zip(perdidos, puntos))
+        if columnas > forma[1]:
+            for clave in salida:
+                salida[clave] = np.pad(salida[clave], ((0, 0), (0, columnas - forma[1])),
+                                       constant_values=np.nan)
+        for j, p, lim in zip(perdidos, puntos, limite_curvatura):
+            limite[j] = lim
+            if p:
+                phi, d = np.array(p).T
+                guardar(np.full(len(p), j), k_ult[j] + 1 + np.arange(len(p)), phi * d, d)
+
+    salida["M"] = np.hypot(salida["Mx"], salida["My"])
+    salida["direccion"] = np.degrees(np.arctan2(salida["My"], salida["Mx"]))
+    salida["angulos"] = angulos
+    salida["limite"] = limite
+    return salida
+
+
+def _diferencia_angular(a, b):
+    return (a - b + np.pi) % (2 * np.pi) - np.pi
+
+
+def diagrama_MC_direccion(seccion, alfa, tol, n_pasos=60, n_candidatos=9, refinamientos=6, progreso=None):
+    """
+    Diagrama momento-curvatura controlado por deformación para una
+    dirección fija alfa del momento resultante (grados, medida como
+    atan2(My, Mx)). En cada paso se buscan a la vez la profundidad y el
+    ángulo theta del eje neutro: se evalúan n_candidatos ángulos de una
+    vez alrededor del ángulo previo, se ubica el cambio de signo de la
+    desviación del momento y el intervalo se subdivide refinamientos veces.
+
+    Cada paso avanza por el mismo tramo de equilibrio, como en
+    diagrama_MC_biaxial; si el tramo termina antes del estado límite, la
+    curva sigue con incrementos de curvatura (ángulo y profundidad se buscan
+    con phi fijo), así que phi es siempre creciente.
+
+    Retorna:
+        dict con arreglos por paso (origen incluido): "phi", "c", "theta"
+        (grados), "deformacion", "Mx", "My", "M", y "limite" ("hormigon",
+        "acero" o "sin_equilibrio")
+    """
+    grupo, e_lim = _grupo_control(seccion)
+    alfa_rad = np.radians(alfa)
+
+    def evaluar(e, thetas, d_prev, phi=None):
+        # Con phi (tramo por curvatura) se fija la curvatura en lugar de e
+        u_ctrl = seccion.u_extremo(thetas, grupo)
+        alcance = np.ptp(seccion.coordenada(thetas), axis=1)
+        n = len(thetas)
+        if phi is None:
+            d = _profundidades(seccion, np.full(n, e), thetas, u_ctrl, alcance, np.full(n, d_prev), tol)
+            curvatura = e / d
+        else:
+            d = _profundidades(seccion, None, thetas, u_ctrl, alcance, np.full(n, d_prev), tol,
+                               curvatura=np.full(n, phi))
+            for j in np.flatnonzero(np.isnan(d)):
+                d[j] = _raiz_mas_cercana(seccion, phi, thetas[j], u_ctrl[j], alcance[j], d_prev, tol)
+            curvatura = np.full(n, phi)
+        g = np.full(n, np.nan)
+        ok = ~np.isnan(d)
+        _, Mx, My = seccion.resultantes(u_ctrl[ok] - d[ok], curvatura[ok], thetas[ok])
+        g[ok] = _diferencia_angular(np.arctan2(-My, -Mx), alfa_rad)
+        return d, g
+
+    def intervalo(thetas, g, theta_ref):
+        # Cambio de signo entre candidatos consecutivos; se descarta el salto
+        # de ±pi de la diferencia angular
+        hay = (g[:-1] * g[1:] <= 0.0) & (np.abs(g[:-1]) < np.pi / 2) & (np.abs(g[1:]) < np.pi / 2)
+        if not hay.any():
+            return None
+        medio = 0.5 * (thetas[:-1] + thetas[1:])
+        j = int(np.where(hay, np.abs(_diferencia_angular(medio, theta_ref)), np.inf).argmin())
+        return j
+
+    def equilibrio(e, theta_prev, d_prev, phi=None):
+        if theta_prev is None:
+            anchos = (np.pi,)
+            theta_ref = alfa_rad
+        else:
+            anchos = (np.radians(10.0), np.radians(30.0), np.pi)
+            theta_ref = theta_prev
+        for ancho in anchos:
+            n = n_candidatos if ancho < np.pi else max(n_candidatos, 73)
+            thetas = theta_ref + np.linspace(-ancho, ancho, n)
+            d, g = evaluar(e, thetas, d_prev, phi)
+            j = intervalo(thetas, g, theta_ref)
+            if j is not None:
+                break
+        else:
+            return None, None
+
+        for _ in range(refinamientos):
+            thetas = np.linspace(thetas[j], thetas[j + 1], n_candidatos)
+            d, g = evaluar(e, thetas, d_prev, phi)
+            j = intervalo(thetas, g, theta_ref)
+            if j is None:
+                return None, None
+
+        # Interpolación lineal dentro del último intervalo
+        g_a, g_b = g[j], g[j + 1]
+        t = 0.5 if g_a == g_b else g_a / (g_a - g_b)
+        theta = thetas[j] + t * (thetas[j + 1] - thetas[j])
+        d, _ = evaluar(e, np.array([theta]), d[j], phi)
+        if np.isnan(d[0]):
+            return None, None
+        return theta, float(d[0])
+
+    def acero_max(theta, d, e):
+        u_ctrl = seccion.u_extremo(theta, grupo)
+        return float(_acero_max(seccion, np.array([d]), e, np.array([theta]), u_ctrl)[0])
+
+    def avanzar(e_a, theta_a, d_a, e_obj):
+        # Como _avanzar, para un solo ángulo que además se busca en cada subpaso
+        paso = e_obj - e_a
+        paso_min = 1e-3 * paso
+        fallo = False
+        while e_a < e_obj:
+            e_b = min(e_a + paso, e_obj)
+            theta_b, d_b = equilibrio(e_b, theta_a, d_a)
+            if _continuo(e_a, d_a, e_b, np.nan if d_b is None else d_b):
+                e_a, theta_a, d_a = e_b, theta_b, d_b
+                paso *= 1.0 if fallo else 2.0
+                fallo = False
+            else:
+                paso *= 0.5
+                fallo = True
+                if paso <= paso_min:
+                    break
+        return e_a, theta_a, d_a
+
+    pasos = {k: [0.0] for k in ("phi", "c", "theta", "deformacion", "Mx", "My")}
+
+    def agregar(theta, d, phi):
+        u_ctrl = float(seccion.u_extremo(theta, grupo)[0])
+        c = u_ctrl - d
+        _, Mx, My = seccion.resultantes(c, phi, theta)
+        for clave, valor in (("phi", phi), ("c", c), ("theta", np.degrees(theta)), ("deformacion", phi * d),
+                             ("Mx", -Mx[0]), ("My", -My[0])):
+            pasos[clave].append(float(valor))
+        if progreso is not None:
+            progreso(len(pasos["phi"]) - 1)
+
+    e_pasos = e_lim * (np.arange(1, n_pasos + 1) / n_pasos) ** 1.5
+    e_prev, theta_prev, d_prev = 0.0, None, np.nan
+    limite = "hormigon"
+    fallos, max_fallos = 0, 3
+    rama_perdida = False
+
+    for e in e_pasos:
+        if theta_prev is None:
+            theta, d = equilibrio(e, None, d_prev)
+        else:
+            e_alcanzada, theta, d = avanzar(e_prev, theta_prev, d_prev, e)
+            if e_alcanzada < e:
+                # El tramo continuo termina antes de e: se sigue por curvatura
+                # desde el último punto del programa
+                rama_perdida = True
+                break
+
+        if d is not None and acero_max(theta, d, e) > seccion.esu:
+            limite = "acero"
+            e_a, e_b, theta_b, d_b = e_prev, e, theta, d
+            for _ in range(40):
+                e_m = 0.5 * (e_a + e_b)
+                if theta_prev is None:
+                    theta_m, d_m = equilibrio(e_m, None, d_prev)
+                else:
+                    e_alcanzada, theta_m, d_m = avanzar(e_prev, theta_prev, d_prev, e_m)
+                    d_m = d_m if e_alcanzada == e_m else None
+                if d_m is None:
+                    break
+                if acero_max(theta_m, d_m, e_m) > seccion.esu:
+                    e_b, theta_b, d_b = e_m, theta_m, d_m
+                else:
+                    e_a = e_m
+                if e_b - e_a <= 1e-6 * e_b:
+                    break
+            e, theta, d = e_b, theta_b, d_b
+
+        # Solo en el barrido global inicial un paso sin equilibrio se salta
+        if d is None:
+            fallos += 1
+            if fallos > max_fallos:
+                limite = "sin_equilibrio"
+                break
+            continue
+        fallos = 0
+
+        agregar(theta, d, e / d)
+        e_prev, theta_prev, d_prev = e, theta, d
+
+        if limite == "acero":
+            break
+
+    if rama_perdida:
+        limite = _continuar_direccion_por_curvatura(seccion, e_lim, equilibrio, acero_max, pasos, agregar,
+                                                    theta_prev, d_prev)
+
+    salida = {k: np.array(v, dtype=float) for k, v in pasos.items()}
+    salida["M"] = np.hypot(salida["Mx"], salida["My"])
+    salida["limite"] = limite
+    return salida
+
+
+def _continuar_direccion_por_curvatura(seccion, e_lim, equilibrio, acero_max, pasos, agregar, theta, d,
+                                       max_pasos=2000):
+    """
+    Tramo final por curvatura de diagrama_MC_direccion, con los mismos
+    criterios que _continuar_por_curvatura: equilibrio(e, theta, d, phi)
+    busca ángulo y profundidad con phi fijo y agregar(theta, d, phi) guarda
+    cada punto. Retorna el estado límite alcanzado.
+    """
+    dphi_min = 2e-8
+    phi = pasos["phi"][-1]
+    dphi_max = float(np.clip(phi - pasos["phi"][-2], dphi_min, 5e-5))
+    dphi = dphi_max
+
+    def estado(phi_b, theta_a, d_a):
+        # (theta, d, límite alcanzado o None) en phi_b; d None sin equilibrio
+        theta_b, d_b = equilibrio(None, theta_a, d_a, phi_b)
+        if d_b is None:
+            return None, None, None
+        if acero_max(theta_b, d_b, phi_b * d_b) > seccion.esu:
+            return theta_b, d_b, "acero"
+        if phi_b * d_b >= e_lim:
+            return theta_b, d_b, "hormigon"
+        return theta_b, d_b, None
+
+    for _ in range(max_pasos):
+        phi_b = phi + dphi
+        theta_b, d_b, limite = estado(phi_b, theta, d)
+        if d_b is None:
+            dphi *= 0.5
+            if dphi < dphi_min:
+                return "sin_equilibrio"
+            continue
+
+        if limite is not None:
+            phi_a = phi
+            for _ in range(40):
+                if phi_b - phi_a <= 1e-6 * phi_b:
+                    break
+                phi_m = 0.5 * (phi_a + phi_b)
+                theta_m, d_m, limite_m = estado(phi_m, theta, d)
+                if d_m is None:
+                    break
+                if limite_m is None:
+                    phi_a = phi_m
+                else:
+                    phi_b, theta_b, d_b, limite = phi_m, theta_m, d_m, limite_m
+            if abs(d_b - d) <= SALTO_MAX * d:
+                agregar(theta_b, d_b, phi_b)
+            return limite
+
+        agregar(theta_b, d_b, phi_b)
+        phi, theta, d = phi_b, theta_b, d_b
+        dphi = min(1.5 * dphi, dphi_max)
+    return "sin_equilibrio"
+
+
+def capacidad_biaxial(seccion, n_angulos=36, tol=1e-5, n_pasos=60):
+    """
+    Estudio biaxial de una columna: diagrama_MC_biaxial para n_angulos
+    ángulos del eje neutro repartidos en 360° y, por ángulo, el momento
+    máximo y la curvatura última.
+
+    Retorna:
+        dict con "curvas" (salida de diagrama_MC_biaxial) y arreglos por
+        ángulo: "angulos", "Mmax", "Mx_max", "My_max" (componentes en el
+        momento máximo), "phi_Mmax", "phi_u" y "limite"
+    """
+    angulos = np.arange(n_angulos) * 360.0 / n_angulos
+    curvas = diagrama_MC_biaxial(seccion, angulos, tol, n_pasos=n_pasos)
+
+    M = np.where(np.isnan(curvas["M"]), -np.inf, curvas["M"])
+    i_max = M.argmax(axis=1)
+    filas = np.arange(n_angulos)
+    phi = curvas["phi"]
+    ultimo = np.where(np.isnan(phi), -1, np.arange(phi.shape[1])[None, :]).max(axis=1)
+
+    return {
+        "curvas": curvas,
+        "angulos": angulos,
+        "Mmax": curvas["M"][filas, i_max],
+        "Mx_max": curvas["Mx"][filas, i_max],
+        "My_max": curvas["My"][filas, i_max],
+        "phi_Mmax": phi[filas, i_max],
+        "phi_u": phi[filas, ultimo],
+        "limite": curvas["limite"],
+    }
@@ -0,0 +1,198 @@
+"""
+Familias de curvas momento-curvatura de columnas para varios niveles de
+carga axial (definición de rótulas plásticas con interacción P-M).
+
+Todas las curvas usan la misma malla de fibras y los mismos materiales:
+la sección se construye una vez por proceso y cada nivel es una copia con
+otra carga axial (FiberSection.con_carga). Los niveles se recorren en
+orden de carga y el primer paso de cada curva parte de la profundidad del
+eje neutro extrapolada desde los niveles vecinos ya calculados, en lugar
+del barrido global de momrot.
+
+Con varios procesos los niveles se reparten en bloques contiguos (uno por
+proceso); dentro de cada bloque los niveles se calculan en orden con el
+arranque en caliente, y solo el primer nivel de cada bloque parte en frío.
+
+    niveles_axiales        niveles de carga entre tracción y compresión
+    numero_bloques         bloques (tareas) en que se reparten los niveles
+    calcular_familia_axial curvas, tabla (P, φ, M) y parámetros por nivel
+"""
+import os
+
+import numpy as np
+
+from momento_curvatura_parche_sap import (
+    PostprocesoMC, _ejecutar_tareas, _f, construir_seccion, diagrama_MC_seccion,
+)
+from seccion import utilidades
+
+barras_columna = utilidades.barras_columna
+
+
+def niveles_axiales(datos_hormigon, datos_acero, datos_seccion, n_niveles=15, compresion=0.6, traccion=0.5):
+    """
+    Niveles de carga axial repartidos uniformemente desde traccion·As·fy
+    (tracción) hasta compresion·Ag·f'c (compresión).
+
+    Retorna:
+        P : arreglo de cargas con la convención de FiberSection (tracción
+            positiva, compresión negativa), ordenado de tracción a compresión
+    """
+    fc0 = _f(datos_hormigon, "esfuerzo_fc")
+    fy = _f(datos_acero, "esfuerzo_fy")
+
+    b = _f(datos_seccion, "disenar_columna_base")
+    h = _f(datos_seccion, "disenar_columna_altura")
+    r = _f(datos_seccion, "disenar_columna_recubrimiento")
+    de = _f(datos_seccion, "disenar_columna_diametro_transversal") / 10.0
+    nb_x = int(_f(datos_seccion, "disenar_columna_varillasX_2"))
+    nb_y = int(_f(datos_seccion, "disenar_columna_varillasY_2"))
+    d_edge = _f(datos_seccion, "disenar_columna_diametro_longitudinal_2") / 10.0
+    d_corner = _f(datos_seccion, "disenar_columna_diametro_longitudinal_esq") / 10.0
+
+    As = barras_columna(b, h, r, de, nb_x, nb_y, d_corner, d_edge, "x")
+    return np.linspace(traccion * np.sum(As[:, 1]) * fy, -compresion * b * h * fc0, n_niveles)
+
+
+def numero_bloques(n_niveles, n_procesos=1):
+    """Bloques contiguos en que calcular_familia_axial reparte n_niveles."""
+    if n_procesos is None:
+        n_procesos = os.cpu_count() or 1
+    return max(1, min(int(n_procesos), n_niveles))
+
+
+def _c_inicial(niveles, c_primeros, P):
+    # Primer eje neutro de un nivel: extrapolación lineal en P desde los dos
+    # niveles previos del bloque (o el valor del único previo)
+    if not c_primeros:
+        return None
+    if len(c_primeros) == 1 or niveles[-1] == niveles[-2]:
+        return c_primeros[-1]
+    pendiente = (c_primeros[-1] - c_primeros[-2]) / (niveles[-1] - niveles[-2])
+    return c_primeros[-1] + pendiente * (P - niveles[-1])
+
+
+def _calcular_bloque(datos_hormigon, datos_acero, datos_seccion, datos_fibras, eje, modelo_cover, modelo_core,
+                     niveles, tol=1e-5, metodo="brentq", en_caliente=True, progreso=None):
+    """
+    Curvas de un bloque de niveles contiguos, en orden, sobre una sola
+    sección. Retorna una lista de dicts por nivel con phi [1/m], M [t·m],
+    c, parametros y evaluaciones (de resultantes).
+    """
+    base = construir_seccion(datos_hormigon, datos_acero, datos_seccion, datos_fibras, "columna", eje,
+                             modelo_cover, modelo_core)
+    pasos_previos = 0
+
+    def avance(pasos):
+        if progreso is not None:
+            progreso(pasos_previos + pasos)
+
+    calculados, c_primeros, curvas = [], [], []
+    for P in niveles:
+        seccion = base.con_carga(P)
+        c_inicial = _c_inicial(calculados, c_primeros, P) if en_caliente else None
+        postproceso = PostprocesoMC(100.0, 1e-5)
+        M, phi, c = diagrama_MC_seccion(seccion, tol, metodo=metodo, progreso=avance, c_inicial=c_inicial,
+                                        postproceso=postproceso)
+        pasos_previos += len(phi) - 1
+
+        phi_fin = phi * 100.0
+        M_fin = M / 1e5
+        try:
+            parametros = postproceso.resultado()
+        except Exception as e:
+            parametros = {"error": str(e)}
+
+        if len(c) > 1:
+            calculados.append(P)
+            c_primeros.append(float(c[1]))
+        curvas.append({
+            "phi": phi_fin, "M": M_fin, "c": c,
+            "parametros": parametros, "evaluaciones": seccion.evaluaciones,
+        })
+    return curvas
+
+
+def calcular_familia_axial(
+    datos_hormigon,
+    datos_acero,
+    datos_seccion,
+    datos_fibras,
+    eje,
+    modelo_cover="mander_u",
+    modelo_core="mander_c",
+    niveles=None,
+    n_niveles=15,
+    tol=1e-5,
+    metodo="brentq",
+    en_caliente=True,
+    n_procesos=1,
+    progreso=None,
+    cancelar=None,
+):
+    """
+    Familia de curvas M-φ de una columna para varios niveles de carga axial.
+
+    Parámetros:
+        niveles    : cargas axiales (convención de FiberSection: tracción
+                     positiva); por defecto niveles_axiales con n_niveles.
+                     La carga de datos_seccion no se usa
+        metodo     : solver del eje neutro (ver momrot). Con "brentq" cada
+                     nivel es la curva de calcular_momento_curvatura con esa
+                     carga; "newton" evalúa muchas menos resultantes, pero
+                     donde N salta (rotura de barras) puede seguir una raíz
+                     que el barrido de brentq no ve
+        en_caliente: partir cada nivel desde los niveles vecinos
+        n_procesos : como en _ejecutar_tareas (None = un proceso por núcleo);
+                     los niveles se reparten en bloques contiguos
+        progreso, cancelar : como en _ejecutar_tareas; cada bloque es una
+                     tarea "bloque_i" que reporta sus pasos acumulados
+
+    Retorna:
+        dict con
+            "niveles"     : cargas axiales [kgf], en orden de cálculo
+            "tabla"       : arreglo (niveles, puntos, 3) con [P [t], φ [1/m],
+                            M [t·m]]; las curvas más cortas se completan con NaN
+            "curvas"      : lista de (phi, M, c) por nivel
+            "parametros"  : lista de parámetros característicos (PostprocesoMC) por nivel
+            "evaluaciones": evaluaciones de resultantes por nivel
+    """
+    if niveles is None:
+        niveles = niveles_axiales(datos_hormigon, datos_acero, datos_seccion, n_niveles)
+    niveles = np.sort(np.asarray(niveles, dtype=float))[::-1]
+
+    bloques = np.array_split(niveles, numero_bloques(len(niveles), n_procesos))
+    datos = dict(
+        datos_hormigon=datos_hormigon,
+        datos_acero=datos_acero,
+        datos_seccion=datos_seccion,
+        datos_fibras=datos_fibras,
+        eje=eje,
+        modelo_cover=modelo_cover,
+        modelo_core=modelo_core,
+        tol=tol,
+        metodo=metodo,
+        en_caliente=en_caliente,
+    )
+    tareas = {
+        f"bloque_{i}": (_calcular_bloque, dict(datos, niveles=bloque.tolist()), True)
+        for i, bloque in enumerate(bloques)
+    }
+    salidas = _ejecutar_tareas(tareas, n_procesos, progreso=progreso, cancelar=cancelar)
+    curvas = [curva for clave in tareas for curva in salidas[clave]]
+
+    n_puntos = max(len(curva["phi"]) for curva in curvas)
+    tabla = np.full((len(niveles), n_puntos, 3), np.nan)
+    for i, (P, curva) in enumerate(zip(niveles, curvas)):
+        n = len(curva["phi"])
+        tabla[i, :n, 0] = P / 1e3
+        tabla[i, :n, 1] = curva["phi"]
+        tabla[i, :n, 2] = curva["M"]
+
+    return {
+        "niveles": niveles,
+        "tabla": tabla,
+        "curvas": [(curva["phi"], curva["M"], curva["c"]) for curva in curvas],
+        "parametros": [curva["parametros"] for curva in curvas],
+        "evaluaciones": [curva["evaluaciones"] for curva in curvas],
+    }
@@ -1,8 +1,21 @@
+import atexit
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
 import numpy as np
 from scipy.optimize import root_scalar
-from materiales import modelos
+from materiales import modelos, ManderConfinado
 from seccion import utilidades
-from diagrama_interaccion import calcular_series_di
+from diagrama_interaccion import calcular_series_di, clave_di
+from kernel_fibras import FiberSection
+from cache_resultados import CACHE, clave_canonica
+from diagnostico import GANCHOS, emitir
 
 park = modelos.park
 hognestad = modelos.hognestad
@@ -14,6 +27,9 @@ barras_columna = utilidades.barras_columna
 barras_viga = utilidades.barras_viga
 malla = utilidades.malla
 
+class CalculoCancelado(Exception):
+    """El cálculo se detuvo porque se activó la señal de cancelación."""
+
 def sigma_hormigon(nombre_modelo):
     nombre = nombre_modelo.lower().strip()
     modelos_h = {
@@ -54,18 +70,41 @@ def resultantes(c, phi, cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh
     return N_total, M_total
 
 # Funcion para encontrar la distancia al eje neutro
-def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
-           fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core, c_prev=None, phi_prev=None):
+def momrot(seccion, c_min, c_max, phi, tol, h, c_prev=None, phi_prev=None,
+           metodo="brentq", estadisticas=None):
+    """
+    Busca la profundidad del eje neutro c que equilibra la carga axial P
+    de la sección (FiberSection) para la curvatura phi y retorna (M, c),
+    o (None, None) si no converge.
+
+    metodo = "brentq" -> barrido por ventanas + brentq (método original)
+    metodo = "newton" -> Newton salvaguardado con dN/dc analítico, iniciado
+                         en c_prev; usa el barrido si Newton diverge o si
+                         hay una raíz más cercana a c_prev que la suya
+
+    Si se entrega el dict estadisticas, se llena con el método usado,
+    las iteraciones de Newton y de brentq, el número de evaluaciones de
+    resultantes y la ventana o rango de barrido donde se halló la raíz.
+    """
+    max_iter_newton = 12
+    contador = {"evaluaciones": 0, "iteraciones": 0, "iteraciones_brentq": 0, "ventana": None}
 
     def N_equilibrio(c):
-        N = resultantes(c, phi, cover, core, As, fc0, ec0, esp, Ec,
-                        fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core)[0]
-        return N
+        contador["evaluaciones"] += 1
+        return seccion.N(c, phi)
+
+    def N_lote(c_vals):
+        contador["evaluaciones"] += len(c_vals)
+        return seccion.NM_lote(c_vals, phi)[0]
+
+    def N_tangente(c):
+        contador["evaluaciones"] += 1
+        contador["iteraciones"] += 1
+        return seccion.N_tangente(c, phi)
 
     def es_max(c_eval, phi_eval):
-        yi = As[:, 0]
-        e_s = -phi_eval * (yi - c_eval)
-        es_validas = e_s[np.abs(e_s) < esu]
+        e_s = seccion.deformacion_acero(c_eval, phi_eval)
+        es_validas = e_s[np.abs(e_s) < seccion.esu]
         es = np.max(abs(es_validas)) if len(es_validas) else -np.inf
         return es
 
@@ -97,7 +136,7 @@ def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
 
     def encontrar_raices(a, b, npts):
         c_vals = np.linspace(a, b, npts)
-        N_vals = np.fromiter((N_equilibrio(c) for c in c_vals), dtype=float, count=npts)
+        N_vals = N_lote(c_vals)
         roots = []
 
         idx_signo = np.flatnonzero(N_vals[:-1] * N_vals[1:] < 0.0)
@@ -115,6 +154,7 @@ def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
             elif N1 * N2 < 0.0:
                 try:
                     sol = root_scalar(N_equilibrio, bracket=[c1, c2], method="brentq")
+                    contador["iteraciones_brentq"] += sol.iterations
                     if sol.converged and abs(N_equilibrio(sol.root)) <= tol:
                         roots.append(sol.root)
                 except ValueError:
@@ -133,9 +173,10 @@ def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
             (-6.0 * h, 6.0 * h, 260),
             (-12.0 * h, 12.0 * h, 360),
         ]
-        for a, b, npts in rangos:
+        for i, (a, b, npts) in enumerate(rangos):
             roots = encontrar_raices(a, b, npts=npts)
             if roots:
+                contador["ventana"] = "barrido c_min..c_max" if i == 0 else f"barrido ±{b / h:g}h"
                 return ordenar_por_continuidad(roots)
         return []
 
@@ -155,6 +196,7 @@ def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
             roots = encontrar_raices(a, b, npts=60)
             roots = filtrar_por_continuidad(roots, es_prev)
             if roots:
+                contador["ventana"] = f"ventana ±{dc / h:g}h"
                 return roots
 
         # Si falla la búsqueda local, hacer un barrido global amplio.
@@ -165,30 +207,129 @@ def momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
 
         return []
 
-    c_posibles = buscar_c()
+    def newton():
+        # Newton salvaguardado desde la raíz previa. Devuelve None si diverge.
+        c = c_prev
+        N, dN = N_tangente(c)
+        c_ant, N_ant = None, None
+        paso_max = 0.25 * h
+
+        for _ in range(max_iter_newton):
+            if abs(N) <= tol:
+                return c
+
+            # Si la tangente se anula (mesetas), usar la secante del paso anterior
+            if not np.isfinite(dN) or abs(dN) < 1e-12:
+                if c_ant is None or N == N_ant:
+                    return None
+                dN = (N - N_ant) / (c - c_ant)
+
+            dc = -N / dN
+            dc = max(-paso_max, min(paso_max, dc))
+
+            # Retroceso: exigir que |N| disminuya
+            for _ in range(6):
+                c_nuevo = c + dc
+                N_nuevo, dN_nuevo = N_tangente(c_nuevo)
+                if abs(N_nuevo) < abs(N):
+                    break
+                dc *= 0.5
+            else:
+                return None
+
+            c_ant, N_ant = c, N
+            c, N, dN = c_nuevo, N_nuevo, dN_nuevo
+            if abs(c - c_prev) > 3.0 * h:
+                return None
+
+        return c if abs(N) <= tol else None
+
+    def raiz_de_buscar_c(c_raiz):
+        # Newton puede saltar a otra rama después del pico. La raíz es la que
+        # elegiría buscar_c solo si está en su primera ventana, pasa el
+        # filtro de continuidad por sí sola y N no cambia de signo a menos
+        # distancia de c_prev (por ambos lados)
+        d = c_raiz - c_prev
+        if abs(d) > 0.02 * h:
+            return False
+        es_prev = es_max(c_prev, phi_prev)
+        if np.isfinite(es_prev) and es_prev > 0.0 and es_max(c_raiz, phi) < 0.85 * es_prev:
+            return False
+        if d == 0.0:
+            return True
+        N_vals = N_lote(c_prev + d * np.linspace(-1.0, 0.9, 8))
+        return not np.any(N_vals[:-1] * N_vals[1:] <= 0.0)
+
+    metodo_usado = "brentq"
+    c_posibles = []
+    if metodo == "newton" and c_prev is not None:
+        c_newton = newton()
+        if c_newton is not None and raiz_de_buscar_c(c_newton):
+            c_posibles = [c_newton]
+        metodo_usado = "newton" if c_posibles else "newton->brentq"
+        if c_posibles:
+            contador["ventana"] = "newton"
+
+    if not c_posibles:
+        c_posibles = buscar_c()
+
+    if estadisticas is not None:
+        estadisticas["metodo"] = metodo_usado
+        estadisticas["iteraciones"] = contador["iteraciones"]
+        estadisticas["evaluaciones"] = contador["evaluaciones"]
+        estadisticas["iteraciones_brentq"] = contador["iteraciones_brentq"]
+        estadisticas["ventana"] = contador["ventana"]
+
     if not c_posibles:
         return None, None
 
     c = c_posibles[0] if c_prev is None else min(c_posibles, key=lambda x: abs(x - c_prev))
-    M = resultantes(c, phi, cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core)[1]
+    M = seccion.M(c, phi)
     return M, c
 
 # Funcion para obtener el diagrama momento-curvatura
-def diagrama_MC(cover, core, As, tol, h, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core):
-    
+def diagrama_MC(cover, core, As, tol, h, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core,
+                metodo="brentq", registro=None):
+    """
+    Diagrama momento-curvatura a partir de los datos sueltos de la sección.
+    Empaqueta la sección en un FiberSection y llama a diagrama_MC_seccion.
+    """
+    seccion = FiberSection.desde_parametros(
+        cover, core, As, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh, esu,
+        P, datos_h, sg_cover, sg_core, h=h,
+    )
+    return diagrama_MC_seccion(seccion, tol, metodo=metodo, registro=registro)
+
+def iterar_MC_seccion(seccion, tol, metodo="brentq", registro=None, diagnostico=None, c_inicial=None):
+    """
+    Versión generadora de diagrama_MC_seccion: entrega (phi, M, c) apenas
+    converge cada paso de curvatura, empezando por el origen (0, 0, 0), en
+    las unidades de la sección (1/cm, kgf·cm, cm).
+
+    El consumidor puede detener la curva en cualquier punto dejando de
+    iterar y cerrando el generador (close()); en ese caso motivo_fin es
+    "detenido". Los parámetros metodo, registro, diagnostico y c_inicial
+    son los de diagrama_MC_seccion.
+    """
+    if diagnostico is not None and registro is None:
+        registro = diagnostico.setdefault("pasos", [])
+    instrumentado = registro is not None or bool(GANCHOS)
+    if GANCHOS:
+        emitir("inicio_curva", {"seccion": seccion, "metodo": metodo})
+    motivo_fin = "max_iteraciones"
+    pasos = 0
+
+    h = seccion.h
     dphi_min, dphi_max = 2e-8, 5e-5
     phi_ini, dphi_ini = 2e-5, 1e-6
 
-    phi_vals = [0.0]
-    M_vals = [0.0]
-    c_vals = [0.0]
-
     phi = phi_ini
     dphi = dphi_ini
     c_min = -h / 2
     c_max = h / 2
-    c_prev = None
-    phi_prev = None
+    c_prev = c_inicial
+    phi_prev = phi_ini if c_inicial is not None else None
+    M_prev = 0.0
     Mmax = 0.0
     post_pico = False
     pts_extra = None
@@ -196,64 +337,454 @@ def diagrama_MC(cover, core, As, tol, h, fc0, ec0, esp, Ec, fy, fsu, Es, ey, esh
     fallos_consecutivos = 0
     max_fallos = 50  # Límite de fallos consecutivos antes de reducir paso más agresivamente
 
-    for _ in range(2000):  # Aumentado de 1000 a 2000 para más iteraciones
-        Mi, ci = momrot(c_min, c_max, phi, cover, core, As, tol, h, fc0, ec0, esp, Ec,
-                        fy, fsu, Es, ey, esh, esu, P, datos_h, sg_cover, sg_core, c_prev, phi_prev)
-
-        # No hay solucion de equilibrio: falla numerica/fisica.
-        # Si falla, probar reduciendo paso antes de salir.
-        if Mi is None:
-            fallos_consecutivos += 1
-            if fallos_consecutivos > max_fallos:
-                # Si hay demasiados fallos, salir
-                break
-            if dphi > dphi_min:
-                dphi = max(0.50 * dphi, dphi_min)  # Reducción más agresiva
-                # Reintentar desde el último estado convergido, no en el mismo punto fallido.
-                if phi_prev is None:
-                    phi = max(0.50 * phi, dphi_min)
-                else:
-                    phi = phi_prev + dphi
-                continue
-            break
-
-        Mi = -Mi
-        fallos_consecutivos = 0  # Reiniciar contador de fallos
-
-        # Guardar resultados
-        phi_vals.append(phi)
-        M_vals.append(Mi)
-        c_vals.append(ci)
-
-        # Actualizar momento maximo
-        if Mi > Mmax:
-            Mmax = Mi
-        elif Mi < 0.90 * Mmax:
-            post_pico = True
-
-        # Control post-pico
-        if post_pico and Mi < 0.70 * Mmax:
-            dphi = max(0.80 * dphi, dphi_min)
-            if pts_extra is None:
-                pts_extra = n_pts_extra
-            pts_extra -= 1
-            if pts_extra < 0:
+    try:
+        yield 0.0, 0.0, 0.0
+
+        for _ in range(2000):  # Aumentado de 1000 a 2000 para más iteraciones
+            estadisticas = None
+            if instrumentado:
+                estadisticas = {}
+                t0 = time.perf_counter()
+            Mi, ci = momrot(seccion, c_min, c_max, phi, tol, h, c_prev, phi_prev,
+                            metodo=metodo, estadisticas=estadisticas)
+            if instrumentado:
+                estadisticas["tiempo_s"] = time.perf_counter() - t0
+                estadisticas["phi"] = phi
+                estadisticas["dphi"] = dphi
+                estadisticas["convergio"] = Mi is not None
+                if registro is not None:
+                    registro.append(estadisticas)
+                if GANCHOS:
+                    emitir("paso", estadisticas)
+
+            # No hay solucion de equilibrio: falla numerica/fisica.
+            # Si falla, probar reduciendo paso antes de salir.
+            if Mi is None:
+                fallos_consecutivos += 1
+                if fallos_consecutivos > max_fallos:
+                    # Si hay demasiados fallos, salir
+                    motivo_fin = "fallos_consecutivos"
+                    break
+                if dphi > dphi_min:
+                    dphi = max(0.50 * dphi, dphi_min)  # Reducción más agresiva
+                    # Reintentar desde el último estado convergido, no en el mismo punto fallido.
+                    if phi_prev is None:
+                        phi = max(0.50 * phi, dphi_min)
+                    else:
+                        phi = phi_prev + dphi
+                    continue
+                motivo_fin = "dphi_min"
                 break
 
-        # Adaptacion del paso
-        if len(M_vals) >= 2:
-            dM = abs(M_vals[-1] - M_vals[-2]) / max(abs(Mmax), 1e-6)
+            Mi = -Mi
+            fallos_consecutivos = 0  # Reiniciar contador de fallos
+
+            # Entregar el punto convergido
+            pasos += 1
+            yield phi, Mi, ci
+
+            # Actualizar momento maximo
+            if Mi > Mmax:
+                Mmax = Mi
+            elif Mi < 0.90 * Mmax:
+                post_pico = True
+
+            # Control post-pico
+            if post_pico and Mi < 0.70 * Mmax:
+                dphi = max(0.80 * dphi, dphi_min)
+                if pts_extra is None:
+                    pts_extra = n_pts_extra
+                pts_extra -= 1
+                if pts_extra < 0:
+                    motivo_fin = "post_pico"
+                    break
+
+            # Adaptacion del paso
+            dM = abs(Mi - M_prev) / max(abs(Mmax), 1e-6)
             if dM > 0.05:
                 dphi = max(0.5 * dphi, dphi_min)
             elif dM < 0.01:
                 dphi = min(1.2 * dphi, dphi_max)
 
-        c_prev = ci
-        phi_prev = phi
-        phi += dphi
+            M_prev = Mi
+            c_prev = ci
+            phi_prev = phi
+            phi += dphi
+    except GeneratorExit:
+        motivo_fin = "detenido"
+        raise
+    finally:
+        if diagnostico is not None:
+            diagnostico["motivo_fin"] = motivo_fin
+        if GANCHOS:
+            emitir("fin_curva", {"motivo_fin": motivo_fin, "pasos": pasos})
+
+
+def diagrama_MC_seccion(seccion, tol, metodo="brentq", registro=None, progreso=None, diagnostico=None,
+                        c_inicial=None, postproceso=None):
+    """
+    Diagrama momento-curvatura por incrementos de curvatura sobre una
+    sección empaquetada (FiberSection). Recorre iterar_MC_seccion hasta el
+    final y retorna los arreglos (M, phi, c).
+
+    metodo      : solver del eje neutro en momrot ("brentq" o "newton")
+    registro    : lista opcional; por cada paso (también los rechazados) se
+                  agrega un dict con phi, dphi, método usado, iteraciones,
+                  evaluaciones de resultantes, ventana y tiempo del paso
+    progreso    : función opcional progreso(pasos), llamada con el número de
+                  puntos convergidos; puede lanzar CalculoCancelado
+    diagnostico : dict opcional; recibe "pasos" (el registro) y "motivo_fin"
+                  (post_pico, fallos_consecutivos, dphi_min o max_iteraciones)
+    c_inicial   : estimación opcional del eje neutro en el primer paso (p. ej.
+                  la de una curva de carga axial vecina); el primer paso la
+                  usa como punto previo en lugar del barrido global
+    postproceso : PostprocesoMC opcional; recibe cada punto convergido, de
+                  modo que los parámetros de la curva están listos al terminar
+    """
+    phi_vals = []
+    M_vals = []
+    c_vals = []
+
+    with closing(iterar_MC_seccion(seccion, tol, metodo=metodo, registro=registro, diagnostico=diagnostico,
+                                   c_inicial=c_inicial)) as puntos:
+        for phi, Mi, ci in puntos:
+            phi_vals.append(phi)
+            M_vals.append(Mi)
+            c_vals.append(ci)
+            if postproceso is not None:
+                postproceso.agregar(phi, Mi)
+            if progreso is not None and len(phi_vals) > 1:
+                progreso(len(phi_vals) - 1)
 
     return np.array(M_vals, dtype=float), np.array(phi_vals, dtype=float), np.array(c_vals, dtype=float)
 
+def _illinois(f, a, b, fa, fb, tol, max_iter=100, max_estancado=6):
+    """
+    Regula falsi (variante Illinois) vectorizada sobre intervalos [a, b]
+    con fa * fb <= 0. f(idx, x) evalúa los intervalos idx en x. Sobre una
+    raíz la convergencia es superlineal; si |f| no baja a la mitad en
+    max_estancado iteraciones seguidas, el intervalo encierra un salto de f
+    (una fila de fibras que pierde su esfuerzo) y se abandona.
+
+    Retorna:
+        raíces (NaN donde no se alcanzó |f| <= tol)
+    """
+    a, b, fa, fb = (np.array(v, dtype=float) for v in (a, b, fa, fb))
+    raiz = np.full(len(a), np.nan)
+    raiz[fa == 0.0] = a[fa == 0.0]
+    raiz[fb == 0.0] = b[fb == 0.0]
+    activo = np.isnan(raiz)
+    lado = np.zeros(len(a), dtype=int)
+    f_min = np.maximum(np.abs(fa), np.abs(fb))
+    estancado = np.zeros(len(a), dtype=int)
+
+    for _ in range(max_iter):
+        idx = np.flatnonzero(activo)
+        if not len(idx):
+            break
+        x = (a[idx] * fb[idx] - b[idx] * fa[idx]) / (fb[idx] - fa[idx])
+        fx = f(idx, x)
+
+        listo = np.abs(fx) <= tol
+        raiz[idx[listo]] = x[listo]
+
+        # La raíz queda en [x, b]: se reemplaza a (y al repetir el lado, se
+        # divide fb a la mitad para no estancarse)
+        en_b = fx * fa[idx] > 0.0
+        i_a, i_b = idx[en_b], idx[~en_b]
+        a[i_a], fa[i_a] = x[en_b], fx[en_b]
+        b[i_b], fb[i_b] = x[~en_b], fx[~en_b]
+        fb[i_a[lado[i_a] == 1]] *= 0.5
+        fa[i_b[lado[i_b] == -1]] *= 0.5
+        lado[i_a], lado[i_b] = 1, -1
+
+        mejora = np.abs(fx) < 0.5 * f_min[idx]
+        f_min[idx[mejora]] = np.abs(fx[mejora])
+        estancado[idx] = np.where(mejora, 0, estancado[idx] + 1)
+
+        cerrado = np.abs(b[idx] - a[idx]) <= 4 * np.finfo(float).eps * np.maximum(np.abs(a[idx]), np.abs(b[idx]))
+        activo[idx[listo | cerrado | (estancado[idx] >= max_estancado)]] = False
+
+    return raiz
+
+def diagrama_MC_deformacion(seccion, tol, n_pasos=60, registro=None, progreso=None):
+    """
+    Diagrama momento-curvatura controlado por deformación: en lugar de
+    incrementar la curvatura, se incrementa la deformación de compresión
+    de la fibra extrema del núcleo (del recubrimiento si no hay núcleo)
+    hasta su deformación última (ecu o esp), y el análisis termina en el
+    primer estado límite alcanzado.
+
+    Para cada deformación e se busca la profundidad d = y_ctrl - c que
+    equilibra la carga axial, con phi = e / d. Cada paso avanza por el mismo
+    tramo de equilibrio: si d salta más de SALTO_MAX o phi retrocede, el
+    incremento de deformación se parte a la mitad. Cuando ese tramo termina
+    antes del estado límite (una fila de fibras pierde su esfuerzo y la
+    única raíz está en otra rama, con menor curvatura), el análisis sigue
+    con incrementos de curvatura (_continuar_por_curvatura), de modo que
+    phi es siempre creciente y la curva coincide con diagrama_MC_seccion.
+
+    Parámetros:
+        seccion  : FiberSection
+        tol      : tolerancia de equilibrio en N
+        n_pasos  : número de pasos del programa de deformaciones
+                   e_k = e_lim * (k / n_pasos)^1.5, más denso al inicio
+        registro : lista opcional; por cada paso se agrega un dict con phi,
+                   deformación de control y evaluaciones de resultantes
+                   (metodo "curvatura" en el tramo final por curvatura)
+        progreso : función opcional progreso(pasos), como en diagrama_MC_seccion
+
+    Retorna:
+        M, phi, c : arreglos con el origen incluido (mismo formato que
+                    diagrama_MC_seccion)
+        limite    : estado límite que terminó el análisis: "hormigon",
+                    "acero" o "sin_equilibrio"
+    """
+    h = seccion.h
+    grupo = seccion.CORE if seccion.y_extremo(seccion.CORE) is not None else seccion.COVER
+    y_ctrl = seccion.y_extremo(grupo)
+    e_lim = seccion.deformaciones_ultimas[grupo]
+    esu = seccion.esu
+
+    if not np.isfinite(e_lim):
+        raise ValueError("La sección no tiene deformación última de hormigón definida.")
+
+    d_global = np.geomspace(1e-3 * h, 1e3 * h, 121)
+    SALTO_MAX = 0.05  # variación relativa máxima de d en un subpaso aceptado
+
+    def N_d(d, e):
+        return seccion.NM_lote(y_ctrl - d, e / d)[0]
+
+    def raices(d_vals, e):
+        # Todos los cambios de signo de la ventana a la vez (_illinois): los
+        # que encierran un salto de N (fibras que pierden su esfuerzo) se
+        # abandonan en pocas iteraciones en lugar de cerrarse con brentq
+        N_vals = N_d(d_vals, e)
+        i = np.flatnonzero(N_vals[:-1] * N_vals[1:] <= 0.0)
+        if not len(i):
+            return []
+        roots = _illinois(lambda idx, x: N_d(x, e), d_vals[i], d_vals[i + 1], N_vals[i], N_vals[i + 1], tol)
+        return roots[np.isfinite(roots)].tolist()
+
+    def equilibrio(e, d_prev):
+        # Primer paso: barrido global. Después solo la banda ±SALTO_MAX
+        # alrededor de la profundidad previa: es la única raíz que continuo
+        # acepta, así que buscar más lejos solo costaría evaluaciones
+        if d_prev is None:
+            roots = raices(d_global, e)
+            return roots[0] if roots else None
+        roots = raices(np.linspace((1.0 - SALTO_MAX) * d_prev, (1.0 + SALTO_MAX) * d_prev, 9), e)
+        return min(roots, key=lambda d: abs(d - d_prev)) if roots else None
+
+    def acero_max(d, e):
+        return float(np.max(np.abs(seccion.deformacion_acero(y_ctrl - d, e / d))))
+
+    def continuo(e_a, d_a, e_b, d_b):
+        # Mismo tramo de equilibrio: d no salta y la curvatura no retrocede
+        return d_b is not None and abs(d_b - d_a) <= SALTO_MAX * d_a and e_b / d_b >= e_a / d_a
+
+    def avanzar(e_a, d_a, e_obj):
+        # Lleva el equilibrio de e_a a e_obj por el mismo tramo, partiendo el
+        # incremento cuando d salta (otra rama) o no hay raíz cerca de d_a.
+        # Retorna la deformación alcanzada y su d (e_obj si no se cortó).
+        paso = e_obj - e_a
+        while e_a < e_obj:
+            e_b = min(e_a + paso, e_obj)
+            d_b = equilibrio(e_b, d_a)
+            if continuo(e_a, d_a, e_b, d_b):
+                e_a, d_a = e_b, d_b
+                paso *= 2.0
+            else:
+                paso *= 0.5
+                if paso <= 1e-6 * e_obj:
+                    break
+        return e_a, d_a
+
+    phi_vals = [0.0]
+    M_vals = [0.0]
+    c_vals = [0.0]
+
+    def agregar(phi, c):
+        phi_vals.append(phi)
+        M_vals.append(-seccion.M(c, phi))
+        c_vals.append(c)
+        if progreso is not None:
+            progreso(len(phi_vals) - 1)
+
+    e_pasos = e_lim * (np.arange(1, n_pasos + 1) / n_pasos) ** 1.5
+    e_prev, d_prev = 0.0, None
+    limite = "hormigon"
+    fallos, max_fallos = 0, 3
+    rama_perdida = False
+
+    for e in e_pasos:
+        evaluaciones = seccion.evaluaciones
+        if d_prev is None:
+            d = equilibrio(e, None)
+        else:
+            e_alcanzada, d = avanzar(e_prev, d_prev, e)
+            if e_alcanzada < e:
+                # El tramo continuo termina antes de e (una fila de fibras
+                # pierde su esfuerzo y la raíz salta): se sigue por curvatura
+                # desde el último punto del programa, sin el borde del tramo
+                rama_perdida = True
+                d = None
+
+        # Rotura del acero dentro del paso: bisección sobre e hasta es = esu,
+        # avanzando siempre por el mismo tramo desde el punto previo
+        if d is not None and acero_max(d, e) > esu:
+            limite = "acero"
+            e_a, e_b, d_b = e_prev, e, d
+            for _ in range(40):
+                e_m = 0.5 * (e_a + e_b)
+                if d_prev is None:
+                    d_m = equilibrio(e_m, None)
+                else:
+                    e_alcanzada, d_m = avanzar(e_prev, d_prev, e_m)
+                    d_m = d_m if e_alcanzada == e_m else None
+                if d_m is None:
+                    break
+                if acero_max(d_m, e_m) > esu:
+                    e_b, d_b = e_m, d_m
+                else:
+                    e_a = e_m
+                if e_b - e_a <= 1e-6 * e_b:
+                    break
+            e, d = e_b, d_b
+
+        if registro is not None:
+            registro.append({
+                "metodo": "deformacion",
+                "iteraciones": 0,
+                "evaluaciones": seccion.evaluaciones - evaluaciones,
+                "phi": e / d if d is not None else None,
+                "deformacion": e,
+                "convergio": d is not None,
+            })
+
+        if d is None:
+            if rama_perdida:
+                break
+            # Primer paso sin equilibrio en el barrido global: se prueba la
+            # siguiente deformación del programa
+            fallos += 1
+            if fallos > max_fallos:
+                limite = "sin_equilibrio"
+                break
+            continue
+        fallos = 0
+
+        agregar(e / d, y_ctrl - d)
+        e_prev, d_prev = e, d
+
+        if limite == "acero":
+            break
+
+    if rama_perdida:
+        limite = _continuar_por_curvatura(seccion, tol, y_ctrl, e_lim, acero_max, phi_vals, c_vals,
+                                          agregar, registro, SALTO_MAX)
+
+    return (np.array(M_vals, dtype=float), np.array(phi_vals, dtype=float),
+            np.array(c_vals, dtype=float), limite)
+
+def _continuar_por_curvatura(seccion, tol, y_ctrl, e_lim, acero_max, phi_vals, c_vals, agregar, registro,
+                             salto_max, max_pasos=2000):
+    """
+    Tramo final de diagrama_MC_deformacion cuando el control por
+    deformación ya no tiene un equilibrio continuo: se sigue con incrementos
+    de curvatura (momrot, igual que diagrama_MC_seccion) desde el último
+    punto hasta que la fibra de control llega a e_lim o el acero a esu,
+    con bisección sobre phi para cerrar en el estado límite. Si el límite
+    cae dentro de un salto de la raíz (caída vertical de la curva, d varía
+    más de salto_max), la curva termina en el último paso antes del salto.
+
+    Retorna el estado límite alcanzado ("hormigon", "acero" o "sin_equilibrio").
+    """
+    h = seccion.h
+    esu = seccion.esu
+    dphi_min, dphi_max = 2e-8, 5e-5
+    phi, c = phi_vals[-1], c_vals[-1]
+    # Paso del último tramo por deformación: mantiene la densidad de puntos del programa
+    dphi_max = float(np.clip(phi - phi_vals[-2], dphi_min, dphi_max))
+    dphi = dphi_max
+
+    def estado(phi_b, c_a, phi_a):
+        # (c, límite alcanzado o None) en phi_b, o (None, None) si no hay equilibrio
+        evaluaciones = seccion.evaluaciones
+        Mi, c_b = momrot(seccion, -h / 2, h / 2, phi_b, tol, h, c_a, phi_a)
+        if registro is not None:
+            registro.append({
+                "metodo": "curvatura",
+                "iteraciones": 0,
+                "evaluaciones": seccion.evaluaciones - evaluaciones,
+                "phi": phi_b,
+                "deformacion": phi_b * (y_ctrl - c_b) if Mi is not None else None,
+                "convergio": Mi is not None,
+            })
+        if Mi is None:
+            return None, None
+        d_b = y_ctrl - c_b
+        if acero_max(d_b, phi_b * d_b) > esu:
+            return c_b, "acero"
+        if phi_b * d_b >= e_lim:
+            return c_b, "hormigon"
+        return c_b, None
+
+    for _ in range(max_pasos):
+        phi_b = phi + dphi
+        c_b, limite = estado(phi_b, c, phi)
+        if c_b is None:
+            dphi *= 0.5
+            if dphi < dphi_min:
+                return "sin_equilibrio"
+            continue
+
+        if limite is not None:
+            # Bisección sobre phi hasta el estado límite; cada estado se
+            # resuelve desde el último paso, como lo haría diagrama_MC_seccion
+            phi_a = phi
+            for _ in range(40):
+                if phi_b - phi_a <= 1e-6 * phi_b:
+                    break
+                phi_m = 0.5 * (phi_a + phi_b)
+                c_m, limite_m = estado(phi_m, c, phi)
+                if c_m is None:
+                    break
+                if limite_m is None:
+                    phi_a = phi_m
+                else:
+                    phi_b, c_b, limite = phi_m, c_m, limite_m
+            if abs(c_b - c) > salto_max * (y_ctrl - c):
+                # El límite se alcanza dentro de una caída vertical de la curva
+                # (la raíz salta a otra rama): la curva termina en el último
+                # paso antes del salto
+                return limite
+            agregar(phi_b, c_b)
+            return limite
+
+        agregar(phi_b, c_b)
+        phi, c = phi_b, c_b
+        dphi = min(1.5 * dphi, dphi_max)
+    return "sin_equilibrio"
+
+def resumen_registro(registro):
+    """
+    Resume el registro por pasos de diagrama_MC: pasos, evaluaciones
+    totales y por paso, iteraciones de Newton y pasos que cayeron al barrido.
+    """
+    pasos = [r for r in registro if r.get("convergio")]
+    evaluaciones = np.array([r["evaluaciones"] for r in registro], dtype=float)
+    metodos = [r.get("metodo") for r in registro]
+    return {
+        "pasos": len(pasos),
+        "pasos_fallidos": len(registro) - len(pasos),
+        "evaluaciones_totales": int(evaluaciones.sum()) if len(evaluaciones) else 0,
+        "evaluaciones_por_paso": float(evaluaciones.mean()) if len(evaluaciones) else 0.0,
+        "iteraciones_newton": [r["iteraciones"] for r in registro if r.get("metodo") == "newton"],
+        "pasos_newton": metodos.count("newton"),
+        "pasos_respaldo": metodos.count("newton->brentq"),
+    }
+
 # =========================
 # Postproceso M-φ
 # =========================
@@ -274,18 +805,16 @@ def _limpiar_curva_mc(phi, M):
     phi = phi[idx]
     M = M[idx]
 
-    # Eliminar duplicados de phi conservando el último
+    # Eliminar duplicados de phi conservando el primero de cada grupo
     # Usar tolerancia relativa para evitar eliminar puntos muy cercanos
     phi_range = np.ptp(phi) if len(phi) > 1 else max(abs(phi[0]), 1.0)
     tol_duplicados = max(1e-12, 1e-10 * phi_range)  # Tolerancia adaptativa
-    
-    indices_validos = [0]
-    for i in range(1, len(phi)):
-        if abs(phi[i] - phi[indices_validos[-1]]) > tol_duplicados:
-            indices_validos.append(i)
-    
-    phi = phi[indices_validos]
-    M = M[indices_validos]
+
+    conservar = np.empty(len(phi), dtype=bool)
+    conservar[0] = True
+    conservar[1:] = np.diff(phi) > tol_duplicados
+    phi = phi[conservar]
+    M = M[conservar]
 
     # Asegurar punto inicial
     if phi[0] > 0.0:
@@ -295,70 +824,84 @@ def _limpiar_curva_mc(phi, M):
     return phi, M
 
 
-def _ajuste_lineal_por_origen(x, y):
+def _sumas_prefijas(phi, M):
     """
-    Ajuste lineal M = K * phi forzado a pasar por el origen.
+    S[:, i] = sumas de φ², φ·M, M y M² de los primeros i puntos (i = 0..n).
     """
-    den = np.dot(x, x)
-    if den <= 0:
-        return 0.0, 0.0
-
-    K = np.dot(x, y) / den
-    y_hat = K * x
-
-    ss_res = np.sum((y - y_hat) ** 2)
-    ss_tot = np.sum((y - np.mean(y)) ** 2)
+    S = np.zeros((4, len(phi) + 1))
+    np.cumsum(np.vstack((phi * phi, phi * M, M, M * M)), axis=1, out=S[:, 1:])
+    return S
 
-    if ss_tot <= 0:
-        r2 = 1.0
-    else:
-        r2 = 1.0 - ss_res / ss_tot
 
-    return float(K), float(r2)
+def _ajuste_por_origen_prefijos(Sxx, Sxy, Sy, Syy, n):
+    """
+    Ajuste lineal M = K * phi forzado a pasar por el origen sobre los
+    primeros n puntos, a partir de sus sumas (escalares o arreglos).
+    Retorna (K, r2).
+    """
+    Sxx, Sxy, Sy, Syy, n = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (Sxx, Sxy, Sy, Syy, n)))
+    K = np.divide(Sxy, Sxx, out=np.zeros_like(Sxx), where=Sxx > 0)
+    ss_res = Syy - K * Sxy
+    ss_tot = Syy - Sy * Sy / n
+    r2 = np.ones_like(K)
+    np.subtract(1.0, ss_res / np.where(ss_tot > 0, ss_tot, 1.0), out=r2, where=ss_tot > 0)
+    return K, r2
 
 
-def _rigidez_inicial_desde_tabla(phi, M, min_pts=4, r2_min=0.999):
+def _rigidez_inicial_desde_tabla(phi, M, min_pts=4, r2_min=0.999, S=None):
     """
     Busca la mayor porción inicial de la curva que siga siendo casi lineal,
     y devuelve su pendiente como rigidez inicial.
+
+    Todos los prefijos se evalúan a la vez con las sumas prefijas S (las
+    de la curva completa sirven para cualquier tramo inicial de ella).
     """
     n = len(phi)
     if n < 2:
         raise ValueError("No hay suficientes puntos para calcular la rigidez inicial.")
+    if S is None:
+        S = _sumas_prefijas(phi, M)
 
-    mejor_K = None
+    m0 = max(min_pts, 2)
+    i = np.arange(m0, n + 1)
 
-    # Se recorre progresivamente la rama inicial
-    for i in range(max(min_pts, 2), n + 1):
-        x = phi[:i]
-        y = M[:i]
+    # Debe ser monótona creciente: el prefijo de i puntos no puede incluir
+    # el primer descenso de M
+    descensos = np.flatnonzero(np.diff(M[:n]) < 0)
+    limite = descensos[0] + 1 if len(descensos) else n
 
-        # Debe ser monótona creciente en el tramo inicial
-        if np.any(np.diff(y) < 0):
-            break
-
-        K, r2 = _ajuste_lineal_por_origen(x, y)
-
-        if K <= 0:
-            break
-
-        if r2 >= r2_min:
-            mejor_K = K
-        else:
-            break
-
-    if mejor_K is not None:
-        return float(mejor_K)
+    K, r2 = _ajuste_por_origen_prefijos(*S[:, i], i)
+    invalidos = np.flatnonzero((i > limite) | (K <= 0) | (r2 < r2_min))
+    validos = invalidos[0] if len(invalidos) else len(i)
+    if validos > 0:
+        return float(K[validos - 1])
 
     # Fallback: usar los primeros puntos disponibles
-    i = min(max(min_pts, 2), n)
-    K, _ = _ajuste_lineal_por_origen(phi[:i], M[:i])
+    i0 = min(m0, n)
+    K, _ = _ajuste_por_origen_prefijos(*S[:, i0], i0)
     return float(K)
 
 
 def _interp_lineal_xy(x, y, xq):
     return float(np.interp(float(xq), x, y))
 
+
+def _cruce_falla(phi, M, i, idx_max, M_lim):
+    # Punto de falla en el cruce de M_lim entre los puntos i-1 e i
+    if i == idx_max + 1:
+        return float(phi[i]), float(M_lim), True
+
+    phi1, M1 = float(phi[i - 1]), float(M[i - 1])
+    phi2, M2 = float(phi[i]), float(M[i])
+
+    if abs(M2 - M1) < 1e-14:
+        phi_f = phi2
+    else:
+        phi_f = phi1 + (M_lim - M1) * (phi2 - phi1) / (M2 - M1)
+
+    return float(phi_f), float(M_lim), True
+
+
 def _buscar_punto_falla_por_resistencia(phi, M, idx_max, fraccion=0.80):
     """
     Busca el punto de falla como el primer punto de la rama descendente
@@ -370,96 +913,47 @@ def _buscar_punto_falla_por_resistencia(phi, M, idx_max, fraccion=0.80):
     phi = np.asarray(phi, dtype=float)
     M = np.asarray(M, dtype=float)
 
-    M_max = float(M[idx_max])
-    M_lim = fraccion * M_max
+    M_lim = fraccion * float(M[idx_max])
 
-    # Si no hay rama descendente, fallback
-    if idx_max >= len(M) - 1:
+    # Primer punto post-pico bajo el límite
+    cruces = np.flatnonzero(M[idx_max + 1:] <= M_lim)
+    if not len(cruces):
+        # Sin rama descendente, o nunca bajó al 80% del pico
         return float(phi[-1]), float(M[-1]), False
 
-    # Recorrer solo post-pico
-    for i in range(idx_max + 1, len(M)):
-        if M[i] <= M_lim:
-            # Si justo cayó en el punto i
-            if i == idx_max + 1:
-                phi_f = float(phi[i])
-                return phi_f, float(M_lim), True
+    return _cruce_falla(phi, M, idx_max + 1 + int(cruces[0]), idx_max, M_lim)
 
-            # Interpolar entre (i-1) e i
-            phi1, M1 = float(phi[i - 1]), float(M[i - 1])
-            phi2, M2 = float(phi[i]), float(M[i])
 
-            if abs(M2 - M1) < 1e-14:
-                phi_f = phi2
-            else:
-                phi_f = phi1 + (M_lim - M1) * (phi2 - phi1) / (M2 - M1)
-
-            return float(phi_f), float(M_lim), True
+def _area_acumulada(phi, M):
+    # Área trapezoidal bajo la curva desde el primer punto hasta cada punto
+    area = np.zeros(len(phi))
+    np.cumsum(np.diff(phi) * (M[1:] + M[:-1]) / 2.0, out=area[1:])
+    return area
 
-    # Si nunca bajó al 80% del pico
-    return float(phi[-1]), float(M[-1]), False
 
-
-def extraer_parametros_caracteristicos_mc(phi, M):
+def _area_hasta(phi, M, area, phi_f):
     """
-    Extrae parámetros característicos directamente de la tabla M-φ.
-
-    Criterios adoptados:
-    - rigidez inicial: pendiente de la rama inicial lineal
-    - punto de fluencia: fluencia equivalente por bilinealización
-    - punto máximo: máximo momento de la tabla
-    - punto de falla: primer punto post-pico donde M <= 0.80*Mmax
-    - ductilidad: phi_f / phi_y
+    Área bajo la curva hasta phi_f con el área acumulada por punto: la de
+    los puntos con phi <= phi_f más el trapecio hasta phi_f interpolado.
     """
-    phi, M = _limpiar_curva_mc(phi, M)
+    k = int(np.searchsorted(phi, phi_f, side="right"))
+    if k == 0:
+        return 0.0
+    A = float(area[k - 1])
+    if abs(phi[k - 1] - phi_f) > 1e-12:
+        M_phi_f = _interp_lineal_xy(phi, M, phi_f)
+        A += (phi_f - phi[k - 1]) * (M[k - 1] + M_phi_f) / 2.0
+    return A
 
-    if len(phi) < 2:
-        raise ValueError("No hay suficientes puntos en la tabla M-φ (mínimo 2).")
-    
-    # Si hay menos de 4 puntos, usar procedimiento simplificado
-    usar_simplificado = len(phi) < 4
-    if usar_simplificado:
-        import warnings
-        warnings.warn(f"Curva M-φ con solo {len(phi)} puntos. Usando procedimiento simplificado para extraer parámetros.")
 
-    # Punto máximo
-    idx_max = int(np.argmax(M))
+def _parametros_mc(phi, M, K_ini, idx_max, falla, A, usar_simplificado):
+    """
+    Fluencia equivalente, ductilidad y dict final de parámetros a partir de
+    la rigidez inicial, el punto máximo, el punto de falla y el área.
+    """
     phi_max = float(phi[idx_max])
     M_max = float(M[idx_max])
-
-    # Rigidez inicial a partir de la rama inicial
-    try:
-        K_ini = _rigidez_inicial_desde_tabla(phi[:idx_max + 1], M[:idx_max + 1])
-    except:
-        # Si falla, calcular simplemente como M_max / phi_max
-        K_ini = M_max / phi_max if phi_max > 0 else 1.0
-
-    # Punto final del análisis (solo informativo)
-    phi_fin = float(phi[-1])
-    M_fin = float(M[-1])
-
-    # Punto de falla por caída al 80% de la resistencia máxima
-    try:
-        phi_f, M_f, hubo_cruce_80 = _buscar_punto_falla_por_resistencia(
-            phi, M, idx_max, fraccion=0.80
-        )
-    except:
-        # Fallback: usar el último punto como falla
-        phi_f = float(phi[-1])
-        M_f = float(M[-1])
-        hubo_cruce_80 = False
-
-    # Área bajo la curva hasta el punto de falla
-    phi_area = phi[phi <= phi_f]
-    M_area = M[:len(phi_area)]
-
-    # Si phi_f quedó entre dos puntos, agregarlo por interpolación
-    if len(phi_area) == 0 or abs(phi_area[-1] - phi_f) > 1e-12:
-        M_phi_f = _interp_lineal_xy(phi, M, phi_f)
-        phi_area = np.append(phi_area, phi_f)
-        M_area = np.append(M_area, M_phi_f)
-
-    A = float(np.trapz(M_area, phi_area))
+    phi_f, M_f, hubo_cruce_80 = falla
 
     # Fluencia equivalente por idealización bilineal
     if usar_simplificado:
@@ -500,7 +994,7 @@ def extraer_parametros_caracteristicos_mc(phi, M):
         "punto_fluencia": {"phi": phi_y, "M": M_y},
         "punto_maximo": {"phi": phi_max, "M": M_max},
         "punto_falla": {"phi": phi_f, "M": M_f},
-        "punto_final_analisis": {"phi": phi_fin, "M": M_fin},
+        "punto_final_analisis": {"phi": float(phi[-1]), "M": float(M[-1])},
         "ductilidad_curvatura": mu_phi,
         "area_bajo_curva": A,
         "criterio_fluencia": (
@@ -509,7 +1003,182 @@ def extraer_parametros_caracteristicos_mc(phi, M):
         ),
         "criterio_falla": criterio_falla,
     }
-    
+
+
+def _verificar_puntos_mc(n):
+    if n < 2:
+        raise ValueError("No hay suficientes puntos en la tabla M-φ (mínimo 2).")
+
+    # Si hay menos de 4 puntos, usar procedimiento simplificado
+    usar_simplificado = n < 4
+    if usar_simplificado:
+        import warnings
+        warnings.warn(f"Curva M-φ con solo {n} puntos. Usando procedimiento simplificado para extraer parámetros.")
+    return usar_simplificado
+
+
+def extraer_parametros_caracteristicos_mc(phi, M):
+    """
+    Extrae parámetros característicos directamente de la tabla M-φ.
+
+    Criterios adoptados:
+    - rigidez inicial: pendiente de la rama inicial lineal
+    - punto de fluencia: fluencia equivalente por bilinealización
+    - punto máximo: máximo momento de la tabla
+    - punto de falla: primer punto post-pico donde M <= 0.80*Mmax
+    - ductilidad: phi_f / phi_y
+
+    El costo es O(n): la rigidez sale de sumas prefijas, y el punto de
+    falla y el área de máscaras y sumas acumuladas. Para procesar la curva
+    mientras se calcula, ver PostprocesoMC.
+    """
+    phi, M = _limpiar_curva_mc(phi, M)
+    usar_simplificado = _verificar_puntos_mc(len(phi))
+
+    # Punto máximo
+    idx_max = int(np.argmax(M))
+    M_max = float(M[idx_max])
+    phi_max = float(phi[idx_max])
+
+    # Rigidez inicial a partir de la rama inicial
+    if idx_max + 1 >= 2:
+        K_ini = _rigidez_inicial_desde_tabla(phi[:idx_max + 1], M[:idx_max + 1], S=_sumas_prefijas(phi, M))
+    else:
+        # Si no hay rama inicial, calcular simplemente como M_max / phi_max
+        K_ini = M_max / phi_max if phi_max > 0 else 1.0
+
+    # Punto de falla por caída al 80% de la resistencia máxima
+    falla = _buscar_punto_falla_por_resistencia(phi, M, idx_max, fraccion=0.80)
+
+    # Área bajo la curva hasta el punto de falla
+    A = _area_hasta(phi, M, _area_acumulada(phi, M), falla[0])
+
+    return _parametros_mc(phi, M, K_ini, idx_max, falla, A, usar_simplificado)
+
+
+class PostprocesoMC:
+    """
+    Parámetros característicos de una curva M-φ calculados a medida que el
+    solver entrega los puntos (agregar), con los mismos criterios que
+    extraer_parametros_caracteristicos_mc.
+
+    Por cada punto se actualizan en O(1) las sumas prefijas del ajuste de
+    rigidez inicial (mientras la rama inicial siga siendo lineal), el punto
+    máximo, el primer punto post-pico bajo 0.80·Mmax y el área acumulada,
+    así que al terminar la curva resultado() solo interpola la fluencia.
+
+    Si la curva recibida no viene limpia (φ no creciente, valores no
+    finitos o puntos casi repetidos), resultado() recurre a
+    extraer_parametros_caracteristicos_mc con los puntos recibidos.
+
+    Parámetros:
+        factor_phi, factor_M : factores de unidades aplicados a cada punto
+                               (p. ej. 100 y 1e-5 para 1/m y t·m)
+    """
+
+    MIN_PUNTOS = 4
+    R2_MIN = 0.999
+    FRACCION_FALLA = 0.80
+
+    def __init__(self, factor_phi=1.0, factor_M=1.0):
+        self.factor_phi = float(factor_phi)
+        self.factor_M = float(factor_M)
+        self._phi_crudo, self._M_crudo = [], []
+        self.phi, self.M = [], []
+        self._S = [(0.0, 0.0, 0.0, 0.0)]
+        self._area = []
+        self._limpia = True
+        self._separacion_min = np.inf
+        self._descenso = None      # primer i con M[i+1] < M[i]
+        self._K = []               # K de los prefijos válidos de MIN_PUNTOS puntos en adelante
+        self._rigidez_abierta = True
+        self.idx_max = None
+        self._falla = None         # primer punto post-pico con M <= FRACCION_FALLA·Mmax
+
+    def agregar(self, phi, M):
+        phi = float(phi) * self.factor_phi
+        M = float(M) * self.factor_M
+        self._phi_crudo.append(phi)
+        self._M_crudo.append(M)
+        if not self._limpia:
+            return
+        if not (np.isfinite(phi) and np.isfinite(M)):
+            self._limpia = False
+            return
+        if self.phi:
+            if phi <= self.phi[-1]:
+                self._limpia = False
+                return
+            self._separacion_min = min(self._separacion_min, phi - self.phi[-1])
+        elif phi > 0.0:
+            # Asegurar punto inicial
+            self._sumar(0.0, 0.0)
+        self._sumar(phi, M)
+
+    def _sumar(self, phi, M):
+        j = len(self.phi)
+        Sxx, Sxy, Sy, Syy = self._S[-1]
+        self._S.append((Sxx + phi * phi, Sxy + phi * M, Sy + M, Syy + M * M))
+        self._area.append(self._area[-1] + (phi - self.phi[-1]) * (M + self.M[-1]) / 2.0 if j else 0.0)
+        if j and self._descenso is None and M < self.M[-1]:
+            self._descenso = j - 1
+        self.phi.append(phi)
+        self.M.append(M)
+
+        # Rigidez inicial: prefijo de j + 1 puntos
+        n = j + 1
+        m0 = max(self.MIN_PUNTOS, 2)
+        if self._rigidez_abierta and n >= m0:
+            K, r2 = (float(v) for v in _ajuste_por_origen_prefijos(*self._S[n], n))
+            monotona = self._descenso is None or n <= self._descenso + 1
+            if monotona and K > 0 and r2 >= self.R2_MIN:
+                self._K.append(K)
+            else:
+                self._rigidez_abierta = False
+
+        # Punto máximo y candidato a punto de falla
+        if self.idx_max is None or M > self.M[self.idx_max]:
+            self.idx_max = j
+            self._falla = None
+        elif self._falla is None and M <= self.FRACCION_FALLA * self.M[self.idx_max]:
+            self._falla = j
+
+    def resultado(self):
+        n_crudos = len(self._phi_crudo)
+        if self._limpia and n_crudos >= 2:
+            rango = self._phi_crudo[-1] - self._phi_crudo[0]
+            self._limpia = self._separacion_min > max(1e-12, 1e-10 * rango)
+        if not self._limpia or n_crudos < 2:
+            return extraer_parametros_caracteristicos_mc(self._phi_crudo, self._M_crudo)
+
+        phi = np.array(self.phi)
+        M = np.array(self.M)
+        usar_simplificado = _verificar_puntos_mc(len(phi))
+        idx_max = self.idx_max
+        M_max = float(M[idx_max])
+        phi_max = float(phi[idx_max])
+
+        # Rigidez inicial: el último prefijo válido que no pase del máximo
+        n_max = idx_max + 1
+        m0 = max(self.MIN_PUNTOS, 2)
+        if n_max < 2:
+            K_ini = M_max / phi_max if phi_max > 0 else 1.0
+        elif n_max >= m0 and self._K:
+            K_ini = self._K[min(len(self._K), n_max - m0 + 1) - 1]
+        else:
+            i0 = min(m0, n_max)
+            K_ini = float(_ajuste_por_origen_prefijos(*self._S[i0], i0)[0])
+
+        M_lim = self.FRACCION_FALLA * M_max
+        if self._falla is None:
+            falla = (float(phi[-1]), float(M[-1]), False)
+        else:
+            falla = _cruce_falla(phi, M, self._falla, idx_max, M_lim)
+
+        A = _area_hasta(phi, M, self._area, falla[0])
+        return _parametros_mc(phi, M, K_ini, idx_max, falla, A, usar_simplificado)
+
+
 def _f(datos, clave, default=None):
     valor = datos.get(clave, default)
     if valor is None or valor == "":
@@ -517,7 +1186,7 @@ def _f(datos, clave, default=None):
     return float(valor)
 
 
-def _datos_h_mander_confinado(datos_hormigon, datos_acero, datos_seccion):
+def _mander_confinado(datos_hormigon, datos_acero, datos_seccion, diagnostico=None):
     fc0 = _f(datos_hormigon, "esfuerzo_fc")
     Ec  = _f(datos_hormigon, "modulo_Ec")
     ec0 = _f(datos_hormigon, "def_max_sin_confinar")
@@ -545,20 +1214,12 @@ def _datos_h_mander_confinado(datos_hormigon, datos_acero, datos_seccion):
 
     fyh = fy
 
-    datos_h_base = (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, None, None)
-
-    fcc = mander_c(
-        ec=np.array([0.0]),
-        fc0=fc0,
-        ec0=ec0,
-        esp=esp,
-        Ec=Ec,
-        datos_h=datos_h_base,
-        N=3,
+    # Parámetros de confinamiento (fcc incluido) calculados una sola vez
+    mander = ManderConfinado(
+        fc0, ec0, esp, Ec,
+        (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, None, None),
     )
 
-    datos_h_ecu = (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, None, fcc)
-
     ecu = buscar_ecu(
         fc0=fc0,
         ec0=ec0,
@@ -570,13 +1231,14 @@ def _datos_h_mander_confinado(datos_hormigon, datos_acero, datos_seccion):
         ey=ey,
         esh=esh,
         esu=esu,
-        datos_h=datos_h_ecu,
+        datos_h=mander,
+        diagnostico=diagnostico,
     )
 
-    return (fyh, b, h, r, Sc, de, d_corner, d_edge, nb, nl_x, nl_y, ecu, fcc)
+    return mander.con_ecu(ecu)
 
 
-def calcular_momento_curvatura(
+def construir_seccion(
     datos_hormigon,
     datos_acero,
     datos_seccion,
@@ -586,8 +1248,26 @@ def calcular_momento_curvatura(
     modelo_cover,
     modelo_core,
     P=0.0,
-    tol=1e-5,
+    diagnostico=None,
+    integracion="fibras",
+    tabulado=None,
 ):
+    """
+    Lee los diccionarios de la interfaz, genera la malla de fibras y las
+    capas de acero, y retorna la sección empaquetada (FiberSection).
+    diagnostico: dict opcional; con Mander confinado recibe en "buscar_ecu"
+    los datos de la búsqueda de la deformación última, y con tabulado
+    recibe en "tabulacion" el informe de cada material tabulado (nodos,
+    error de esfuerzo alcanzado y aceleración).
+    integracion: "fibras", "prefijos" o "exacta". "prefijos" da la misma
+    integral que "fibras" y solo acelera los modelos con ramas polinómicas
+    (Hognestad), que se evalúan con sumas prefijas; con Mander el hormigón
+    se suma fibra a fibra como en "fibras". Con "exacta" las capas de la
+    malla se integran como franjas (ver FiberSection) y bastan pocas
+    divisiones.
+    tabulado: tolerancia relativa de esfuerzo para evaluar los materiales
+    por interpolación (MaterialTabulado); None usa las fórmulas.
+    """
     tipo = tipo_seccion.strip().lower()
     eje = eje.strip().lower()
     modelo_cover = modelo_cover.strip().lower()
@@ -610,6 +1290,7 @@ def calcular_momento_curvatura(
     # Fibras
     nf_x = int(_f(datos_fibras, "fibras_x"))
     nf_y = int(_f(datos_fibras, "fibras_y"))
+    franjas = integracion == "exacta"
 
     # Modelos constitutivos
     sg_cover = sigma_hormigon(modelo_cover)
@@ -627,13 +1308,14 @@ def calcular_momento_curvatura(
         d_edge   = _f(datos_seccion, "disenar_columna_diametro_longitudinal_2") / 10.0
         d_corner = _f(datos_seccion, "disenar_columna_diametro_longitudinal_esq") / 10.0
 
-        cover, core = malla(b, h, r, de, nf_x, nf_y, eje)
+        cover, core = malla(b, h, r, de, nf_x, nf_y, eje, franjas=franjas)
         As = barras_columna(b, h, r, de, nb_x, nb_y, d_corner, d_edge, eje)
 
         P_real = _f(datos_seccion, "disenar_columna_axial", P)
 
         if usa_mander_c:
-            datos_h = _datos_h_mander_confinado(datos_hormigon, datos_acero, datos_seccion)
+            diag_ecu = diagnostico.setdefault("buscar_ecu", {}) if diagnostico is not None else None
+            datos_h = _mander_confinado(datos_hormigon, datos_acero, datos_seccion, diag_ecu)
 
     elif tipo == "viga":
         b      = _f(datos_seccion, "disenar_viga_base")
@@ -645,7 +1327,7 @@ def calcular_momento_curvatura(
         d_sup  = _f(datos_seccion, "disenar_viga_diametro_superior") / 10.0
         d_inf  = _f(datos_seccion, "disenar_viga_diametro_inferior") / 10.0
 
-        cover, core = malla(b, h, r, de, nf_x, nf_y, "x")
+        cover, core = malla(b, h, r, de, nf_x, nf_y, "x", franjas=franjas)
         As = barras_viga(h, r, de, nb_sup, nb_inf, d_sup, d_inf)
 
         P_real = P
@@ -656,18 +1338,114 @@ def calcular_momento_curvatura(
     else:
         raise ValueError(f"Tipo de sección no válido: {tipo_seccion}")
 
-    M, phi, c = diagrama_MC(
-        cover, core, As, tol, h,
+    seccion = FiberSection.desde_parametros(
+        cover, core, As,
         fc0, ec0, esp, Ec,
         fy, fsu, Es, ey, esh, esu,
-        P_real, datos_h, sg_cover, sg_core,
+        P_real, datos_h, sg_cover, sg_core, h=h, integracion=integracion, tabulado=tabulado,
     )
+    if diagnostico is not None and seccion.materiales_tabulados is not None:
+        diagnostico["tabulacion"] = {
+            grupo: tabla.informe(repeticiones=200)
+            for grupo, tabla in zip((modelo_cover, modelo_core, "park"), seccion.materiales_tabulados)
+        }
+    return seccion
+
+
+def clave_mc(datos_hormigon, datos_acero, datos_seccion, datos_fibras, tipo_seccion, eje,
+             modelo_cover, modelo_core, P=0.0, tol=1e-5, metodo="brentq", control="curvatura",
+             integracion="fibras", tabulado=None):
+    """
+    Clave de caché de una serie M-φ: todas las entradas que afectan la curva.
+    Sin materiales tabulados la clave es la misma que antes de existir esa opción.
+    """
+    extra = () if tabulado is None else ("tabulado", tabulado)
+    return clave_canonica(
+        "mc", datos_hormigon, datos_acero, datos_seccion, datos_fibras,
+        tipo_seccion, eje, modelo_cover, modelo_core, P, tol, metodo, control, integracion, *extra,
+    )
+
+def calcular_momento_curvatura(
+    datos_hormigon,
+    datos_acero,
+    datos_seccion,
+    datos_fibras,
+    tipo_seccion,
+    eje,
+    modelo_cover,
+    modelo_core,
+    P=0.0,
+    tol=1e-5,
+    metodo="brentq",
+    registro=None,
+    control="curvatura",
+    progreso=None,
+    usar_cache=True,
+    diagnostico=None,
+    integracion="fibras",
+    tabulado=None,
+):
+    """
+    control = "curvatura"   -> incrementos de curvatura (diagrama_MC_seccion)
+    control = "deformacion" -> incrementos de deformación hasta el estado
+                               límite (diagrama_MC_deformacion); el estado
+                               alcanzado se guarda en parametros["estado_limite"]
+    progreso: función opcional progreso(pasos) llamada por cada punto convergido
+    usar_cache: si las entradas coinciden con un cálculo previo, se retorna
+                la curva guardada en cache_resultados.CACHE (no aplica
+                cuando se pide registro o diagnostico)
+    diagnostico: dict opcional; se llena con "pasos" (registro por paso),
+                 "resumen" (resumen_registro), "motivo_fin", "buscar_ecu"
+                 (solo Mander confinado) y "tiempo_s" de la curva
+    integracion: "fibras", "prefijos" (solo acelera Hognestad) o "exacta"
+                 (ver construir_seccion)
+    tabulado: tolerancia de los materiales tabulados (ver construir_seccion)
+    """
+    if diagnostico is not None:
+        t0 = time.perf_counter()
+        if registro is None:
+            registro = diagnostico.setdefault("pasos", [])
+
+    clave = None
+    if usar_cache and registro is None:
+        clave = clave_mc(datos_hormigon, datos_acero, datos_seccion, datos_fibras, tipo_seccion, eje,
+                         modelo_cover, modelo_core, P, tol, metodo, control, integracion, tabulado)
+        guardado = CACHE.obtener(clave)
+        if guardado is not None:
+            return guardado
+
+    seccion = construir_seccion(
+        datos_hormigon, datos_acero, datos_seccion, datos_fibras,
+        tipo_seccion, eje, modelo_cover, modelo_core, P=P, diagnostico=diagnostico,
+        integracion=integracion, tabulado=tabulado,
+    )
+
+    limite = None
+    postproceso = None
+    if control == "curvatura":
+        # Parámetros en las unidades de salida (1/m y t·m), calculados durante la curva
+        postproceso = PostprocesoMC(100.0, 1e-5)
+        M, phi, c = diagrama_MC_seccion(seccion, tol, metodo=metodo, registro=registro, progreso=progreso,
+                                        diagnostico=diagnostico, postproceso=postproceso)
+    elif control == "deformacion":
+        M, phi, c, limite = diagrama_MC_deformacion(seccion, tol, registro=registro, progreso=progreso)
+        if diagnostico is not None:
+            diagnostico["motivo_fin"] = limite
+    else:
+        raise ValueError(f"Control no válido: {control}")
+
+    if diagnostico is not None:
+        diagnostico["resumen"] = resumen_registro(registro)
+        diagnostico["tiempo_s"] = time.perf_counter() - t0
 
     phi_fin = phi * 100.0
     M_fin = M / 1e5
 
     try:
-        parametros_mc = extraer_parametros_caracteristicos_mc(phi_fin, M_fin)
+        if postproceso is not None:
+            parametros_mc = postproceso.resultado()
+        else:
+            parametros_mc = extraer_parametros_caracteristicos_mc(phi_fin, M_fin)
     except Exception as e:
         parametros_mc = {
             "error": str(e),
@@ -677,8 +1455,27 @@ def calcular_momento_curvatura(
             },
         }
 
+    if limite is not None:
+        parametros_mc["estado_limite"] = limite
+
+    if clave is not None:
+        CACHE.guardar(clave, (phi_fin, M_fin, c, parametros_mc))
+
     return phi_fin, M_fin, c, parametros_mc
 
+# Series M-φ por tipo de sección: (clave, modelo_cover, modelo_core)
+SERIES_MC = {
+    "columna": (
+        ("hognestad", "hognestad", "hognestad"),
+        ("mander_no_conf", "mander_u", "mander_u"),
+        ("mander_conf", "mander_u", "mander_c"),
+    ),
+    "viga": (
+        ("hognestad", "hognestad", "hognestad"),
+        ("mander_no_conf", "mander_u", "mander_u"),
+    ),
+}
+
 def calcular_series_mc(
     datos_hormigon,
     datos_acero,
@@ -686,36 +1483,182 @@ def calcular_series_mc(
     datos_fibras,
     tipo_seccion,
     eje,
+    metodo="brentq",
+    control="curvatura",
 ):
     tipo = tipo_seccion.strip().lower()
 
     series = {}
     parametros = {}
 
-    phi, M, _, p = calcular_momento_curvatura(
-        datos_hormigon, datos_acero, datos_seccion, datos_fibras,
-        tipo, eje, "hognestad", "hognestad"
-    )
-    series["hognestad"] = (phi, M)
-    parametros["hognestad"] = p
-
-    phi, M, _, p = calcular_momento_curvatura(
-        datos_hormigon, datos_acero, datos_seccion, datos_fibras,
-        tipo, eje, "mander_u", "mander_u"
-    )
-    series["mander_no_conf"] = (phi, M)
-    parametros["mander_no_conf"] = p
-
-    if tipo == "columna":
+    for clave, modelo_cover, modelo_core in SERIES_MC.get(tipo, SERIES_MC["viga"]):
         phi, M, _, p = calcular_momento_curvatura(
             datos_hormigon, datos_acero, datos_seccion, datos_fibras,
-            tipo, eje, "mander_u", "mander_c"
+            tipo, eje, modelo_cover, modelo_core, metodo=metodo, control=control
         )
-        series["mander_conf"] = (phi, M)
-        parametros["mander_conf"] = p
+        series[clave] = (phi, M)
+        parametros[clave] = p
 
     return series, parametros
 
+# Estado de cada proceso del pool (lo fija _iniciar_worker)
+_COLA_AVANCE = None
+_EVENTO_CANCELAR = None
+
+def _iniciar_worker(cola, evento):
+    global _COLA_AVANCE, _EVENTO_CANCELAR
+    _COLA_AVANCE = cola
+    _EVENTO_CANCELAR = evento
+
+def _tarea_worker(clave, func, kwargs, reporta_pasos):
+    # Dentro del pool: el avance viaja por la cola y la cancelación llega
+    # por el evento compartido, revisado en cada paso convergido.
+    if reporta_pasos:
+        def avance(pasos):
+            if _EVENTO_CANCELAR is not None and _EVENTO_CANCELAR.is_set():
+                raise CalculoCancelado()
+            if _COLA_AVANCE is not None:
+                _COLA_AVANCE.put((clave, pasos))
+        kwargs = dict(kwargs, progreso=avance)
+    return func(**kwargs)
+
+def _calcular_mc_con_diagnostico(**kwargs):
+    # Tarea del pool cuando se pide diagnóstico: el dict debe volver junto
+    # con la curva, porque el worker no comparte memoria con el llamador.
+    diagnostico = {}
+    salida = calcular_momento_curvatura(diagnostico=diagnostico, **kwargs)
+    return salida, diagnostico
+
+def _ejecutar_en_serie(tareas, progreso=None, cancelar=None):
+    salidas = {}
+    for clave, (func, kwargs, reporta_pasos) in tareas.items():
+        if cancelar is not None and cancelar.is_set():
+            raise CalculoCancelado()
+        if reporta_pasos and (progreso is not None or cancelar is not None):
+            def avance(pasos, clave=clave):
+                if cancelar is not None and cancelar.is_set():
+                    raise CalculoCancelado()
+                if progreso is not None:
+                    progreso(clave, pasos, False)
+            kwargs = dict(kwargs, progreso=avance)
+        salidas[clave] = func(**kwargs)
+        if progreso is not None:
+            progreso(clave, None, True)
+    return salidas
+
+# Pool de procesos de la sesión: (pool, workers, cola de avance, evento de
+# cancelación). Arrancar los workers (spawn en Windows) cuesta más que un
+# cálculo corriente, así que se crea una sola vez y se reutiliza hasta
+# cerrar_pool o el fin del programa. Una llamada a la vez lo usa.
+_POOL = None
+_POOL_OCUPADO = threading.Lock()
+
+def _pool_sesion(n_procesos):
+    global _POOL
+    if _POOL is not None and _POOL[1] < n_procesos:
+        cerrar_pool()
+    if _POOL is None:
+        ctx = multiprocessing.get_context()
+        cola, evento = ctx.Queue(), ctx.Event()
+        pool = ProcessPoolExecutor(max_workers=n_procesos, mp_context=ctx,
+                                   initializer=_iniciar_worker, initargs=(cola, evento))
+        _POOL = (pool, n_procesos, cola, evento)
+    return _POOL
+
+def cerrar_pool():
+    """
+    Cierra el pool de procesos de la sesión, si existe (al salir de la
+    aplicación; también se registra con atexit). La siguiente llamada en
+    paralelo crea uno nuevo.
+    """
+    global _POOL
+    if _POOL is not None:
+        pool = _POOL[0]
+        _POOL = None
+        pool.shutdown(wait=True, cancel_futures=True)
+
+atexit.register(cerrar_pool)
+
+def _ejecutar_en_pool(tareas, n_procesos, progreso=None, cancelar=None):
+    pool, _, cola, evento = _pool_sesion(n_procesos)
+
+    def vaciar_cola(informar=True):
+        while True:
+            try:
+                clave, pasos = cola.get_nowait()
+            except queue.Empty:
+                return
+            if informar and progreso is not None:
+                progreso(clave, pasos, False)
+
+    # Restos de una llamada anterior cancelada
+    evento.clear()
+    vaciar_cola(informar=False)
+
+    salidas = {}
+    pendientes = {
+        pool.submit(_tarea_worker, clave, func, kwargs, reporta_pasos): clave
+        for clave, (func, kwargs, reporta_pasos) in tareas.items()
+    }
+    try:
+        while pendientes:
+            hechos, _ = wait(list(pendientes), timeout=0.1, return_when=FIRST_COMPLETED)
+            vaciar_cola()
+            if cancelar is not None and cancelar.is_set():
+                raise CalculoCancelado()
+            for futuro in hechos:
+                clave = pendientes.pop(futuro)
+                salidas[clave] = futuro.result()
+                if progreso is not None:
+                    progreso(clave, None, True)
+    finally:
+        # Cancelación o error de una tarea: se detienen las demás antes de
+        # devolver el pool, para que no sigan ocupando workers
+        if pendientes:
+            evento.set()
+            for futuro in pendientes:
+                futuro.cancel()
+            wait(list(pendientes))
+
+    # Devolver en el orden de las tareas, igual que en serie
+    return {clave: salidas[clave] for clave in tareas}
+
+def _ejecutar_tareas(tareas, n_procesos=1, progreso=None, cancelar=None):
+    """
+    Ejecuta tareas independientes {clave: (funcion, kwargs, reporta_pasos)}
+    y retorna {clave: resultado}.
+
+    n_procesos = 1    -> en serie, en este proceso
+    n_procesos = None -> un proceso por núcleo (os.cpu_count())
+    n_procesos > 1    -> pool de procesos de la sesión con al menos ese
+                         número de workers (se reutiliza entre llamadas;
+                         ver cerrar_pool)
+
+    progreso : función opcional progreso(clave, pasos, terminada); las tareas
+               con reporta_pasos la reciben por cada paso convergido y todas
+               la llaman al terminar (pasos=None, terminada=True)
+    cancelar : objeto con is_set() (threading.Event); si se activa, el
+               cálculo se detiene en el siguiente paso con CalculoCancelado
+
+    Si el pool no puede crearse o se rompe (entornos sin multiprocessing,
+    ejecutables congelados sin freeze_support), se descarta y se repite en
+    serie; también se calcula en serie si otra llamada está usando el pool.
+    Las excepciones propias de las tareas se propagan igual que en serie.
+    """
+    if n_procesos is None:
+        n_procesos = os.cpu_count() or 1
+    n_procesos = min(int(n_procesos), len(tareas))
+
+    if n_procesos > 1 and _POOL_OCUPADO.acquire(blocking=False):
+        try:
+            return _ejecutar_en_pool(tareas, n_procesos, progreso, cancelar)
+        except (OSError, ImportError, NotImplementedError, BrokenProcessPool):
+            cerrar_pool()
+        finally:
+            _POOL_OCUPADO.release()
+
+    return _ejecutar_en_serie(tareas, progreso, cancelar)
+
 def calcular_resultados_seccion(
     datos_hormigon,
     datos_acero,
@@ -723,10 +1666,30 @@ def calcular_resultados_seccion(
     datos_fibras,
     tipo_seccion,
     eje,
+    metodo="brentq",
+    control="curvatura",
+    n_procesos=1,
+    progreso=None,
+    cancelar=None,
+    usar_cache=True,
+    diagnostico=False,
+    di_fibras=None,
 ):
+    """
+    Calcula las series M-φ de la sección y, para columnas, el diagrama de
+    interacción. Los análisis son independientes; con n_procesos distinto
+    de 1 se reparten en un pool de procesos y el tiempo total se acerca al
+    de la serie más lenta. progreso y cancelar: ver _ejecutar_tareas.
+    Con usar_cache, las series ya calculadas salen de cache_resultados.CACHE.
+    Con diagnostico, las series M-φ se recalculan instrumentadas y el
+    resultado incluye "diagnostico": {serie: dict de calcular_momento_curvatura}.
+    di_fibras: (modelo_cover, modelo_core) opcional; en columnas agrega el
+    diagrama de interacción por fibras con esos modelos, en "di_fibras_matriz"
+    y en di_series como "fibras_sin_phi" / "fibras_con_phi".
+    """
     tipo = tipo_seccion.strip().lower()
 
-    mc_series, mc_parametros = calcular_series_mc(
+    datos = dict(
         datos_hormigon=datos_hormigon,
         datos_acero=datos_acero,
         datos_seccion=datos_seccion,
@@ -734,6 +1697,72 @@ def calcular_resultados_seccion(
         tipo_seccion=tipo,
         eje=eje,
     )
+    tareas = {}
+    func_mc = _calcular_mc_con_diagnostico if diagnostico else calcular_momento_curvatura
+    for clave, modelo_cover, modelo_core in SERIES_MC.get(tipo, SERIES_MC["viga"]):
+        tareas[clave] = (func_mc, dict(
+            datos, modelo_cover=modelo_cover, modelo_core=modelo_core,
+            metodo=metodo, control=control,
+        ), True)
+    if tipo == "columna":
+        tareas["di"] = (calcular_series_di, dict(
+            datos_hormigon=datos_hormigon,
+            datos_acero=datos_acero,
+            datos_seccion=datos_seccion,
+            eje=eje,
+        ), False)
+        if di_fibras is not None:
+            tareas["di_fibras"] = (calcular_series_di, dict(
+                datos_hormigon=datos_hormigon,
+                datos_acero=datos_acero,
+                datos_seccion=datos_seccion,
+                eje=eje,
+                metodo="fibras",
+                datos_fibras=datos_fibras,
+                modelo_cover=di_fibras[0],
+                modelo_core=di_fibras[1],
+            ), False)
+
+    # La caché se consulta aquí, en el proceso principal: los workers del
+    # pool no comparten la memoria y cada uno partiría con la caché vacía.
+    claves_cache = {}
+    salidas = {}
+    for clave, (func, kwargs, _) in tareas.items():
+        if not usar_cache:
+            break
+        if func is calcular_series_di:
+            claves_cache[clave] = clave_di(**kwargs)
+        else:
+            claves_cache[clave] = clave_mc(**kwargs)
+        if func is _calcular_mc_con_diagnostico:
+            continue
+        guardado = CACHE.obtener(claves_cache[clave])
+        if guardado is not None:
+            salidas[clave] = guardado
+            if progreso is not None:
+                progreso(clave, None, True)
+    pendientes = {
+        clave: (func, dict(kwargs, usar_cache=False), reporta_pasos)
+        for clave, (func, kwargs, reporta_pasos) in tareas.items() if clave not in salidas
+    }
+
+    diagnosticos = {}
+    if pendientes:
+        calculadas = _ejecutar_tareas(pendientes, n_procesos, progreso=progreso, cancelar=cancelar)
+        for clave, salida in calculadas.items():
+            if pendientes[clave][0] is _calcular_mc_con_diagnostico:
+                salida, diagnosticos[clave] = salida
+                calculadas[clave] = salida
+            if usar_cache:
+                CACHE.guardar(claves_cache[clave], salida)
+        salidas.update(calculadas)
+
+    mc_series = {}
+    mc_parametros = {}
+    for clave, _, _ in SERIES_MC.get(tipo, SERIES_MC["viga"]):
+        phi, M, _, p = salidas[clave]
+        mc_series[clave] = (phi, M)
+        mc_parametros[clave] = p
 
     resultados = {
         "mc_matriz": None,
@@ -744,13 +1773,19 @@ def calcular_resultados_seccion(
     }
 
     if tipo == "columna":
-        di_matriz, di_series = calcular_series_di(
-            datos_hormigon=datos_hormigon,
-            datos_acero=datos_acero,
-            datos_seccion=datos_seccion,
-            eje=eje,
-        )
+        di_matriz, di_series = salidas["di"]
         resultados["di_matriz"] = di_matriz
         resultados["di_series"] = di_series
+        if "di_fibras" in salidas:
+            di_matriz, di_series = salidas["di_fibras"]
+            resultados["di_fibras_matriz"] = di_matriz
+            resultados["di_series"] = dict(
+                resultados["di_series"],
+                fibras_sin_phi=di_series["sin_phi"],
+                fibras_con_phi=di_series["con_phi"],
+            )
+
+    if diagnostico:
+        resultados["diagnostico"] = diagnosticos
 
-    return resultados
\ No newline at end of file
+    return resultados
@@ -0,0 +1,108 @@
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+                               QHeaderView, QPushButton)
+
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+import numpy as np
+
+from mostrar_mc_dialog import CustomToolbar
+
+
+class VentanaFamiliaAxial(QDialog):
+    """
+    Familia de curvas M-φ de calcular_familia_axial: una curva por nivel de
+    carga axial y la tabla de parámetros característicos por nivel.
+    """
+
+    FILAS = [
+        ("P (T)", None),
+        ("Ki (T-m/(1/m))", "rigidez_inicial"),
+        ("φy (1/m)", ("punto_fluencia", "phi")),
+        ("My (T-m)", ("punto_fluencia", "M")),
+        ("φmax (1/m)", ("punto_maximo", "phi")),
+        ("Mmax (T-m)", ("punto_maximo", "M")),
+        ("φf (1/m)", ("punto_falla", "phi")),
+        ("Mf (T-m)", ("punto_falla", "M")),
+        ("μφ (-)", "ductilidad_curvatura"),
+    ]
+
+    def __init__(self, familia: dict, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Familia M-φ por carga axial")
+        self.resize(1100, 700)
+        self._familia = familia
+
+        layout = QVBoxLayout(self)
+
+        self.figure = Figure()
+        self.canvas = FigureCanvas(self.figure)
+        self.toolbar = CustomToolbar(self.canvas, self)
+        self.toolbar.setMaximumHeight(28)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas, stretch=3)
+
+        layout.addWidget(QLabel("Parámetros característicos por nivel (P con tracción positiva)"))
+        layout.addWidget(self._tabla_parametros(), stretch=2)
+
+        botones = QHBoxLayout()
+        botones.addStretch()
+        btn_cerrar = QPushButton("Cerrar")
+        btn_cerrar.clicked.connect(self.accept)
+        botones.addWidget(btn_cerrar)
+        layout.addLayout(botones)
+
+        self.dibujar()
+
+    def dibujar(self):
+        import matplotlib
+        import matplotlib.ticker as mticker
+
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        ax.axhline(0, color='gray', linewidth=1.2, linestyle='-', alpha=0.8)
+        ax.axvline(0, color='gray', linewidth=1.2, linestyle='-', alpha=0.8)
+        ax.set_xlabel("Curvatura, θ (1/m)", fontsize=10)
+        ax.set_ylabel("Momento, M (T-m)", fontsize=10)
+        ax.grid(True, linestyle='--', alpha=0.6)
+        ax.tick_params(axis='both', labelsize=8)
+
+        x_formatter = mticker.ScalarFormatter(useMathText=True)
+        x_formatter.set_scientific(True)
+        ax.xaxis.set_major_formatter(x_formatter)
+        ax.xaxis.get_offset_text().set_fontsize(8)
+
+        niveles = self._familia["niveles"]
+        mapa = matplotlib.colormaps["viridis"]
+        for i, (P, (phi, M, _)) in enumerate(zip(niveles, self._familia["curvas"])):
+            color = mapa(i / max(len(niveles) - 1, 1))
+            ax.plot(phi, M, color=color, linewidth=1.4, label=f"P = {P / 1e3:.1f} T")
+
+        ax.legend(fontsize=7, ncol=2, loc="best")
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+    def _tabla_parametros(self):
+        niveles = self._familia["niveles"]
+        parametros = self._familia["parametros"]
+
+        tabla = QTableWidget(self)
+        tabla.setRowCount(len(niveles))
+        tabla.setColumnCount(len(self.FILAS))
+        tabla.setHorizontalHeaderLabels([titulo for titulo, _ in self.FILAS])
+
+        for i, (P, datos) in enumerate(zip(niveles, parametros)):
+            for j, (_, clave) in enumerate(self.FILAS):
+                if clave is None:
+                    valor = P / 1e3
+                elif isinstance(clave, tuple):
+                    valor = (datos.get(clave[0]) or {}).get(clave[1])
+                else:
+                    valor = datos.get(clave)
+
+                txt = "-" if valor is None or not np.isfinite(valor) else f"{float(valor):.6g}"
+                tabla.setItem(i, j, QTableWidgetItem(txt))
+
+        tabla.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        tabla.verticalHeader().setVisible(False)
+        tabla.setEditTriggers(QTableWidget.NoEditTriggers)
+        return tabla
@@ -9,8 +9,12 @@ from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
 from matplotlib.figure import Figure
 import numpy as np
 
+from PySide6.QtCore import QRect, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QPushButton)
 
+# Trabajadores en curso: deben seguir referenciados hasta terminar aunque se cierre la ventana
+_TRABAJADORES_VIVOS = set()
+
 class CustomToolbar(NavigationToolbar2QT):
     # Igual que tu ejemplo: Home, Back, Forward, Pan, Zoom, Save
     toolitems = [
@@ -80,16 +84,33 @@ class VentanaMostrarParametrosMC(QDialog):
         layout.addWidget(btn_cerrar)
 
 class VentanaMostrarMC(QDialog):
-
-    def __init__(self, seccion_columna_data: dict, seccion_viga_data: dict, mc_series: dict, mc_parametros: dict, tipo_seccion, parent=None):
+    """
+    Curvas M-φ de la sección. Con calculo (argumentos de
+    TrabajadorCurvasMC) la ventana calcula las series en segundo plano y
+    las dibuja a medida que convergen los pasos: los puntos se agregan a
+    las líneas existentes y el lienzo se redibuja como máximo cada
+    REDIBUJO_MS. "Detener" corta el cálculo y deja lo ya dibujado.
+
+    Cada curva completa sale por curva_calculada(clave, (φ, M), parámetros)
+    para que la ventana principal la guarde; las curvas cortadas quedan
+    solo en esta ventana (la ventana trabaja sobre copias de mc_series y
+    mc_parametros).
+    """
+
+    REDIBUJO_MS = 50
+    curva_calculada = Signal(str, object, object)
+
+    def __init__(self, seccion_columna_data: dict, seccion_viga_data: dict, mc_series: dict, mc_parametros: dict, tipo_seccion, parent=None, calculo=None):
         super().__init__(parent)
         self.ui = Ui_mostrar_MC()
         self.ui.setupUi(self)
 
         # Datos
-        self._series = mc_series or {}
-        self._parametros = mc_parametros or {}
+        self._series = dict(mc_series or {})
+        self._parametros = dict(mc_parametros or {})
         self._tipo_seccion = (tipo_seccion or "").strip().lower()
+        self._lineas = {}
+        self._trabajador = None
 
         # --------- Dibuja la sección ----------
         if self._tipo_seccion == "columna":
@@ -160,9 +181,21 @@ class VentanaMostrarMC(QDialog):
         self.x_total = []
         self.y_total = []
 
+        # Cálculo en vivo: redibujos agrupados por el temporizador
+        self._pendiente = None  # None, "lineas" o "todo"
+        self._temporizador = QTimer(self)
+        self._temporizador.setInterval(self.REDIBUJO_MS)
+        self._temporizador.timeout.connect(self._redibujar)
+        self.btn_detener = QPushButton("Detener cálculo", self)
+        self.btn_detener.setGeometry(QRect(10, 545, 281, 24))
+        self.btn_detener.clicked.connect(self.detener_calculo)
+        self.btn_detener.hide()
+
         # Primer dibujo y hover
         self.actualizar_grafica()
         self.canvas.mpl_connect("motion_notify_event", self.on_mouse_move)
+        if calculo is not None:
+            self._iniciar_calculo(calculo)
 
         self.ui.btn_mostrar_tablaMC.clicked.connect(self.mostrar_tabla)
         self.ui.btn_mostrar_parmetros.clicked.connect(self.mostrar_parametros)
@@ -253,9 +286,7 @@ class VentanaMostrarMC(QDialog):
         ax.xaxis.get_offset_text().set_fontsize(8)
         ax.yaxis.get_offset_text().set_fontsize(8)
 
-        # Limpia acumuladores para hover
-        self.x_total = []
-        self.y_total = []
+        self._lineas = {}
 
         # Modelos según tipo de sección
         if self._tipo_seccion == "viga":
@@ -281,12 +312,10 @@ class VentanaMostrarMC(QDialog):
                 x = np.asarray(thetas, dtype=float)
                 y = np.asarray(M, dtype=float)
 
-                ax.plot(x, y, label=self._etiqueta(clave), color=color)
+                self._lineas[clave], = ax.plot(x, y, label=self._etiqueta(clave), color=color)
                 algo_dibujado = True
 
-                self.x_total.extend(x.tolist())
-                self.y_total.extend(y.tolist())
-
+        self._acumular_hover()
         if algo_dibujado:
             ax.legend(fontsize=9, loc="best", frameon=True)
 
@@ -298,6 +327,94 @@ class VentanaMostrarMC(QDialog):
         self.ax = ax
         self.canvas.draw_idle()
 
+    def _acumular_hover(self):
+        # Puntos de las curvas dibujadas, para el marcador del mouse
+        self.x_total = []
+        self.y_total = []
+        for clave in self._lineas:
+            thetas, M = self._series[clave]
+            self.x_total.extend(np.asarray(thetas, dtype=float).tolist())
+            self.y_total.extend(np.asarray(M, dtype=float).tolist())
+
+    # ---------- cálculo en vivo ----------
+
+    def _iniciar_calculo(self, calculo):
+        from calculo_segundo_plano import TrabajadorCurvasMC
+
+        trabajador = TrabajadorCurvasMC(**calculo)
+        senales = trabajador.senales
+        senales.puntos.connect(self._agregar_puntos)
+        senales.curva_terminada.connect(self._curva_terminada)
+        senales.terminado.connect(self._calculo_terminado)
+        senales.error.connect(self._calculo_error)
+        for senal in (senales.terminado, senales.error):
+            senal.connect(lambda *_, t=trabajador: _TRABAJADORES_VIVOS.discard(t))
+
+        self._trabajador = trabajador
+        _TRABAJADORES_VIVOS.add(trabajador)
+        self.btn_detener.show()
+        self.lbl_coordenadas.setText("Calculando curvas M-φ...")
+        self._temporizador.start()
+        QThreadPool.globalInstance().start(trabajador)
+
+    def _agregar_puntos(self, clave, phi, M):
+        if clave in self._series:
+            thetas, momentos = self._series[clave]
+            self._series[clave] = (np.concatenate([thetas, phi]), np.concatenate([momentos, M]))
+        else:
+            self._series[clave] = (phi, M)
+
+        checks, _ = self._checks_y_etiquetas()
+        linea = self._lineas.get(clave)
+        if linea is not None:
+            linea.set_data(*self._series[clave])
+            self._pendiente = self._pendiente or "lineas"
+        elif clave in checks and checks[clave].isChecked():
+            # Serie nueva visible: hay que rehacer la leyenda
+            self._pendiente = "todo"
+
+    def _redibujar(self):
+        if self._pendiente == "todo":
+            self.actualizar_grafica()
+        elif self._pendiente == "lineas":
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self._acumular_hover()
+            self.canvas.draw_idle()
+        self._pendiente = None
+
+    def _curva_terminada(self, clave, serie, parametros):
+        self._series[clave] = serie
+        self._parametros[clave] = parametros
+        self.curva_calculada.emit(clave, serie, parametros)
+        self.lbl_coordenadas.setText(f"{self._etiqueta(clave)}: curva completa.")
+
+    def _fin_calculo(self, texto):
+        self._trabajador = None
+        self._temporizador.stop()
+        self._redibujar()
+        self.btn_detener.hide()
+        self.lbl_coordenadas.setText(texto)
+
+    def _calculo_terminado(self, detenido):
+        if detenido:
+            self._fin_calculo("Cálculo detenido: se muestran los puntos ya calculados.")
+        else:
+            self._fin_calculo("Desplaza el mouse sobre la curva para ver coordenadas.")
+
+    def _calculo_error(self, mensaje):
+        self._fin_calculo(f"Error de cálculo: {mensaje}")
+
+    def detener_calculo(self):
+        if self._trabajador is not None:
+            self._trabajador.detener()
+
+    def done(self, resultado):
+        # Al cerrar la ventana no tiene sentido seguir calculando
+        self.detener_calculo()
+        self._temporizador.stop()
+        super().done(resultado)
+
     def on_mouse_move(self, event):
         # Limpiar si el mouse no está sobre el eje o no hay datos
         if not getattr(event, "inaxes", False) or not self.x_total:
@@ -8,6 +8,8 @@ class utilidades:
         - barras_columna: coordenadas y áreas de barras en columnas
         - barras_viga: coordenadas y áreas de barras en vigas
         - malla: discretización de la sección en fibras
+        - barras_columna_2d: barras de columna con sus dos coordenadas
+        - malla_2d: fibras 2D sin agrupar en capas (flexión biaxial)
     """
 
     @staticmethod
@@ -122,10 +124,10 @@ class utilidades:
 
 
     @staticmethod
-    def malla(b, h, r, de, nf_x, nf_y, eje):
+    def malla(b, h, r, de, nf_x, nf_y, eje, franjas=False):
         """
         Discretiza la sección rectangular en fibras 2D de recubrimiento y núcleo
-        y agrupa áreas por coordenada del eje de análisis.
+        y agrupa áreas por capa (fila o columna de celdas) del eje de análisis.
 
         Parámetros:
             b   : ancho de la sección
@@ -135,10 +137,13 @@ class utilidades:
             nf_x  : número de divisiones base en x
             nf_y  : número de divisiones base en y
             eje : eje de análisis ("x" o "y")
+            franjas : si es True, agrega el espesor t_i de cada capa en la
+                      dirección de análisis (cada capa es una franja
+                      rectangular de ancho A_i / t_i)
 
         Retorna:
-            cover : arreglo [coord_i, A_i] de fibras del recubrimiento
-            core  : arreglo [coord_i, A_i] de fibras del núcleo
+            cover : arreglo [coord_i, A_i] (o [coord_i, A_i, t_i]) de fibras del recubrimiento
+            core  : arreglo [coord_i, A_i] (o [coord_i, A_i, t_i]) de fibras del núcleo
         """
         
         eje = eje.lower()
@@ -161,34 +166,123 @@ class utilidades:
         if add_y:
             y_edges = np.unique(np.concatenate((y_edges, np.array(add_y))))
 
-        cover_dict = {}
-        core_dict = {}
+        # Celdas (i en x, j en y) por broadcasting; el orden de aplanado
+        # (i exterior, j interior) es el del recorrido celda a celda, así que
+        # bincount suma las áreas de cada capa en el mismo orden.
+        dx = np.diff(x_edges)
+        dy = np.diff(y_edges)
+        area = dx[:, None] * dy[None, :]
+
+        core_x = (x_edges[:-1] >= rec) & (x_edges[1:] <= b - rec)
+        core_y = (y_edges[:-1] >= rec) & (y_edges[1:] <= h - rec)
+        es_core = core_x[:, None] & core_y[None, :]
+
+        # Capa de cada celda: índice de fila (eje x) o de columna (eje y)
+        if eje == "x":
+            coord = h / 2 - 0.5 * (y_edges[:-1] + y_edges[1:])
+            espesor = dy
+            capa = np.broadcast_to(np.arange(len(dy))[None, :], area.shape)
+        else:
+            coord = 0.5 * (x_edges[:-1] + x_edges[1:]) - b / 2
+            espesor = dx
+            capa = np.broadcast_to(np.arange(len(dx))[:, None], area.shape)
+
+        orden = np.argsort(coord)[::-1]
+
+        def agrupar(mascara):
+            idx = capa[mascara]
+            A = np.bincount(idx, weights=area[mascara], minlength=len(coord))
+            usadas = np.bincount(idx, minlength=len(coord))[orden] > 0
+            if not usadas.any():
+                return np.array([], dtype=float)
+            columnas = [coord[orden][usadas], A[orden][usadas]]
+            if franjas:
+                columnas.append(espesor[orden][usadas])
+            return np.column_stack(columnas)
+
+        cover = agrupar(~es_core)
+        core = agrupar(es_core)
+
+        return cover, core
 
-        for i in range(len(x_edges) - 1):
-            x1 = x_edges[i]
-            x2 = x_edges[i + 1]
-            xc = 0.5 * (x1 + x2)
-            dx = x2 - x1
+    @staticmethod
+    def barras_columna_2d(b, h, r, de, nb_x, nb_y, d_corner, d_edge):
+        """
+        Barras de acero de una columna con su posición en el plano, para
+        flexión biaxial. Es la misma distribución que barras_columna:
+        cuatro barras de esquina, nb_x - 2 barras en cada cara superior e
+        inferior y nb_y - 2 en cada cara lateral.
+
+        Parámetros:
+            b, h, r, de, nb_x, nb_y, d_corner, d_edge : como en barras_columna
+
+        Retorna:
+            As : arreglo de tres columnas [x_i, y_i, A_i] (una fila por barra)
+                 x_i = coordenada horizontal desde el centro (la de eje "y")
+                 y_i = coordenada vertical desde el centro (la de eje "x")
+        """
+        Ab_corner = np.pi * d_corner**2 / 4
+        Ab_edge = np.pi * d_edge**2 / 4
+
+        c_corner = r + de + d_corner / 2
+        c_edge = r + de + d_edge / 2
 
-            for j in range(len(y_edges) - 1):
-                y1 = y_edges[j]
-                y2 = y_edges[j + 1]
-                yc = 0.5 * (y1 + y2)
-                dy = y2 - y1
+        x_c = b / 2 - c_corner
+        y_c = h / 2 - c_corner
 
-                area = dx * dy
+        # Barras intermedias repartidas entre las esquinas
+        x_cara = b / 2 - np.linspace(c_corner, b - c_corner, nb_x)[1:-1]
+        y_lado = h / 2 - np.linspace(c_corner, h - c_corner, nb_y)[1:-1]
+
+        x = np.concatenate((
+            [x_c, -x_c, x_c, -x_c],
+            x_cara, x_cara,
+            np.full(len(y_lado), b / 2 - c_edge), np.full(len(y_lado), -(b / 2 - c_edge)),
+        ))
+        y = np.concatenate((
+            [y_c, y_c, -y_c, -y_c],
+            np.full(len(x_cara), h / 2 - c_edge), np.full(len(x_cara), -(h / 2 - c_edge)),
+            y_lado, y_lado,
+        ))
+        A = np.concatenate((np.full(4, Ab_corner), np.full(len(x) - 4, Ab_edge)))
+
+        return np.column_stack((x, y, A))
+
+    @staticmethod
+    def malla_2d(b, h, r, de, nf_x, nf_y):
+        """
+        Discretiza la sección rectangular en fibras 2D de recubrimiento y
+        núcleo, sin agruparlas en capas (misma cuadrícula que malla).
+
+        Parámetros:
+            b, h, r, de, nf_x, nf_y : como en malla
+
+        Retorna:
+            cover : arreglo [x_i, y_i, A_i] de fibras del recubrimiento
+            core  : arreglo [x_i, y_i, A_i] de fibras del núcleo
+                    (x_i, y_i desde el centro, con los mismos signos que
+                    las coordenadas de malla con eje "y" y eje "x")
+        """
+        rec = r + de / 2
+
+        x_edges = np.linspace(0.0, b, nf_x + 1)
+        y_edges = np.linspace(0.0, h, nf_y + 1)
+        if 0.0 < rec < b:
+            x_edges = np.unique(np.concatenate((x_edges, [rec, b - rec])))
+        if 0.0 < rec < h:
+            y_edges = np.unique(np.concatenate((y_edges, [rec, h - rec])))
 
-                if eje == "x":
-                    coord_i = h / 2 - yc
-                else:
-                    coord_i = xc - b / 2
+        x = 0.5 * (x_edges[:-1] + x_edges[1:]) - b / 2
+        y = h / 2 - 0.5 * (y_edges[:-1] + y_edges[1:])
+        area = np.diff(x_edges)[:, None] * np.diff(y_edges)[None, :]
 
-                es_core = (x1 >= rec) and (x2 <= b - rec) and (y1 >= rec) and (y2 <= h - rec)
+        core_x = (x_edges[:-1] >= rec) & (x_edges[1:] <= b - rec)
+        core_y = (y_edges[:-1] >= rec) & (y_edges[1:] <= h - rec)
+        es_core = core_x[:, None] & core_y[None, :]
 
-                dic = core_dict if es_core else cover_dict
-                dic[coord_i] = dic.get(coord_i, 0.0) + area
+        X, Y = np.meshgrid(x, y, indexing="ij")
 
-        cover = np.array(sorted(cover_dict.items(), reverse=True), dtype=float)
-        core = np.array(sorted(core_dict.items(), reverse=True), dtype=float)
+        def fibras(mascara):
+            return np.column_stack((X[mascara], Y[mascara], area[mascara]))
 
-        return cover, core
\ No newline at end of file
+        return fibras(~es_core), fibras(es_core)
@@ -1,9 +1,9 @@
 
 import sys
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Usar backend no interactivo para evitar advertencias de memoria
-import matplotlib.pyplot as plt
+# Figure directa (sin pyplot): no pasa por el gestor de figuras de pyplot,
+# así que no hace falta fijar el backend al importar ni cerrar con plt.close
+from matplotlib.figure import Figure
 import matplotlib.patches as patches
 from matplotlib.path import Path
 from matplotlib.collections import LineCollection, PatchCollection
@@ -29,7 +29,8 @@ class dibujar_seccion_columna(QWidget):
     def __init__(self, b, h, r, dest, n_x, n_y, d_corner, d_edge, *args, show_highlight=True, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.figure, self.ax = plt.subplots()
+        self.figure = Figure()
+        self.ax = self.figure.add_subplot()
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = CustomToolbar(self.canvas, self)
         self.toolbar.setMaximumHeight(28)
@@ -226,10 +227,10 @@ class dibujar_seccion_columna(QWidget):
 
     def closeEvent(self, event):
         """Cerrar la figura al destruir el widget para liberar memoria."""
-        plt.close(self.figure)
+        self.figure.clear()
         super().closeEvent(event)
 
     def close(self):
         """Cerrar la figura explícitamente."""
-        plt.close(self.figure)
+        self.figure.clear()
         super().close()
\ No newline at end of file
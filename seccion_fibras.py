@@ -1,8 +1,6 @@
 import sys
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Usar backend no interactivo para evitar advertencias de memoria
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import matplotlib.patches as patches
 from matplotlib.path import Path
 from matplotlib.collections import LineCollection
@@ -26,7 +24,8 @@ class dibujar_fibras(QWidget):
     def __init__(self, b, h, r, dest, n_x, n_y, direccion, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.figure, self.ax = plt.subplots()
+        self.figure = Figure()
+        self.ax = self.figure.add_subplot()
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = CustomToolbar(self.canvas, self)
         self.toolbar.setMaximumHeight(28)
@@ -242,10 +241,10 @@ class dibujar_fibras(QWidget):
 
     def closeEvent(self, event):
         """Cerrar la figura al destruir el widget para liberar memoria."""
-        plt.close(self.figure)
+        self.figure.clear()
         super().closeEvent(event)
 
     def close(self):
         """Cerrar la figura explícitamente."""
-        plt.close(self.figure)
+        self.figure.clear()
         super().close()
\ No newline at end of file
@@ -106,10 +106,13 @@ class SeccionVigaController(QObject):  # <--- Ahora hereda de QObject
         if not self.validar_campos():
             return
         datos = self.obtener_datos()
+        # El cálculo corre en segundo plano; al terminar se llama a calculo_terminado
+        if self.datos_guardados_callback:
+            self.datos_guardados_callback(datos)
+
+    def calculo_terminado(self):
         QMessageBox.information(
                     self.ui.pg_viga,
                     "Cálculo terminado",
                     "Puede continuar"
                 )
-        if self.datos_guardados_callback:
-            self.datos_guardados_callback(datos)
@@ -1,7 +1,5 @@
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Usar backend no interactivo para evitar advertencias de memoria
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.collections import PatchCollection
 import matplotlib.patches as patches
 from matplotlib.path import Path
@@ -29,7 +27,8 @@ class dibujar_seccion_viga(QWidget):
     def __init__(self, b, h, r, dest, n_sup, n_inf, d_sup, d_inf, *args, show_highlight=True, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.figure, self.ax = plt.subplots()
+        self.figure = Figure()
+        self.ax = self.figure.add_subplot()
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = CustomToolbar(self.canvas, self)
         self.toolbar.setMaximumHeight(28)
@@ -228,10 +227,10 @@ class dibujar_seccion_viga(QWidget):
 
     def closeEvent(self, event):
         """Cerrar la figura al destruir el widget para liberar memoria."""
-        plt.close(self.figure)
+        self.figure.clear()
         super().closeEvent(event)
 
     def close(self):
         """Cerrar la figura explícitamente."""
-        plt.close(self.figure)
+        self.figure.clear()
         super().close()
\ No newline at end of file